@@ -0,0 +1,58 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Alignment benchmark of the aligned panel, which compares the time needed to align the historical data of 1000
+financial products traded on different calendars by concatenating their :obj:`pandas.DataFrame` (as returned by
+:func:`investpy.get_historical_data_bulk`, with a `Currency` value per row) and pivoting it into a wide close values
+:obj:`pandas.DataFrame`, against the time needed to align their columns with
+:func:`investpy.utils.panel.align_columns`. Run it as::
+
+    $ python benchmarks/bench_aligned.py
+
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from investpy.utils.data import epoch_to_dates
+from investpy.utils.panel import align_columns
+
+
+INSTRUMENTS = 1000
+
+DAYS = 1000
+
+REPEAT = 5
+
+# every financial product misses some random days of the calendar, e.g. its local holidays
+DAYS_PER_INSTRUMENT = [np.sort(np.random.choice(np.arange(18262, 18262 + DAYS), DAYS - 20, replace=False))
+                       for _ in range(INSTRUMENTS)]
+
+COLUMNS = [{'date': days, 'open': np.random.rand(len(days)), 'high': np.random.rand(len(days)),
+            'low': np.random.rand(len(days)), 'close': np.random.rand(len(days)),
+            'volume': np.ones(len(days), dtype=np.int64)} for days in DAYS_PER_INSTRUMENT]
+
+FRAMES = {str(id_): pd.DataFrame({'Open': columns['open'], 'High': columns['high'], 'Low': columns['low'],
+                                  'Close': columns['close'], 'Volume': columns['volume'], 'Currency': 'EUR'},
+                                 index=epoch_to_dates(columns['date'], unit='D')) for id_, columns in enumerate(COLUMNS)}
+
+
+def bench_frames():
+    data = pd.concat([df.assign(Name=id_) for id_, df in FRAMES.items()])
+    data.reset_index().pivot(index='Date', columns='Name', values='Close').ffill()
+
+
+def bench_aligned():
+    align_columns(COLUMNS, fill='close')
+
+
+if __name__ == '__main__':
+    frames = min(timeit.repeat(bench_frames, number=1, repeat=REPEAT))
+    aligned = min(timeit.repeat(bench_aligned, number=1, repeat=REPEAT))
+
+    print("frames:  %8.2f ms" % (frames * 1000))
+    print("aligned: %8.2f ms" % (aligned * 1000))
+    print("speedup: %.1fx" % (frames / aligned))
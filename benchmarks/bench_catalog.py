@@ -0,0 +1,43 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Startup benchmark of the static data files, which compares the time needed to load `resources/stocks.csv` by parsing
+the CSV file against the time needed to memory-map its compiled binary catalog. Run it as::
+
+    $ python benchmarks/bench_catalog.py
+
+"""
+
+import timeit
+
+import pandas as pd
+import pkg_resources
+
+from investpy.utils.catalog_binary import compiled_path, read_compiled_catalog
+
+
+RESOURCE_PATH = 'resources/stocks.csv'
+
+REPEAT = 20
+
+
+def bench_csv():
+    pd.read_csv(pkg_resources.resource_filename('investpy', RESOURCE_PATH), keep_default_na=False)
+
+
+def bench_binary():
+    read_compiled_catalog(RESOURCE_PATH, keep_default_na=False)
+
+
+if __name__ == '__main__':
+    if read_compiled_catalog(RESOURCE_PATH) is None:
+        raise SystemExit(compiled_path(RESOURCE_PATH) + " is missing or outdated, "
+                         "run investpy.utils.catalog_binary.compile_catalogs() first.")
+
+    csv = min(timeit.repeat(bench_csv, number=1, repeat=REPEAT))
+    binary = min(timeit.repeat(bench_binary, number=1, repeat=REPEAT))
+
+    print("csv:    %8.2f ms" % (csv * 1000))
+    print("binary: %8.2f ms" % (binary * 1000))
+    print("speedup: %.1fx" % (csv / binary))
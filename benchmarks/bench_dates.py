@@ -0,0 +1,51 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Date conversion benchmark of the historical data, which compares the time needed to convert the epoch values of a
+10k rows response into dates one by one, going through a string, against the time needed to convert them at once with
+:func:`investpy.utils.data.epoch_to_dates`. Run it as::
+
+    $ python benchmarks/bench_dates.py
+
+"""
+
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from investpy.utils.data import epoch_to_dates
+
+
+ROWS = 10000
+
+REPEAT = 10
+
+EPOCH = 1577836800 - np.arange(ROWS, dtype=np.int64) * 24 * 60 * 60
+
+
+def bench_rows():
+    pd.DatetimeIndex([datetime.strptime(str(datetime.fromtimestamp(value, tz=pytz.utc).date()), '%Y-%m-%d')
+                      for value in EPOCH.tolist()], name='Date')
+
+
+def bench_vectorized():
+    epoch_to_dates(EPOCH)
+
+
+def bench_vectorized_tz():
+    epoch_to_dates(EPOCH, tz='Europe/Madrid')
+
+
+if __name__ == '__main__':
+    rows = min(timeit.repeat(bench_rows, number=1, repeat=REPEAT))
+    vectorized = min(timeit.repeat(bench_vectorized, number=1, repeat=REPEAT))
+    vectorized_tz = min(timeit.repeat(bench_vectorized_tz, number=1, repeat=REPEAT))
+
+    print("rows:          %8.2f ms" % (rows * 1000))
+    print("vectorized:    %8.2f ms" % (vectorized * 1000))
+    print("vectorized tz: %8.2f ms" % (vectorized_tz * 1000))
+    print("speedup: %.1fx" % (rows / vectorized))
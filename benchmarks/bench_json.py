@@ -0,0 +1,73 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+JSON output benchmark of the historical data, which compares the time needed to build a :obj:`dict` per row of a
+10k rows historical data and dump them with :func:`json.dumps` against the time needed to write the document from the
+columns with :meth:`investpy.utils.data.HistoricalData.to_json`, with each of the available serializers. Run it as::
+
+    $ python benchmarks/bench_json.py
+
+"""
+
+import json
+import timeit
+
+import numpy as np
+
+from investpy.utils.data import HistoricalData, epoch_to_dates
+from investpy.utils.serializer import configure_json, orjson
+
+
+ROWS = 10000
+
+REPEAT = 10
+
+DATA = HistoricalData(volume=True, currency='EUR')
+DATA.append({
+    'date': 1577836800 - np.arange(ROWS, dtype=np.int64) * 24 * 60 * 60,
+    'open': np.random.uniform(90, 110, ROWS),
+    'high': np.random.uniform(110, 120, ROWS),
+    'low': np.random.uniform(80, 90, ROWS),
+    'close': np.random.uniform(90, 110, ROWS),
+    'volume': np.random.randint(0, 1000000, ROWS),
+})
+
+COLUMNS = DATA.columns()
+
+
+def bench_rows():
+    dates = epoch_to_dates(COLUMNS['date'], unit='D').strftime('%d/%m/%Y').tolist()
+
+    json.dumps({
+        'name': 'bbva',
+        'historical': [{'date': date, 'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume,
+                        'currency': 'EUR'}
+                       for date, open_, high, low, close, volume in zip(dates, COLUMNS['open'].tolist(),
+                                                                        COLUMNS['high'].tolist(),
+                                                                        COLUMNS['low'].tolist(),
+                                                                        COLUMNS['close'].tolist(),
+                                                                        COLUMNS['volume'].tolist())]
+    })
+
+
+def bench_columns():
+    DATA.to_json('bbva', columns=COLUMNS)
+
+
+if __name__ == '__main__':
+    rows = min(timeit.repeat(bench_rows, number=1, repeat=REPEAT))
+
+    print("rows:           %8.2f ms" % (rows * 1000))
+
+    for backend in ['json', 'orjson']:
+        if backend == 'orjson' and orjson is None:
+            continue
+
+        for raw in [False, True]:
+            configure_json(backend=backend, raw=raw)
+
+            columns = min(timeit.repeat(bench_columns, number=1, repeat=REPEAT))
+
+            print("%-15s %8.2f ms (speedup: %.1fx)" % (backend + (' raw:' if raw else ':'), columns * 1000,
+                                                        rows / columns))
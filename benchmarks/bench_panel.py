@@ -0,0 +1,67 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Loading benchmark of the price panel, which compares the time needed to build the close values panel of 5000 stocks
+by aligning their historical data :obj:`pandas.DataFrame` (as returned by :func:`investpy.get_historical_data_bulk`)
+against the time needed to open a :class:`investpy.utils.panel.PricePanel` with the same data and to get its close
+values, along with the time needed to append a new trading day to it. Run it as::
+
+    $ python benchmarks/bench_panel.py
+
+"""
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from investpy.utils.data import epoch_to_dates
+from investpy.utils.panel import PricePanel
+
+
+INSTRUMENTS = 5000
+
+DAYS = 1000
+
+REPEAT = 5
+
+DATES = epoch_to_dates(np.arange(18262, 18262 + DAYS))
+
+FRAMES = {str(id_): pd.DataFrame({'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': np.random.rand(DAYS), 'Volume': 1},
+                                 index=DATES) for id_ in range(INSTRUMENTS)}
+
+
+def bench_frames():
+    pd.DataFrame({id_: df['Close'] for id_, df in FRAMES.items()})
+
+
+def bench_panel(path):
+    PricePanel(path).frame('close')
+
+
+def bench_append(panel, day):
+    panel.update({'0': {'date': np.array([day]), 'open': np.ones(1), 'high': np.ones(1), 'low': np.ones(1),
+                        'close': np.ones(1)}})
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'closes.panel')
+
+        panel = PricePanel(path, ids=list(FRAMES.keys()))
+        panel.update({id_: {'date': np.arange(18262, 18262 + DAYS), 'close': df['Close'].to_numpy()}
+                      for id_, df in FRAMES.items()})
+
+        frames = min(timeit.repeat(bench_frames, number=1, repeat=REPEAT))
+        mapped = min(timeit.repeat(lambda: bench_panel(path), number=1, repeat=REPEAT))
+
+        days = iter(range(18262 + DAYS, 18262 + DAYS + REPEAT))
+        append = min(timeit.repeat(lambda: bench_append(panel, next(days)), number=1, repeat=REPEAT))
+
+    print("frames: %8.2f ms" % (frames * 1000))
+    print("panel:  %8.2f ms" % (mapped * 1000))
+    print("append: %8.2f ms" % (append * 1000))
+    print("speedup: %.1fx" % (frames / mapped))
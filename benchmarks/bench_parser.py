@@ -0,0 +1,78 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Parsing benchmark of the responses of the `HistoricalDataAjax` endpoint, which compares the time needed to parse the
+historical data table row by row from the HTML tree against the time needed to parse it with
+:func:`investpy.utils.parser.parse_historical_data`. The response is either a recorded one (e.g. by a
+:class:`investpy.utils.transport.RecordingTransport`), whose path is passed as argument, or a synthetic one with
+daily rows. Run it as::
+
+    $ python benchmarks/bench_parser.py [response.html]
+
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from lxml.html import fromstring
+
+from investpy.utils.parser import parse_historical_data
+
+
+ROWS = 5000
+
+REPEAT = 10
+
+
+def synthetic_response(rows=ROWS):
+    date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    body = list()
+
+    for row in range(rows):
+        values = [int((date - timedelta(days=row)).timestamp()), '1,234.5', '1,230.25', '1,240.75', '1,229.0',
+                  str(100000 + row)]
+
+        body.append('<tr>' + ''.join('<td data-real-value="' + str(value) + '">' + str(value) + '</td>'
+                                     for value in values) + '</tr>')
+
+    return '<div><table id="curr_table" class="genTbl closedTbl historicalTbl"><thead></thead><tbody>' + \
+           ''.join(body) + '</tbody></table></div>'
+
+
+def bench_rows(text):
+    for elements_ in fromstring(text).xpath(".//table[@id='curr_table']/tbody/tr"):
+        info = []
+
+        for nested_ in elements_.xpath(".//td"):
+            info.append(nested_.get('data-real-value'))
+
+        datetime.fromtimestamp(int(info[0]), tz=timezone.utc)
+
+        float(info[1].replace(',', ''))
+        float(info[2].replace(',', ''))
+        float(info[3].replace(',', ''))
+        float(info[4].replace(',', ''))
+
+        int(info[5])
+
+
+def bench_parser(text):
+    parse_historical_data(text, volume=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = synthetic_response()
+
+    rows = min(timeit.repeat(lambda: bench_rows(text), number=1, repeat=REPEAT))
+    parser = min(timeit.repeat(lambda: bench_parser(text), number=1, repeat=REPEAT))
+
+    print("rows:   %8.2f ms" % (rows * 1000))
+    print("parser: %8.2f ms" % (parser * 1000))
+    print("speedup: %.1fx" % (rows / parser))
@@ -0,0 +1,92 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+"""
+Nightly run benchmark of the historical data store, which compares the time needed to retrieve the last 20 years of
+daily historical data of several stocks from Investing.com every night against the time needed to retrieve it with a
+:class:`investpy.utils.store.HistoricalStore`, which just retrieves the dates it does not cover yet. The responses of
+Investing.com are synthetic and delayed as much as a real request, so that the benchmark can be run offline. Run it
+as::
+
+    $ python benchmarks/bench_store.py
+
+"""
+
+import os
+import tempfile
+import time
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+import investpy
+from investpy.utils.store import HistoricalStore, set_store
+from investpy.utils.transport import Transport, set_transport
+
+
+STOCKS = ['bbva', 'san', 'tef', 'rep', 'ibe']
+
+YEARS = 20
+
+# time in seconds Investing.com takes to respond to a request, plus the time it takes to send each row
+LATENCY = 0.1
+TRANSFER = 0.0002
+
+REPEAT = 3
+
+
+class SyntheticTransport(Transport):
+    def request(self, method, url, **kwargs):
+        start = datetime.strptime(kwargs['data']['st_date'], '%m/%d/%Y')
+        end = datetime.strptime(kwargs['data']['end_date'], '%m/%d/%Y')
+
+        rows = list()
+
+        while end >= start:
+            if end.weekday() < 5:
+                values = [int(end.replace(tzinfo=timezone.utc).timestamp()), '10.5', '10.0', '11.0', '9.5', '100000']
+                rows.append('<tr>' + ''.join('<td data-real-value="' + value + '"></td>'
+                                             for value in map(str, values)) + '</tr>')
+
+            end -= timedelta(days=1)
+
+        if not rows:
+            rows.append('<tr><td colspan="7" class="noResults">No results found</td></tr>')
+
+        time.sleep(LATENCY + TRANSFER * len(rows))
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = ('<div><table id="curr_table"><tbody>' + ''.join(rows) +
+                             '</tbody></table></div>').encode('utf-8')
+
+        return response
+
+
+def nightly_run():
+    to_date = datetime.now()
+    from_date = to_date.replace(year=to_date.year - YEARS)
+
+    for stock in STOCKS:
+        investpy.get_stock_historical_data(stock=stock, country='spain', from_date=from_date.strftime('%d/%m/%Y'),
+                                           to_date=to_date.strftime('%d/%m/%Y'))
+
+
+if __name__ == '__main__':
+    set_transport(SyntheticTransport())
+
+    download = min(timeit.repeat(nightly_run, number=1, repeat=REPEAT))
+
+    with tempfile.TemporaryDirectory() as directory:
+        set_store(HistoricalStore(os.path.join(directory, 'historical.sqlite')))
+
+        first = timeit.timeit(nightly_run, number=1)
+        stored = min(timeit.repeat(nightly_run, number=1, repeat=REPEAT))
+
+        set_store(None)
+
+    print("download:     %8.2f ms" % (download * 1000))
+    print("store (1st):  %8.2f ms" % (first * 1000))
+    print("store:        %8.2f ms" % (stored * 1000))
+    print("speedup: %.1fx" % (download / stored))
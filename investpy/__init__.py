@@ -4,44 +4,98 @@
 __author__ = 'Alvaro Bartolome @ alvarobartt in GitHub'
 __version__ = '1.0'
 
-from .stocks import get_stocks, get_stocks_list, get_stocks_dict, get_stock_countries, get_stock_recent_data, \
-    get_stock_historical_data, get_stock_company_profile, get_stock_dividends, get_stock_information, get_stocks_overview, \
-    get_stock_financial_summary, search_stocks
+import sys
+import importlib
 
-from .funds import get_funds, get_funds_list, get_funds_dict, get_fund_countries, get_fund_recent_data, \
-    get_fund_historical_data, get_fund_information, get_funds_overview, search_funds
+# The public API is loaded lazily, so that `import investpy` does not import every submodule (and pandas, lxml and
+# requests along with them) up front. Every function is just imported from its submodule the first time it is used.
+_LAZY_ATTRIBUTES = {
+    '.stocks': ('get_stocks', 'get_stocks_list', 'get_stocks_dict', 'get_stock_countries', 'get_stock_recent_data',
+                'get_stock_historical_data', 'iter_stock_historical_data', 'get_stock_company_profile',
+                'get_stock_dividends', 'get_stock_information', 'get_stocks_overview', 'get_stock_financial_summary',
+                'search_stocks'),
 
-from .etfs import get_etfs, get_etfs_list, get_etfs_dict, get_etf_countries, get_etf_recent_data, \
-    get_etf_historical_data, get_etf_information, get_etfs_overview, search_etfs
+    '.funds': ('get_funds', 'get_funds_list', 'get_funds_dict', 'get_fund_countries', 'get_fund_recent_data',
+               'get_fund_historical_data', 'iter_fund_historical_data', 'get_fund_information', 'get_funds_overview',
+               'search_funds'),
 
-from .indices import get_indices, get_indices_list, get_indices_dict, get_index_countries, \
-    get_index_recent_data, get_index_historical_data, get_index_information, get_indices_overview, search_indices
+    '.etfs': ('get_etfs', 'get_etfs_list', 'get_etfs_dict', 'get_etf_countries', 'get_etf_recent_data',
+              'get_etf_historical_data', 'iter_etf_historical_data', 'get_etf_information', 'get_etfs_overview',
+              'search_etfs'),
 
-from .currency_crosses import get_currency_crosses, get_currency_crosses_list, get_currency_crosses_dict, \
-    get_available_currencies, get_currency_cross_recent_data, get_currency_cross_historical_data, \
-    get_currency_cross_information, get_currency_crosses_overview, search_currency_crosses
+    '.indices': ('get_indices', 'get_indices_list', 'get_indices_dict', 'get_index_countries', 'get_index_recent_data',
+                 'get_index_historical_data', 'iter_index_historical_data', 'get_index_information',
+                 'get_indices_overview', 'search_indices'),
 
-from .bonds import get_bonds, get_bonds_list, get_bonds_dict, get_bond_countries, get_bond_recent_data, \
-    get_bond_historical_data, get_bond_information, get_bonds_overview, search_bonds
+    '.currency_crosses': ('get_currency_crosses', 'get_currency_crosses_list', 'get_currency_crosses_dict',
+                          'get_available_currencies', 'get_currency_cross_recent_data',
+                          'get_currency_cross_historical_data', 'iter_currency_cross_historical_data',
+                          'get_currency_cross_information', 'get_currency_crosses_overview',
+                          'search_currency_crosses'),
 
-from .commodities import get_commodities, get_commodities_list, get_commodities_dict, get_commodity_groups, \
-    get_commodity_recent_data, get_commodity_historical_data, get_commodity_information, get_commodities_overview, \
-    search_commodities
+    '.bonds': ('get_bonds', 'get_bonds_list', 'get_bonds_dict', 'get_bond_countries', 'get_bond_recent_data',
+               'get_bond_historical_data', 'iter_bond_historical_data', 'get_bond_information', 'get_bonds_overview',
+               'search_bonds'),
 
-from .crypto import get_cryptos, get_cryptos_list, get_cryptos_dict, get_crypto_recent_data, \
-    get_crypto_historical_data, get_crypto_information, get_cryptos_overview, search_cryptos
+    '.commodities': ('get_commodities', 'get_commodities_list', 'get_commodities_dict', 'get_commodity_groups',
+                     'get_commodity_recent_data', 'get_commodity_historical_data', 'iter_commodity_historical_data',
+                     'get_commodity_information', 'get_commodities_overview', 'search_commodities'),
 
-from .certificates import get_certificates, get_certificates_list, get_certificates_dict, get_certificate_countries, \
-    get_certificate_recent_data, get_certificate_historical_data, get_certificate_information, get_certificates_overview, \
-    search_certificates
+    '.crypto': ('get_cryptos', 'get_cryptos_list', 'get_cryptos_dict', 'get_crypto_recent_data',
+                'get_crypto_historical_data', 'iter_crypto_historical_data', 'get_crypto_information',
+                'get_cryptos_overview', 'search_cryptos'),
 
-from .search import search_quotes
+    '.certificates': ('get_certificates', 'get_certificates_list', 'get_certificates_dict',
+                      'get_certificate_countries', 'get_certificate_recent_data', 'get_certificate_historical_data',
+                      'iter_certificate_historical_data', 'get_certificate_information', 'get_certificates_overview',
+                      'search_certificates'),
 
-from .news import economic_calendar
+    '.search': ('search_quotes',),
 
-from .technical import technical_indicators, moving_averages, pivot_points
+    '.news': ('economic_calendar',),
 
-from .utils.screen_obj import ScreenerParams
-from .utils.screen_result_obj import ScreenResultObj
-from .screener import screener
+    '.technical': ('technical_indicators', 'moving_averages', 'pivot_points', 'compute_technical_indicators',
+                   'compute_moving_averages', 'compute_pivot_points'),
 
+    '.utils.screen_obj': ('ScreenerParams',),
+    '.utils.screen_result_obj': ('ScreenResultObj',),
+    '.screener': ('screener',),
+
+    '.utils.catalog': ('resolve',),
+
+    '.bulk': ('get_historical_data_bulk',),
+
+    '.utils.panel': ('build_aligned_panel',),
+}
+
+_ATTRIBUTE_MODULES = {name: module for module, names in _LAZY_ATTRIBUTES.items() for name in names}
+
+__all__ = list(_ATTRIBUTE_MODULES.keys())
+
+
+def __getattr__(name):
+    if name not in _ATTRIBUTE_MODULES:
+        raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+
+    value = getattr(importlib.import_module(_ATTRIBUTE_MODULES[name], __name__), name)
+
+    # importing a submodule binds it as an attribute of the package, which would shadow the function with the
+    # same name (i.e. `investpy.screener`), so the function is always bound after the import.
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
+
+
+# module-level __getattr__ (PEP 562) is just supported since Python 3.7, so the public API is imported up front before
+if sys.version_info < (3, 7):
+    _ATTRIBUTE_VALUES = {name: getattr(importlib.import_module(module, __name__), name)
+                         for name, module in _ATTRIBUTE_MODULES.items()}
+
+    # bound once every submodule has been imported, so that no submodule shadows a function with its same name
+    globals().update(_ATTRIBUTE_VALUES)
+
+    del _ATTRIBUTE_VALUES
@@ -0,0 +1,123 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from functools import partial
+import threading
+
+import pandas as pd
+
+from .utils.historical import check_date_range, check_instruments, retrieve_historical_data, retrieve_instruments
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def get_historical_data_bulk(instruments, from_date, to_date, as_long=False, order='ascending', interval='Daily',
+                             max_workers=DEFAULT_MAX_WORKERS, interval_source='remote'):
+    """
+    This function retrieves the historical data of every introduced financial product from Investing.com at once, in
+    the specified date range. Every financial product is first resolved against the investpy static data files, so
+    that the ones which do not exist are reported without sending any request, and then the historical data of the
+    resolved ones is retrieved concurrently on a pool of threads. Both the number of financial products being retrieved
+    and the number of requests being sent at the same time are capped by `max_workers`, since the date range of a
+    single financial product may be split into several requests. Note that an error retrieving the historical data of
+    a financial product does not abort the retrieval of the rest of them, since the errors are collected and returned
+    along with the data.
+
+    Args:
+        instruments (:obj:`list` of :obj:`tuple`):
+            financial products to retrieve historical data from, as `(product_type, name, country)` tuples, where the
+            product_type is any of: `stock`, `fund`, `etf`, `index`, `currency_cross`, `bond`, `commodity`, `crypto`
+            or `certificate`; the name is the symbol of the product if the product_type is `stock` or its name
+            otherwise; and the country can be None (or omitted, using `(product_type, name)` tuples) for the products
+            which are not listed by country, such as currency crosses or cryptos.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        as_long (:obj:`bool`, optional):
+            to determine the format of the output data, either a :obj:`dict` of :obj:`pandas.DataFrame` if False, or a
+            single long-format :obj:`pandas.DataFrame` if True.
+        order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        max_workers (:obj:`int`, optional):
+            maximum number of financial products being retrieved, and of requests being sent, at the same time.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
+
+    Returns:
+        :obj:`tuple` - data, errors:
+            The function returns a tuple with the retrieved historical data and the collected errors. If `as_long` is
+            False, the data is a :obj:`dict` whose keys are the introduced tuples and whose values are the
+            :obj:`pandas.DataFrame` with the historical data of each financial product, as the ones returned by the
+            `get_*_historical_data` functions; whereas if `as_long` is True, the data is a single :obj:`pandas.DataFrame`
+            containing the historical data of every financial product, which looks like::
+
+                Date || Product Type | Name | Country | Open | High | Low | Close | Volume | Currency
+                -----||--------------|------|---------|------|------|-----|-------|--------|----------
+                xxxx || xxxxxxxxxxxx | xxxx | xxxxxxx | xxxx | xxxx | xxx | xxxxx | xxxxxx | xxxxxxxx
+
+            The errors are a :obj:`dict` whose keys are the introduced tuples of the financial products that could not
+            be retrieved and whose values are the raised exceptions.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> data, errors = investpy.get_historical_data_bulk([('stock', 'bbva', 'spain'), ('etf', 'error', 'spain')],
+        ...                                                  from_date='01/01/2019', to_date='01/01/2020')
+        >>> list(data.keys())
+        [('stock', 'bbva', 'spain')]
+        >>> errors
+        {('etf', 'error', 'spain'): RuntimeError('ERR#0138: introduced etf error not found, check if it is correct.')}
+
+    """
+
+    check_instruments(instruments)
+
+    if not isinstance(as_long, bool):
+        raise ValueError("ERR#0145: as_long argument can just be True or False, bool type.")
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        raise ValueError("ERR#0146: max_workers argument needs to be an integer greater than 0.")
+
+    if order not in ['ascending', 'asc', 'descending', 'desc']:
+        raise ValueError("ERR#0003: order argument can just be ascending (asc) or descending (desc), str type.")
+
+    if interval not in ['Daily', 'Weekly', 'Monthly']:
+        raise ValueError("ERR#0073: interval value should be a str type and it can just be either 'Daily', 'Weekly' or 'Monthly'.")
+
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    start_date, end_date = check_date_range(from_date, to_date)
+
+    retrieve = partial(retrieve_historical_data, order=order, interval=interval, interval_source=interval_source)
+
+    # shared by the requests of every financial product, which may split its date range into several requests
+    limiter = threading.BoundedSemaphore(max_workers)
+
+    retrieved, errors = retrieve_instruments(instruments, start_date, end_date, max_workers, retrieve=retrieve,
+                                             limiter=limiter)
+
+    data = {instrument: df for instrument, (_, df) in retrieved.items()}
+
+    if as_long is False:
+        return data, errors
+
+    final = list()
+
+    for instrument, df in data.items():
+        product_type, name, country = instrument if len(instrument) == 3 else instrument + (None,)
+
+        df = df.copy()
+        df.insert(0, 'Country', country)
+        df.insert(0, 'Name', name)
+        df.insert(0, 'Product Type', product_type)
+
+        final.append(df)
+
+    if not final:
+        return pd.DataFrame(columns=['Product Type', 'Name', 'Country']), errors
+
+    return pd.concat(final, sort=False), errors
@@ -2,20 +2,20 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
 
-import json
 import re
-from random import randint
 
 import pandas as pd
 import pkg_resources
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.certificates_data import certificates_as_df, certificates_as_list, certificates_as_dict
 from .data.certificates_data import certificate_countries_as_list
@@ -245,104 +245,25 @@ def get_certificate_recent_data(certificate, country, as_json=False, order='asce
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
-    if certificates is None:
-        raise IOError("ERR#0097: certificates not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_certificate_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    certificates = certificates[certificates['country'] == unidecode(country.lower())]
-
     certificate = certificate.strip()
     certificate = certificate.lower()
 
-    if unidecode(certificate) not in [unidecode(value.lower()) for value in certificates['name'].tolist()]:
-        raise RuntimeError("ERR#0101: certificate " + certificate + " not found, check if it is correct.")
-
-    symbol = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'symbol']
-    id_ = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'id']
-    name = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'name']
-
-    header = symbol + ' Historical Data'
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
+    found_certificates = lookup_instruments(resource_path, 'name', certificate, country=country)
 
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0102: certificate information unavailable or not found.")
-
-            info = []
-        
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            certificate_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            certificate_close = float(info[1].replace(',', ''))
-            certificate_open = float(info[2].replace(',', ''))
-            certificate_high = float(info[3].replace(',', ''))
-            certificate_low = float(info[4].replace(',', ''))
-
-            result.insert(len(result), Data(certificate_date, certificate_open, certificate_high,
-                                            certificate_low, certificate_close, None, None, None))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                'name': name,
-                'recent':
-                    [value.certificate_as_json() for value in result]
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.certificate_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    if not found_certificates:
+        raise RuntimeError("ERR#0101: certificate " + certificate + " not found, check if it is correct.")
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['certificate'], found_certificates[0],
+                                as_json=as_json, order=order, interval=interval)
 
 
-def get_certificate_historical_data(certificate, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_certificate_historical_data(certificate, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data from the introduced certificate from Investing.com. So on, the historical data
     of the introduced certificate from the specified country in the specified date range will be retrieved and returned as
@@ -361,6 +282,9 @@ def get_certificate_historical_data(certificate, country, from_date, to_date, as
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -410,6 +334,66 @@ def get_certificate_historical_data(certificate, country, from_date, to_date, as
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(certificate, country, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['certificate'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_certificate_historical_data(certificate, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced certificate from Investing.com in the specified date range,
+    just like :func:`investpy.certificates.get_certificate_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        certificate (:obj:`str`): name of the certificate to retrieve historical data from.
+        country (:obj:`str`): name of the country from where the certificate is.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            to determine the format of the output data, either a :obj:`pandas.DataFrame` if False and a :obj:`json` if True.
+        order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified certificate, in the same format as the data returned by
+            :func:`investpy.certificates.get_certificate_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+        IOError: raised if certificates object/file was not found or unable to retrieve.
+        RuntimeError: raised if the introduced certificate/country was not found or did not match any of the existing ones.
+        ConnectionError: raised if connection to Investing.com could not be established.
+        IndexError: raised if certificate historical data was unavailable or not found in Investing.com.
+
+    Examples:
+        >>> for data in investpy.iter_certificate_historical_data(certificate='BNP Gold 31Dec99', country='france', from_date='01/01/2010', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('certificate.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(certificate, country, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['certificate'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(certificate, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not certificate:
         raise ValueError("ERR#0100: certificate param is mandatory and should be a str.")
 
@@ -453,159 +437,23 @@ def get_certificate_historical_data(certificate, country, from_date, to_date, as
     if start_date >= end_date:
         raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
-    if certificates is None:
-        raise IOError("ERR#0097: certificates not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_certificate_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    certificates = certificates[certificates['country'] == unidecode(country.lower())]
-
     certificate = certificate.strip()
     certificate = certificate.lower()
 
-    if unidecode(certificate) not in [unidecode(value.lower()) for value in certificates['name'].tolist()]:
-        raise RuntimeError("ERR#0101: certificate " + certificate + " not found, check if it is correct.")
-
-    symbol = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'symbol']
-    id_ = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'id']
-    name = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'name']
-
-    header = symbol + ' Historical Data'
-
-    final = list()
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
+    found_certificates = lookup_instruments(resource_path, 'name', certificate, country=country)
 
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
+    if not found_certificates:
+        raise RuntimeError("ERR#0101: certificate " + certificate + " not found, check if it is correct.")
 
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0102: certificate information unavailable or not found.")
-                else:
-                    data_flag = True
-                
-                info = []
-            
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    certificate_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-                    certificate_close = float(info[1].replace(',', ''))
-                    certificate_open = float(info[2].replace(',', ''))
-                    certificate_high = float(info[3].replace(',', ''))
-                    certificate_low = float(info[4].replace(',', ''))
-
-                    result.insert(len(result), Data(certificate_date, certificate_open, certificate_high,
-                                                    certificate_low, certificate_close, None, None, None))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {
-                        'name': name,
-                        'historical':
-                            [value.certificate_as_json() for value in result]
-                    }
-                    
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.certificate_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_certificates[0], start_date, end_date
 
 
 def get_certificate_information(certificate, country, as_json=False):
@@ -665,27 +513,22 @@ def get_certificate_information(certificate, country, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
-    if certificates is None:
-        raise IOError("ERR#0097: certificates not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_certificate_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    certificates = certificates[certificates['country'] == unidecode(country.lower())]
-
     certificate = certificate.strip()
     certificate = certificate.lower()
 
-    if unidecode(certificate) not in [unidecode(value.lower()) for value in certificates['name'].tolist()]:
+    found_certificates = lookup_instruments(resource_path, 'name', certificate, country=country)
+
+    if not found_certificates:
         raise RuntimeError("ERR#0101: certificate " + certificate + " not found, check if it is correct.")
 
-    tag = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'tag']
-    name = certificates.loc[(certificates['name'].str.lower() == certificate).idxmax(), 'name']
+    tag = found_certificates[0]['tag']
+    name = found_certificates[0]['name']
 
     url = "https://www.investing.com/certificates/" + tag
 
@@ -697,7 +540,7 @@ def get_certificate_information(certificate, country, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -811,7 +654,7 @@ def get_certificates_overview(country, as_json=False, n_results=100):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        certificates = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
@@ -833,7 +676,7 @@ def get_certificates_overview(country, as_json=False, n_results=100):
 
     url = "https://www.investing.com/certificates/" + country.replace(' ', '-') + "-certificates"
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -885,7 +728,7 @@ def get_certificates_overview(country, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -933,7 +776,7 @@ def search_certificates(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        certificates = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
@@ -2,19 +2,17 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
-
-import json
-from random import randint
 
 import pandas as pd
 import pkg_resources
-import requests
-from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.crypto_data import cryptos_as_df, cryptos_as_list, cryptos_as_dict
 
@@ -204,105 +202,26 @@ def get_crypto_recent_data(crypto, as_json=False, order='ascending', interval='D
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
-    if cryptos is None:
-        raise IOError("ERR#0082: cryptos not found or unable to retrieve.")
-
     crypto = crypto.strip()
     crypto = crypto.lower()
 
-    if unidecode(crypto) not in [unidecode(value.lower()) for value in cryptos['name'].tolist()]:
+    found_cryptos = lookup_instruments(resource_path, 'name', crypto)
+
+    if not found_cryptos:
         raise RuntimeError("ERR#0085: crypto currency: " + crypto + ", not found, check if it is correct.")
 
-    status = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'status']
+    status = found_cryptos[0]['status']
     if status == 'unavailable':
         raise ValueError("ERR#0086: the selected crypto currency is not available for retrieval in Investing.com.")
 
-    crypto_name = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'name']
-    crypto_id = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'id']
-    crypto_currency = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'currency']
-
-    header = crypto_name + ' Historical Data'
-
-    params = {
-        "curr_id": crypto_id,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0087: crypto information unavailable or not found.")
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            crypto_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            crypto_close = float(info[1].replace(',', ''))
-            crypto_open = float(info[2].replace(',', ''))
-            crypto_high = float(info[3].replace(',', ''))
-            crypto_low = float(info[4].replace(',', ''))
-
-            crypto_volume = int(info[5])
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['crypto'], found_cryptos[0],
+                                as_json=as_json, order=order, interval=interval)
 
-            result.insert(len(result),
-                          Data(crypto_date, crypto_open, crypto_high, crypto_low,
-                               crypto_close, crypto_volume, crypto_currency, None))
 
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                'name': crypto_name,
-                'recent':
-                    [value.crypto_as_json() for value in result]
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.crypto_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
-
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-
-def get_crypto_historical_data(crypto, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_crypto_historical_data(crypto, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data from the introduced crypto from Investing.com. So on, the historical data
     of the introduced crypto will be retrieved and returned as a :obj:`pandas.DataFrame` if the parameters are valid 
@@ -319,6 +238,9 @@ def get_crypto_historical_data(crypto, from_date, to_date, as_json=False, order=
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -370,6 +292,65 @@ def get_crypto_historical_data(crypto, from_date, to_date, as_json=False, order=
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(crypto, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['crypto'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_crypto_historical_data(crypto, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced crypto currency from Investing.com in the specified date range,
+    just like :func:`investpy.crypto.get_crypto_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        crypto (:obj:`str`): name of the crypto currency to retrieve data from.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            to determine the format of the output data, either a :obj:`pandas.DataFrame` if False and a :obj:`json` if True.
+        order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified crypto currency, in the same format as the data returned by
+            :func:`investpy.crypto.get_crypto_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+        IOError: raised if cryptos object/file was not found or unable to retrieve.
+        RuntimeError: raised if the introduced crypto currency name was not found or did not match any of the existing ones.
+        ConnectionError: raised if connection to Investing.com could not be established.
+        IndexError: raised if crypto historical data was unavailable or not found in Investing.com.
+
+    Examples:
+        >>> for data in investpy.iter_crypto_historical_data(crypto='bitcoin', from_date='01/01/2018', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('crypto.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(crypto, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['crypto'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(crypto, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not crypto:
         raise ValueError("ERR#0083: crypto parameter is mandatory and must be a valid crypto name.")
 
@@ -407,160 +388,24 @@ def get_crypto_historical_data(crypto, from_date, to_date, as_json=False, order=
     if start_date >= end_date:
         raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
-    if cryptos is None:
-        raise IOError("ERR#0082: cryptos not found or unable to retrieve.")
-
     crypto = crypto.strip()
     crypto = crypto.lower()
 
-    if unidecode(crypto) not in [unidecode(value.lower()) for value in cryptos['name'].tolist()]:
+    found_cryptos = lookup_instruments(resource_path, 'name', crypto)
+
+    if not found_cryptos:
         raise RuntimeError("ERR#0085: crypto currency: " + crypto + ", not found, check if it is correct.")
 
-    status = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'status']
+    status = found_cryptos[0]['status']
     if status == 'unavailable':
         raise ValueError("ERR#0086: the selected crypto currency is not available for retrieval in Investing.com.")
 
-    crypto_name = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'name']
-    crypto_id = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'id']
-    crypto_currency = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'currency']
-
-    header = crypto_name + ' Historical Data'
-
-    final = list()
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": crypto_id,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0087: crypto information unavailable or not found.")
-                else:
-                    data_flag = True
-                
-                info = []
-            
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    crypto_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-                    crypto_close = float(info[1].replace(',', ''))
-                    crypto_open = float(info[2].replace(',', ''))
-                    crypto_high = float(info[3].replace(',', ''))
-                    crypto_low = float(info[4].replace(',', ''))
-
-                    crypto_volume = int(info[5])
-
-                    result.insert(len(result),
-                                  Data(crypto_date, crypto_open, crypto_high, crypto_low,
-                                       crypto_close, crypto_volume, crypto_currency, None))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {
-                        'name': crypto_name,
-                        'historical':
-                            [value.crypto_as_json() for value in result]
-                    }
-                    
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.crypto_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_cryptos[0], start_date, end_date
 
 
 def get_crypto_information(crypto, as_json=False):
@@ -613,27 +458,24 @@ def get_crypto_information(crypto, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
-    if cryptos is None:
-        raise IOError("ERR#0082: cryptos not found or unable to retrieve.")
-
     crypto = crypto.strip()
     crypto = crypto.lower()
 
-    if unidecode(crypto) not in [unidecode(value.lower()) for value in cryptos['name'].tolist()]:
+    found_cryptos = lookup_instruments(resource_path, 'name', crypto)
+
+    if not found_cryptos:
         raise RuntimeError("ERR#0085: crypto currency: " + crypto + ", not found, check if it is correct.")
 
-    status = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'status']
+    status = found_cryptos[0]['status']
     if status == 'unavailable':
         raise ValueError("ERR#0086: the selected crypto currency is not available for retrieval in Investing.com.")
 
-    name = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'name']
-    currency = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'currency']
-    tag = cryptos.loc[(cryptos['name'].str.lower() == crypto).idxmax(), 'tag']
+    name = found_cryptos[0]['name']
+    currency = found_cryptos[0]['currency']
+    tag = found_cryptos[0]['tag']
 
     url = "https://www.investing.com/crypto/" + tag
 
@@ -645,7 +487,7 @@ def get_crypto_information(crypto, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -736,7 +578,7 @@ def get_cryptos_overview(as_json=False, n_results=100):
 
     url = "https://www.investing.com/crypto/currencies"
 
-    req = requests.get(url, headers=header)
+    req = get_transport().get(url, headers=header)
 
     root = fromstring(req.text)
     table = root.xpath(".//table[contains(@class, 'allCryptoTlb')]/tbody/tr")
@@ -790,7 +632,7 @@ def get_cryptos_overview(as_json=False, n_results=100):
         df = pd.DataFrame(results)
 
         if as_json:
-            return json.loads(df.to_json(orient='records'))
+            return frame_to_records(df)
         else:
             return df
     else:
@@ -808,7 +650,7 @@ def get_cryptos_overview(as_json=False, n_results=100):
 
         url = 'https://www.investing.com/crypto/Service/LoadCryptoCurrencies'
 
-        req = requests.post(url=url, headers=header, data=params)
+        req = get_transport().post(url=url, headers=header, data=params)
 
         root = fromstring(req.json()['html'])
         table = root.xpath(".//tr")
@@ -858,7 +700,7 @@ def get_cryptos_overview(as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -903,7 +745,7 @@ def search_cryptos(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        cryptos = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
@@ -2,21 +2,22 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
 
-import json
-from random import randint, sample
+from random import sample
 import string
 
 import pandas as pd
 import pkg_resources
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils import constant as cst
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.currency_crosses_data import currency_crosses_as_df, currency_crosses_as_list, currency_crosses_as_dict
 from .data.currency_crosses_data import available_currencies_as_list
@@ -266,99 +267,22 @@ def get_currency_cross_recent_data(currency_cross, as_json=False, order='ascendi
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'currency_crosses.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        currency_crosses = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0060: currency_crosses file not found or errored.")
 
-    if currency_crosses is None:
-        raise IOError("ERR#0050: currency_crosses not found or unable to retrieve.")
-
     currency_cross = currency_cross.strip()
     currency_cross = currency_cross.lower()
 
-    if unidecode(currency_cross) not in [unidecode(value.lower()) for value in currency_crosses['name'].tolist()]:
-        raise RuntimeError("ERR#0054: the introduced currency_cross " + str(currency_cross) + " does not exists.")
-
-    id_ = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'id']
-    name = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'name']
-    currency = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'second']
-
-    header = name + ' Historical Data'
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
+    found_currency_crosses = lookup_instruments(resource_path, 'name', currency_cross)
 
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0055: currency_cross information unavailable or not found.")
-
-            info = []
-        
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            currency_cross_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            currency_cross_close = float(info[1].replace(',', ''))
-            currency_cross_open = float(info[2].replace(',', ''))
-            currency_cross_high = float(info[3].replace(',', ''))
-            currency_cross_low = float(info[4].replace(',', ''))
-
-            result.insert(len(result),
-                          Data(currency_cross_date, currency_cross_open, currency_cross_high, currency_cross_low,
-                               currency_cross_close, None, currency, None))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                'name': name,
-                'recent': 
-                    [value.currency_cross_as_json() for value in result]
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.currency_cross_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    if not found_currency_crosses:
+        raise RuntimeError("ERR#0054: the introduced currency_cross " + str(currency_cross) + " does not exists.")
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['currency_cross'], found_currency_crosses[0],
+                                as_json=as_json, order=order, interval=interval)
 
 
-def get_currency_cross_historical_data(currency_cross, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_currency_cross_historical_data(currency_cross, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves recent historical data from the introduced `currency_cross` from Investing
     via Web Scraping. The resulting data can it either be stored in a :obj:`pandas.DataFrame` or in a
@@ -374,6 +298,9 @@ def get_currency_cross_historical_data(currency_cross, from_date, to_date, as_js
             optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -423,6 +350,66 @@ def get_currency_cross_historical_data(currency_cross, from_date, to_date, as_js
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(currency_cross, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['currency_cross'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_currency_cross_historical_data(currency_cross, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced currency cross from Investing.com in the specified date range,
+    just like :func:`investpy.currency_crosses.get_currency_cross_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        currency_cross (:obj:`str`): name of the currency cross to retrieve recent historical data from.
+        from_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, from where data is going to be retrieved.
+        to_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, until where data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        order (:obj:`str`, optional):
+            optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified currency cross, in the same format as the data returned by
+            :func:`investpy.currency_crosses.get_currency_cross_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: argument error.
+        IOError: stocks object/file not found or unable to retrieve.
+        RuntimeError: introduced currency_cross does not match any of the indexed ones.
+        ConnectionError: if GET requests does not return 200 status code.
+        IndexError: if currency_cross information was unavailable or not found.
+
+    Examples:
+        >>> for data in investpy.iter_currency_cross_historical_data(currency_cross='EUR/USD', from_date='01/01/2018', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('currency_cross.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(currency_cross, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['currency_cross'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(currency_cross, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not currency_cross:
         raise ValueError("ERR#0052: currency_cross param is mandatory and should be a str.")
 
@@ -460,154 +447,20 @@ def get_currency_cross_historical_data(currency_cross, from_date, to_date, as_js
     if interval not in ['Daily', 'Weekly', 'Monthly']:
         raise ValueError("ERR#0073: interval value should be a str type and it can just be either 'Daily', 'Weekly' or 'Monthly'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'currency_crosses.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        currency_crosses = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0060: currency_crosses file not found or errored.")
 
-    if currency_crosses is None:
-        raise IOError("ERR#0050: currency_crosses not found or unable to retrieve.")
-
     currency_cross = currency_cross.strip()
     currency_cross = currency_cross.lower()
 
-    if unidecode(currency_cross) not in [unidecode(value.lower()) for value in currency_crosses['name'].tolist()]:
+    found_currency_crosses = lookup_instruments(resource_path, 'name', currency_cross)
+
+    if not found_currency_crosses:
         raise RuntimeError("ERR#0054: the introduced currency_cross " + str(currency_cross) + " does not exists.")
 
-    id_ = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'id']
-    name = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'name']
-    currency = currency_crosses.loc[(currency_crosses['name'].str.lower() == currency_cross).idxmax(), 'second']
-
-    final = list()
-
-    header = name + ' Historical Data'
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-        
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                info = []
-        
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0055: currency_cross information unavailable or not found.")
-                else:
-                    data_flag = True
-
-                if data_flag is True:
-                    currency_cross_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                    
-                    currency_cross_close = float(info[1].replace(',', ''))
-                    currency_cross_open = float(info[2].replace(',', ''))
-                    currency_cross_high = float(info[3].replace(',', ''))
-                    currency_cross_low = float(info[4].replace(',', ''))
-
-                    result.insert(len(result),
-                                  Data(currency_cross_date, currency_cross_open, currency_cross_high, currency_cross_low,
-                                       currency_cross_close, None, currency, None))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {
-                        'name': name,
-                        'historical':
-                            [value.currency_cross_as_json() for value in result]
-                    }
-
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.currency_cross_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_currency_crosses[0], start_date, end_date
 
 
 def get_currency_cross_information(currency_cross, as_json=False):
@@ -660,22 +513,19 @@ def get_currency_cross_information(currency_cross, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'currency_crosses.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        crosses = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0060: currency_crosses file not found or errored.")
 
-    if crosses is None:
-        raise IOError("ERR#0050: currency_crosses not found or unable to retrieve.")
-
     currency_cross = currency_cross.strip()
     currency_cross = currency_cross.lower()
 
-    if unidecode(currency_cross) not in [unidecode(value.lower()) for value in crosses['name'].tolist()]:
+    found_crosses = lookup_instruments(resource_path, 'name', currency_cross)
+
+    if not found_crosses:
         raise RuntimeError("ERR#0054: the introduced currency_cross " + str(currency_cross) + " does not exists.")
 
-    name = crosses.loc[(crosses['name'].str.lower() == currency_cross).idxmax(), 'name']
-    tag = crosses.loc[(crosses['name'].str.lower() == currency_cross).idxmax(), 'tag']
+    name = found_crosses[0]['name']
+    tag = found_crosses[0]['tag']
 
     url = "https://www.investing.com/currencies/" + tag
 
@@ -687,7 +537,7 @@ def get_currency_cross_information(currency_cross, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -816,7 +666,7 @@ def get_currency_crosses_overview(currency, as_json=False, n_results=100):
 
     url = 'https://www.investing.com/currencies/Service/ChangeCurrency'
 
-    req = requests.get(url, headers=head, params=params)
+    req = get_transport().get(url, headers=head, params=params)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -870,7 +720,7 @@ def get_currency_crosses_overview(currency, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -917,7 +767,7 @@ def search_currency_crosses(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'currency_crosses.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        currency_crosses = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        currency_crosses = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0060: currency_crosses file not found or errored.")
 
@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def certificates_as_df(country=None):
@@ -47,7 +48,7 @@ def certificates_as_df(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        certificates = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
@@ -105,7 +106,7 @@ def certificates_as_list(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        certificates = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
@@ -174,7 +175,7 @@ def certificates_as_dict(country=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'certificates.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        certificates = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        certificates = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0096: certificates file not found or errored.")
 
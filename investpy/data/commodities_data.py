@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def commodities_as_df(group=None):
@@ -48,7 +49,7 @@ def commodities_as_df(group=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'commodities.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        commodities = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        commodities = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0075: commodities file not found or errored.")
 
@@ -106,7 +107,7 @@ def commodities_as_list(group=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'commodities.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        commodities = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        commodities = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0075: commodities file not found or errored.")
 
@@ -177,7 +178,7 @@ def commodities_as_dict(group=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'commodities.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        commodities = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        commodities = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0075: commodities file not found or errored.")
 
@@ -233,7 +234,7 @@ def commodity_groups_list():
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'commodities.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        commodities = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        commodities = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0075: commodities file not found or errored.")
 
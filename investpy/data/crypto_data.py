@@ -8,6 +8,8 @@ from unidecode import unidecode
 import json
 import pandas as pd
 
+from ..utils.catalog import load_catalog
+
 
 def cryptos_as_df():
     """
@@ -38,7 +40,7 @@ def cryptos_as_df():
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        cryptos = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
@@ -82,7 +84,7 @@ def cryptos_as_list():
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        cryptos = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
@@ -138,7 +140,7 @@ def cryptos_as_dict(columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'cryptos.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        cryptos = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        cryptos = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0081: cryptos file not found or errored.")
 
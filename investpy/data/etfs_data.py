@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def etfs_as_df(country=None):
@@ -46,7 +47,7 @@ def etfs_as_df(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        etfs = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
@@ -108,7 +109,7 @@ def etfs_as_list(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        etfs = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
@@ -179,7 +180,7 @@ def etfs_as_dict(country=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        etfs = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
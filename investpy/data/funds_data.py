@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def funds_as_df(country=None):
@@ -45,7 +46,7 @@ def funds_as_df(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        funds = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
@@ -105,7 +106,7 @@ def funds_as_list(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        funds = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
@@ -173,7 +174,7 @@ def funds_as_dict(country=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        funds = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def indices_as_df(country=None):
@@ -46,7 +47,7 @@ def indices_as_df(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        indices = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
@@ -104,7 +105,7 @@ def indices_as_list(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        indices = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
@@ -174,7 +175,7 @@ def indices_as_dict(country=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        indices = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
@@ -9,6 +9,7 @@ import json
 import pandas as pd
 
 from ..utils import constant as cst
+from ..utils.catalog import load_catalog
 
 
 def stocks_as_df(country=None):
@@ -47,7 +48,7 @@ def stocks_as_df(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
+        stocks = load_catalog(resource_path, keep_default_na=False)
     else:
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
@@ -107,7 +108,7 @@ def stocks_as_list(country=None):
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
+        stocks = load_catalog(resource_path, keep_default_na=False)
     else:
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
@@ -175,7 +176,7 @@ def stocks_as_dict(country=None, columns=None, as_json=False):
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
+        stocks = load_catalog(resource_path, keep_default_na=False)
     else:
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
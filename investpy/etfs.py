@@ -2,21 +2,20 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
-
-import json
-from random import randint
 
 import warnings
 
 import pandas as pd
 import pkg_resources
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.etfs_data import etfs_as_df, etfs_as_list, etfs_as_dict
 from .data.etfs_data import etf_countries_as_list
@@ -256,14 +255,9 @@ def get_etf_recent_data(etf, country, stock_exchange=None, as_json=False, order=
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
-    if etfs is None:
-        raise IOError("ERR#0009: etfs object not found or unable to retrieve.")
-
     country = unidecode(country.strip().lower())
 
     if country not in get_etf_countries():
@@ -271,14 +265,15 @@ def get_etf_recent_data(etf, country, stock_exchange=None, as_json=False, order=
 
     etf = unidecode(etf.strip().lower())
 
-    def_exchange = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['def_stock_exchange'] == True)).idxmax()]
-    
-    etfs = etfs[etfs['country'].str.lower() == country]
+    found_etfs = lookup_instruments(resource_path, 'name', etf, country=country)
 
-    if etf not in [value for value in etfs['name'].str.lower()]:
+    if not found_etfs:
         raise RuntimeError("ERR#0019: etf " + etf + " not found, check if it is correct.")
 
-    etfs = etfs[etfs['name'].str.lower() == etf]
+    def_exchanges = [value for value in lookup_instruments(resource_path, 'name', etf) if value['def_stock_exchange'] == True]
+    def_exchange = def_exchanges[0] if def_exchanges else found_etfs[0]
+
+    stock_exchanges = [value['stock_exchange'] for value in found_etfs]
 
     if def_exchange['country'] != country:
         warnings.warn(
@@ -289,26 +284,22 @@ def get_etf_recent_data(etf, country, stock_exchange=None, as_json=False, order=
         )
         
         if stock_exchange:
-            if stock_exchange.lower() not in etfs['stock_exchange'].str.lower().tolist():
+            if stock_exchange.lower() not in [value.lower() for value in stock_exchanges]:
                 raise ValueError("ERR#0126: introduced stock_exchange value does not exists, leave this parameter to None to use default stock_exchange.")
             
-            etf_exchange = etfs.loc[(etfs['stock_exchange'].str.lower() == stock_exchange.lower()).idxmax(), 'stock_exchange']
+            etf_exchange = stock_exchange
         else:
-            found_etfs = etfs[etfs['name'].str.lower() == etf]
-    
             if len(found_etfs) > 1:
                 warnings.warn(
                     'Note that the displayed information can differ depending on the stock exchange. Available stock_exchange' + \
-                    ' values for \"' + country + '\" are: \"' + '\", \"'.join(found_etfs['stock_exchange']) + '\".',
+                    ' values for \"' + country + '\" are: \"' + '\", \"'.join(stock_exchanges) + '\".',
                     Warning
                 )
 
-            del found_etfs
-
-            etf_exchange = etfs.loc[(etfs['name'].str.lower() == etf).idxmax(), 'stock_exchange']
+            etf_exchange = found_etfs[0]['stock_exchange']
     else:
         if stock_exchange:
-            if stock_exchange.lower() not in etfs['stock_exchange'].str.lower().tolist():
+            if stock_exchange.lower() not in [value.lower() for value in stock_exchanges]:
                 raise ValueError("ERR#0126: introduced stock_exchange value does not exists, leave this parameter to None to use default stock_exchange.")
 
             if def_exchange['stock_exchange'].lower() != stock_exchange.lower():
@@ -319,93 +310,17 @@ def get_etf_recent_data(etf, country, stock_exchange=None, as_json=False, order=
                     Warning
                 )
 
-            etf_exchange = etfs.loc[(etfs['stock_exchange'].str.lower() == stock_exchange.lower()).idxmax(), 'stock_exchange']
+            etf_exchange = stock_exchange
         else:
             etf_exchange = def_exchange['stock_exchange']
 
-    symbol = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'symbol']
-    id_ = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'id']
-    name = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'name']
-
-    etf_currency = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'currency']
-
-    header = symbol + ' Historical Data'
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0010: etf information unavailable or not found.")
-            
-            info = []
-        
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            etf_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-
-            etf_close = float(info[1].replace(',', ''))
-            etf_open = float(info[2].replace(',', ''))
-            etf_high = float(info[3].replace(',', ''))
-            etf_low = float(info[4].replace(',', ''))
-
-            etf_volume = int(info[5])
-
-            result.insert(len(result),
-                          Data(etf_date, etf_open, etf_high, etf_low, etf_close, etf_volume, etf_currency, etf_exchange))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
+    found_etf = [value for value in found_etfs if value['stock_exchange'].lower() == etf_exchange.lower()][0]
 
-        if as_json is True:
-            json_ = {
-                'name': name,
-                'recent':
-                    [value.etf_as_json() for value in result]
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.etf_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['etf'], found_etf,
+                                as_json=as_json, order=order, interval=interval)
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
-
-def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=None, as_json=False, order='ascending', interval='Daily'):
+def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=None, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data from the introduced `etf` from Investing via Web Scraping on the 
     introduced date range. The resulting data can it either be stored in a :obj:`pandas.DataFrame` or in a 
@@ -422,6 +337,9 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
             optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -474,6 +392,67 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(etf, country, from_date, to_date, stock_exchange, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['etf'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_etf_historical_data(etf, country, from_date, to_date, stock_exchange=None, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced etf from Investing.com in the specified date range,
+    just like :func:`investpy.etfs.get_etf_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        etf (:obj:`str`): name of the etf to retrieve recent historical data from.
+        country (:obj:`str`): name of the country from where the etf is.
+        from_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, from where data is going to be retrieved.
+        to_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, until where data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        order (:obj:`str`, optional):
+            optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified etf, in the same format as the data returned by
+            :func:`investpy.etfs.get_etf_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: raised whenever any of the arguments is not valid or errored.
+        IOError: raised if etfs object/file not found or unable to retrieve.
+        RuntimeError:raised if the introduced etf does not match any of the indexed ones.
+        ConnectionError: raised if GET requests does not return 200 status code.
+        IndexError: raised if etf information was unavailable or not found.
+
+    Examples:
+        >>> for data in investpy.iter_etf_historical_data(etf='bbva accion dj eurostoxx 50', country='spain', from_date='01/01/2010', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('etf.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(etf, country, from_date, to_date, stock_exchange, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['etf'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(etf, country, from_date, to_date, stock_exchange=None, as_json=False, order='ascending', interval='Daily'):
     if not etf:
         raise ValueError("ERR#0031: etf parameter is mandatory and must be a valid etf name.")
 
@@ -520,49 +499,11 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
     if start_date >= end_date:
         raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
-    if etfs is None:
-        raise IOError("ERR#0009: etfs object not found or unable to retrieve.")
-
     country = unidecode(country.strip().lower())
 
     if country not in get_etf_countries():
@@ -570,14 +511,15 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
 
     etf = unidecode(etf.strip().lower())
 
-    def_exchange = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['def_stock_exchange'] == True)).idxmax()]
-    
-    etfs = etfs[etfs['country'].str.lower() == country]
+    found_etfs = lookup_instruments(resource_path, 'name', etf, country=country)
 
-    if etf not in [value for value in etfs['name'].str.lower()]:
+    if not found_etfs:
         raise RuntimeError("ERR#0019: etf " + etf + " not found, check if it is correct.")
 
-    etfs = etfs[etfs['name'].str.lower() == etf]
+    def_exchanges = [value for value in lookup_instruments(resource_path, 'name', etf) if value['def_stock_exchange'] == True]
+    def_exchange = def_exchanges[0] if def_exchanges else found_etfs[0]
+
+    stock_exchanges = [value['stock_exchange'] for value in found_etfs]
 
     if def_exchange['country'] != country:
         warnings.warn(
@@ -588,26 +530,22 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
         )
         
         if stock_exchange:
-            if stock_exchange.lower() not in etfs['stock_exchange'].str.lower().tolist():
+            if stock_exchange.lower() not in [value.lower() for value in stock_exchanges]:
                 raise ValueError("ERR#0126: introduced stock_exchange value does not exists, leave this parameter to None to use default stock_exchange.")
             
-            etf_exchange = etfs.loc[(etfs['stock_exchange'].str.lower() == stock_exchange.lower()).idxmax(), 'stock_exchange']
+            etf_exchange = stock_exchange
         else:
-            found_etfs = etfs[etfs['name'].str.lower() == etf]
-    
             if len(found_etfs) > 1:
                 warnings.warn(
                     'Note that the displayed information can differ depending on the stock exchange. Available stock_exchange' + \
-                    ' values for \"' + country + '\" are: \"' + '\", \"'.join(found_etfs['stock_exchange']) + '\".',
+                    ' values for \"' + country + '\" are: \"' + '\", \"'.join(stock_exchanges) + '\".',
                     Warning
                 )
 
-            del found_etfs
-
-            etf_exchange = etfs.loc[(etfs['name'].str.lower() == etf).idxmax(), 'stock_exchange']
+            etf_exchange = found_etfs[0]['stock_exchange']
     else:
         if stock_exchange:
-            if stock_exchange.lower() not in etfs['stock_exchange'].str.lower().tolist():
+            if stock_exchange.lower() not in [value.lower() for value in stock_exchanges]:
                 raise ValueError("ERR#0126: introduced stock_exchange value does not exists, leave this parameter to None to use default stock_exchange.")
 
             if def_exchange['stock_exchange'].lower() != stock_exchange.lower():
@@ -618,111 +556,13 @@ def get_etf_historical_data(etf, country, from_date, to_date, stock_exchange=Non
                     Warning
                 )
 
-            etf_exchange = etfs.loc[(etfs['stock_exchange'].str.lower() == stock_exchange.lower()).idxmax(), 'stock_exchange']
+            etf_exchange = stock_exchange
         else:
             etf_exchange = def_exchange['stock_exchange']
 
-    symbol = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'symbol']
-    id_ = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'id']
-    name = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'name']
-
-    etf_currency = etfs.loc[((etfs['name'].str.lower() == etf) & (etfs['stock_exchange'].str.lower() == etf_exchange.lower())).idxmax(), 'currency']
-
-    final = list()
-
-    header = symbol + ' Historical Data'
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
+    found_etf = [value for value in found_etfs if value['stock_exchange'].lower() == etf_exchange.lower()][0]
 
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-        
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0010: etf information unavailable or not found.")
-                else:
-                    data_flag = True
-                
-                info = []
-
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    etf_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                    
-                    etf_close = float(info[1].replace(',', ''))
-                    etf_open = float(info[2].replace(',', ''))
-                    etf_high = float(info[3].replace(',', ''))
-                    etf_low = float(info[4].replace(',', ''))
-
-                    etf_volume = int(info[5])
-
-                    result.insert(len(result),
-                                  Data(etf_date, etf_open, etf_high, etf_low, etf_close, etf_volume, etf_currency, etf_exchange))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {'name': name,
-                             'historical':
-                                 [value.etf_as_json() for value in result]
-                             }
-
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.etf_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_etf, start_date, end_date
 
 
 def get_etf_information(etf, country, as_json=False):
@@ -790,29 +630,24 @@ def get_etf_information(etf, country, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
-    if etfs is None:
-        raise IOError("ERR#0009: etfs object not found or unable to retrieve.")
-
     country = unidecode(country.lower())
 
     if country not in get_etf_countries():
         raise RuntimeError("ERR#0034: country " + country + " not found, check if it is correct.")
 
-    etfs = etfs[etfs['country'] == country]
-
     etf = etf.strip()
     etf = etf.lower()
 
-    if unidecode(etf) not in [unidecode(value.lower()) for value in etfs['name'].tolist()]:
+    found_etfs = lookup_instruments(resource_path, 'name', etf, country=country)
+
+    if not found_etfs:
         raise RuntimeError("ERR#0019: etf " + str(etf) + " not found in " + str(country.lower()) + ", check if it is correct.")
 
-    name = etfs.loc[(etfs['name'].str.lower() == etf).idxmax(), 'name']
-    tag = etfs.loc[(etfs['name'].str.lower() == etf).idxmax(), 'tag']
+    name = found_etfs[0]['name']
+    tag = found_etfs[0]['tag']
 
     url = "https://www.investing.com/etfs/" + tag
 
@@ -824,7 +659,7 @@ def get_etf_information(etf, country, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -937,7 +772,7 @@ def get_etfs_overview(country, as_json=False, n_results=100):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        etfs = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
@@ -951,6 +786,8 @@ def get_etfs_overview(country, as_json=False, n_results=100):
 
     etfs = etfs[etfs['country'] == country]
 
+    currencies = etfs.drop_duplicates(subset='name').set_index('name')['currency'].to_dict()
+
     if country.lower() == 'united states':
         country= 'usa'
     elif country.lower() == 'united kingdom':
@@ -966,7 +803,7 @@ def get_etfs_overview(country, as_json=False, n_results=100):
 
     url = "https://www.investing.com/etfs/" + country.replace(' ', '-') + "-etfs?&issuer_filter=0"
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -1018,7 +855,7 @@ def get_etfs_overview(country, as_json=False, n_results=100):
                 "last": float(last.replace(',', '')),
                 "change": change,
                 "turnover": int(turnover),
-                "currency": etfs.loc[(etfs['name'] == name).idxmax(), 'currency']
+                "currency": currencies.get(name)
             }
 
             results.append(data)
@@ -1028,7 +865,7 @@ def get_etfs_overview(country, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -1072,7 +909,7 @@ def search_etfs(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'etfs.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        etfs = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        etfs = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0058: etfs file not found or errored.")
 
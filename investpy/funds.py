@@ -2,19 +2,18 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
-
-import json
-from random import randint
 
 import pandas as pd
 import pkg_resources
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.funds_data import funds_as_list, funds_as_dict, funds_as_df
 from .data.funds_data import fund_countries_as_list
@@ -238,104 +237,25 @@ def get_fund_recent_data(fund, country, as_json=False, order='ascending', interv
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
-    if funds is None:
-        raise IOError("ERR#0005: funds object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_fund_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    funds = funds[funds['country'] == unidecode(country.lower())]
-
     fund = fund.strip()
     fund = fund.lower()
 
-    if unidecode(fund) not in [unidecode(value.lower()) for value in funds['name'].tolist()]:
-        raise RuntimeError("ERR#0019: fund " + fund + " not found, check if it is correct.")
-
-    symbol = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'symbol']
-    id_ = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'id']
-    name = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'name']
-
-    fund_currency = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'currency']
-
-    header = symbol + ' Historical Data'
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0008: fund information unavailable or not found.")
-            
-            info = []
-        
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            fund_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            fund_close = float(info[1].replace(',', ''))
-            fund_open = float(info[2].replace(',', ''))
-            fund_high = float(info[3].replace(',', ''))
-            fund_low = float(info[4].replace(',', ''))
-
-            result.insert(len(result), Data(fund_date, fund_open, fund_high, fund_low,
-                                            fund_close, None, fund_currency, None))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
+    found_funds = lookup_instruments(resource_path, 'name', fund, country=country)
 
-        if as_json is True:
-            json_ = {'name': name,
-                     'recent':
-                         [value.fund_as_json() for value in result]
-                     }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.fund_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    if not found_funds:
+        raise RuntimeError("ERR#0019: fund " + fund + " not found, check if it is correct.")
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['fund'], found_funds[0],
+                                as_json=as_json, order=order, interval=interval)
 
 
-def get_fund_historical_data(fund, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_fund_historical_data(fund, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data from the introduced `fund` from Investing
     via Web Scraping on the introduced date range. The resulting data can it either be
@@ -352,6 +272,9 @@ def get_fund_historical_data(fund, country, from_date, to_date, as_json=False, o
             optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -402,6 +325,67 @@ def get_fund_historical_data(fund, country, from_date, to_date, as_json=False, o
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(fund, country, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['fund'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_fund_historical_data(fund, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced fund from Investing.com in the specified date range,
+    just like :func:`investpy.funds.get_fund_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        fund (:obj:`str`): name of the fund to retrieve recent historical data from.
+        country (:obj:`str`): name of the country from where the introduced fund is.
+        from_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, from where data is going to be retrieved.
+        to_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, until where data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        order (:obj:`str`, optional):
+            optional argument to define the order of the retrieved data (`ascending`, `asc` or `descending`, `desc`).
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified fund, in the same format as the data returned by
+            :func:`investpy.funds.get_fund_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: argument error.
+        IOError: funds object/file not found or unable to retrieve.
+        RuntimeError: introduced fund does not match any of the indexed ones.
+        ConnectionError: if GET requests does not return 200 status code.
+        IndexError: if fund information was unavailable or not found.
+
+    Examples:
+        >>> for data in investpy.iter_fund_historical_data(fund='bbva multiactivo conservador pp', country='spain', from_date='01/01/2010', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('fund.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(fund, country, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['fund'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(fund, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not fund:
         raise ValueError("ERR#0029: fund parameter is mandatory and must be a valid fund name.")
 
@@ -445,158 +429,23 @@ def get_fund_historical_data(fund, country, from_date, to_date, as_json=False, o
     if start_date >= end_date:
         raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
-    if funds is None:
-        raise IOError("ERR#0005: funds object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_fund_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    funds = funds[funds['country'] == unidecode(country.lower())]
-
     fund = fund.strip()
     fund = fund.lower()
 
-    if unidecode(fund) not in [unidecode(value.lower()) for value in funds['name'].tolist()]:
-        raise RuntimeError("ERR#0019: fund " + fund + " not found, check if it is correct.")
-
-    symbol = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'symbol']
-    id_ = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'id']
-    name = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'name']
-
-    fund_currency = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'currency']
-
-    final = list()
-
-    header = symbol + ' Historical Data'
-
-    for index in range(len(date_interval['intervals'])):
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-        
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0008: fund information unavailable or not found.")
-                else:
-                    data_flag = True
-
-                info = []
-        
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    fund_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                    
-                    fund_close = float(info[1].replace(',', ''))
-                    fund_open = float(info[2].replace(',', ''))
-                    fund_high = float(info[3].replace(',', ''))
-                    fund_low = float(info[4].replace(',', ''))
-
-                    result.insert(len(result), Data(fund_date, fund_open, fund_high, fund_low,
-                                                    fund_close, None, fund_currency, None))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
+    found_funds = lookup_instruments(resource_path, 'name', fund, country=country)
 
-                if as_json is True:
-                    json_ = {'name': name,
-                             'historical':
-                                 [value.fund_as_json() for value in result]
-                             }
-
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.fund_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    if not found_funds:
+        raise RuntimeError("ERR#0019: fund " + fund + " not found, check if it is correct.")
 
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_funds[0], start_date, end_date
 
 
 def get_fund_information(fund, country, as_json=False):
@@ -657,27 +506,22 @@ def get_fund_information(fund, country, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
-    if funds is None:
-        raise IOError("ERR#0005: funds object not found or unable to retrieve.")
-
     country = unidecode(country.strip().lower())
 
     if country not in get_fund_countries():
         raise RuntimeError("ERR#0034: country " + country + " not found, check if it is correct.")
 
-    funds = funds[funds['country'] == country]
-
     fund = unidecode(fund.strip().lower())
 
-    if fund not in [unidecode(value.lower()) for value in funds['name'].tolist()]:
+    found_funds = lookup_instruments(resource_path, 'name', fund, country=country)
+
+    if not found_funds:
         raise RuntimeError("ERR#0019: fund " + fund + " not found, check if it is correct.")
 
-    tag = funds.loc[(funds['name'].str.lower() == fund).idxmax(), 'tag']
+    tag = found_funds[0]['tag']
 
     url = "https://www.investing.com/funds/" + tag
 
@@ -689,7 +533,7 @@ def get_fund_information(fund, country, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -801,7 +645,7 @@ def get_funds_overview(country, as_json=False, n_results=100):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        funds = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
@@ -815,6 +659,8 @@ def get_funds_overview(country, as_json=False, n_results=100):
 
     funds = funds[funds['country'] == country]
 
+    currencies = funds.drop_duplicates(subset='name').set_index('name')['currency'].to_dict()
+
     if country.lower() == 'united states':
         country= 'usa'
     elif country.lower() == 'united kingdom':
@@ -830,7 +676,7 @@ def get_funds_overview(country, as_json=False, n_results=100):
 
     url = "https://www.investing.com/funds/" + country.replace(' ', '-') + "-funds?&issuer_filter=0"
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -884,7 +730,7 @@ def get_funds_overview(country, as_json=False, n_results=100):
                 "last": float(last.replace(',', '')),
                 "change": change,
                 "total_assets": int(total_assets),
-                "currency": funds.loc[(funds['name'] == name).idxmax(), 'currency']
+                "currency": currencies.get(name)
             }
 
             results.append(data)
@@ -894,7 +740,7 @@ def get_funds_overview(country, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -939,7 +785,7 @@ def search_funds(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'funds.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        funds = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        funds = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0057: funds file not found or errored.")
 
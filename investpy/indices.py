@@ -2,19 +2,18 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
-
-import json
-from random import randint
 
 import pandas as pd
 import pkg_resources
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.indices_data import indices_as_df, indices_as_list, indices_as_dict
 from .data.indices_data import index_countries_as_list
@@ -239,107 +238,25 @@ def get_index_recent_data(index, country, as_json=False, order='ascending', inte
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
-    if indices is None:
-        raise IOError("ERR#0037: indices not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_index_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    indices = indices[indices['country'] == unidecode(country.lower())]
-
     index = index.strip()
     index = index.lower()
 
-    if unidecode(index) not in [unidecode(value.lower()) for value in indices['name'].tolist()]:
-        raise RuntimeError("ERR#0045: index " + index + " not found, check if it is correct.")
-
-    full_name = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'full_name']
-    id_ = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'id']
-    name = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'name']
-
-    index_currency = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'currency']
-
-    header = full_name + ' Historical Data'
-
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0046: index information unavailable or not found.")
-
-            info = []
-        
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            index_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            index_close = float(info[1].replace(',', ''))
-            index_open = float(info[2].replace(',', ''))
-            index_high = float(info[3].replace(',', ''))
-            index_low = float(info[4].replace(',', ''))
-
-            index_volume = int(info[5])
-
-            result.insert(len(result), Data(index_date, index_open, index_high, index_low,
-                                            index_close, index_volume, index_currency, None))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
-
-        if as_json is True:
-            json_ = {'name': name,
-                     'recent':
-                         [value.index_as_json() for value in result]
-                     }
+    found_indices = lookup_instruments(resource_path, 'name', index, country=country)
 
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.index_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    if not found_indices:
+        raise RuntimeError("ERR#0045: index " + index + " not found, check if it is correct.")
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['index'], found_indices[0],
+                                as_json=as_json, order=order, interval=interval)
 
 
-def get_index_historical_data(index, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_index_historical_data(index, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data of the introduced `index` (from the specified country, note that both
     index and country should match since if the introduced index is not listed in the indices of that country, the
@@ -356,6 +273,9 @@ def get_index_historical_data(index, country, from_date, to_date, as_json=False,
             optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -408,6 +328,65 @@ def get_index_historical_data(index, country, from_date, to_date, as_json=False,
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(index, country, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['index'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_index_historical_data(index, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced index from Investing.com in the specified date range,
+    just like :func:`investpy.indices.get_index_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        index (:obj:`str`): name of the index to retrieve recent historical data from.
+        country (:obj:`str`): name of the country from where the index is.
+        from_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, from where data is going to be retrieved.
+        to_date (:obj:`str`): date as `str` formatted as `dd/mm/yyyy`, until where data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            optional argument to determine the format of the output data (:obj:`pandas.DataFrame` or :obj:`json`).
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified index, in the same format as the data returned by
+            :func:`investpy.indices.get_index_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: raised if there was an argument error.
+        IOError: raised if indices object/file was not found or unable to retrieve.
+        RuntimeError: raised if the introduced index does not match any of the indexed ones.
+        ConnectionError: raised if GET requests does not return 200 status code.
+        IndexError: raised if index information was unavailable or not found.
+
+    Examples:
+        >>> for data in investpy.iter_index_historical_data(index='ibex 35', country='spain', from_date='01/01/2018', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('index.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(index, country, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['index'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(index, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not index:
         raise ValueError("ERR#0047: index param is mandatory and should be a str.")
 
@@ -451,160 +430,23 @@ def get_index_historical_data(index, country, from_date, to_date, as_json=False,
     if interval not in ['Daily', 'Weekly', 'Monthly']:
         raise ValueError("ERR#0073: interval value should be a str type and it can just be either 'Daily', 'Weekly' or 'Monthly'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
-    if indices is None:
-        raise IOError("ERR#0037: indices not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_index_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    indices = indices[indices['country'] == unidecode(country.lower())]
-
     index = index.strip()
     index = index.lower()
 
-    if unidecode(index) not in [unidecode(value.lower()) for value in indices['name'].tolist()]:
+    found_indices = lookup_instruments(resource_path, 'name', index, country=country)
+
+    if not found_indices:
         raise RuntimeError("ERR#0045: index " + index + " not found, check if it is correct.")
 
-    full_name = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'full_name']
-    id_ = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'id']
-    name = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'name']
-
-    index_currency = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'currency']
-
-    final = list()
-
-    header = full_name + ' Historical Data'
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-        
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0046: index information unavailable or not found.")
-                else:
-                    data_flag = True
-
-                info = []
-        
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    index_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                    
-                    index_close = float(info[1].replace(',', ''))
-                    index_open = float(info[2].replace(',', ''))
-                    index_high = float(info[3].replace(',', ''))
-                    index_low = float(info[4].replace(',', ''))
-
-                    index_volume = int(info[5])
-
-                    result.insert(len(result), Data(index_date, index_open, index_high, index_low,
-                                                    index_close, index_volume, index_currency, None))
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {'name': name,
-                             'historical':
-                                 [value.index_as_json() for value in result]
-                             }
-
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.index_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_indices[0], start_date, end_date
 
 
 def get_index_information(index, country, as_json=False):
@@ -664,27 +506,22 @@ def get_index_information(index, country, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
-    if indices is None:
-        raise IOError("ERR#0037: indices not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_index_countries():
         raise ValueError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    indices = indices[indices['country'] == unidecode(country.lower())]
-
     index = index.strip()
     index = index.lower()
 
-    if unidecode(index) not in [unidecode(value.lower()) for value in indices['name'].tolist()]:
+    found_indices = lookup_instruments(resource_path, 'name', index, country=country)
+
+    if not found_indices:
         raise ValueError("ERR#0045: index " + index + " not found, check if it is correct.")
 
-    name = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'name']
-    tag = indices.loc[(indices['name'].str.lower() == index).idxmax(), 'tag']
+    name = found_indices[0]['name']
+    tag = found_indices[0]['tag']
 
     url = "https://www.investing.com/indices/" + tag
 
@@ -696,7 +533,7 @@ def get_index_information(index, country, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -806,7 +643,7 @@ def get_indices_overview(country, as_json=False, n_results=100):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        indices = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
@@ -820,6 +657,8 @@ def get_indices_overview(country, as_json=False, n_results=100):
 
     indices = indices[indices['country'] == country]
 
+    currencies = indices.drop_duplicates(subset='name').set_index('name')['currency'].to_dict()
+
     if country == 'united states':
         country= 'usa'
     elif country == 'united kingdom':
@@ -835,7 +674,7 @@ def get_indices_overview(country, as_json=False, n_results=100):
 
     url = "https://www.investing.com/indices/" + country.replace(' ', '-') + "-indices?&majorIndices=on&primarySectors=on&additionalIndices=on&otherIndices=on"
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -878,7 +717,7 @@ def get_indices_overview(country, as_json=False, n_results=100):
                 "low": float(low.replace(',', '')),
                 "change": pc,
                 "change_percentage": pcp,
-                "currency": indices.loc[(indices['name'] == name).idxmax(), 'currency']
+                "currency": currencies.get(name)
             }
 
             results.append(data)
@@ -888,7 +727,7 @@ def get_indices_overview(country, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -932,7 +771,7 @@ def search_indices(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', 'indices.csv'))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        indices = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0059: indices file not found or errored.")
 
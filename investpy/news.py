@@ -12,8 +12,8 @@ import pandas as pd
 
 from .utils import constant as cst
 from .utils.extra import random_user_agent
+from .utils.transport import get_transport
 
-import requests
 from lxml.html import fromstring
 
 
@@ -205,7 +205,7 @@ def economic_calendar(time_zone=None, time_filter='time_only', countries=None, i
                 'importance[]': def_importances
             })
 
-    req = requests.post(url, headers=headers, data=data)
+    req = get_transport().post(url, headers=headers, data=data)
 
     root = fromstring(req.json()['data'])
     table = root.xpath(".//tr")
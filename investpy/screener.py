@@ -1,7 +1,7 @@
-import requests
 import pandas as pd
 
 from .utils.extra import random_user_agent
+from .utils.transport import get_transport
 from .utils.screen_obj import ScreenerParams
 from .utils.screen_result_obj import ScreenResultObj
 
@@ -43,7 +43,7 @@ def screener(params, n_results=None, as_dataframe=True):
 
     url = 'https://www.investing.com/stock-screener/Service/SearchStocks'
 
-    req = requests.post(url, headers=head, data=params)
+    req = get_transport().post(url, headers=head, data=params)
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
 
@@ -1,13 +1,12 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
-import requests
-
 from unidecode import unidecode
 
 from .utils import constant as cst
 from .utils.search_obj import SearchObj
 from .utils.extra import random_user_agent
+from .utils.transport import get_transport
 
 
 def search_quotes(text, products=None, countries=None, n_results=None):
@@ -116,7 +115,7 @@ def search_quotes(text, products=None, countries=None, n_results=None):
     total_results = None
 
     while True:
-        req = requests.post(url, headers=head, data=params)
+        req = get_transport().post(url, headers=head, data=params)
 
         if req.status_code != 200:
             raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
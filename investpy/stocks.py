@@ -2,22 +2,21 @@
 # See LICENSE for details.
 
 from datetime import datetime, date
-import pytz
 
-from random import randint
-
-import json
 import pandas as pd
 
 import pkg_resources
 
-import requests
 from unidecode import unidecode
 from lxml.html import fromstring
 
 from .utils import constant as cst
 from .utils.extra import random_user_agent
-from .utils.data import Data
+from .utils.transport import get_transport
+from .utils.historical import HISTORICAL_SCHEMAS, retrieve_recent_data, retrieve_historical_data
+from .utils.historical import iter_historical_data
+from .utils.catalog import load_catalog, lookup_instruments
+from .utils.serializer import frame_to_records
 
 from .data.stocks_data import stocks_as_df, stocks_as_list, stocks_as_dict
 from .data.stocks_data import stock_countries_as_list
@@ -242,109 +241,25 @@ def get_stock_recent_data(stock, country, as_json=False, order='ascending', inte
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_stock_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    stocks = stocks[stocks['country'] == unidecode(country.lower())]
-
     stock = stock.strip()
     stock = stock.lower()
 
-    if unidecode(stock) not in [unidecode(value.lower()) for value in stocks['symbol'].tolist()]:
-        raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
-
-    symbol = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'symbol']
-    id_ = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'id']
-    name = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'name']
-
-    stock_currency = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'currency']
-
-    header = symbol + ' Historical Data'
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
 
-    params = {
-        "curr_id": id_,
-        "smlID": str(randint(1000000, 99999999)),
-        "header": header,
-        "interval_sec": interval,
-        "sort_col": "date",
-        "sort_ord": "DESC",
-        "action": "historical_data"
-    }
-
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-    }
-
-    url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-    req = requests.post(url, headers=head, data=params)
-
-    if req.status_code != 200:
-        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-    
-    result = list()
-
-    if path_:
-        for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                raise IndexError("ERR#0007: stock information unavailable or not found.")
-
-            info = []
-
-            for nested_ in elements_.xpath(".//td"):
-                info.append(nested_.get('data-real-value'))
-
-            stock_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-            
-            stock_close = float(info[1].replace(',', ''))
-            stock_open = float(info[2].replace(',', ''))
-            stock_high = float(info[3].replace(',', ''))
-            stock_low = float(info[4].replace(',', ''))
-
-            stock_volume = int(info[5])
-
-            result.insert(len(result),
-                          Data(stock_date, stock_open, stock_high, stock_low,
-                               stock_close, stock_volume, stock_currency, None))
-
-        if order in ['ascending', 'asc']:
-            result = result[::-1]
-        elif order in ['descending', 'desc']:
-            result = result
-
-        if as_json is True:
-            json_ = {
-                'name': name,
-                'recent':
-                    [value.stock_as_json() for value in result]
-            }
-
-            return json.dumps(json_, sort_keys=False)
-        elif as_json is False:
-            df = pd.DataFrame.from_records([value.stock_to_dict() for value in result])
-            df.set_index('Date', inplace=True)
+    if not found_stocks:
+        raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
 
-            return df
-    else:
-        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+    return retrieve_recent_data(HISTORICAL_SCHEMAS['stock'], found_stocks[0],
+                                as_json=as_json, order=order, interval=interval)
 
 
-def get_stock_historical_data(stock, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
+def get_stock_historical_data(stock, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', interval_source='remote'):
     """
     This function retrieves historical data from the introduced stock from Investing.com. So on, the historical data
     of the introduced stock from the specified country in the specified date range will be retrieved and returned as
@@ -363,6 +278,9 @@ def get_stock_historical_data(stock, country, from_date, to_date, as_json=False,
         order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
         interval (:obj:`str`, optional):
             value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            value to define whether the `Weekly` and `Monthly` historical data is retrieved from Investing.com, by default
+            `remote`, or resampled locally from the daily historical data, if `local`, saving a request per interval.
 
     Returns:
         :obj:`pandas.DataFrame` or :obj:`json`:
@@ -415,6 +333,66 @@ def get_stock_historical_data(stock, country, from_date, to_date, as_json=False,
 
     """
 
+    if interval_source not in ['remote', 'local']:
+        raise ValueError("ERR#0163: interval_source argument can just be either 'remote' or 'local', str type.")
+
+    instrument, start_date, end_date = _historical_data_instrument(stock, country, from_date, to_date, as_json, order, interval)
+
+    return retrieve_historical_data(HISTORICAL_SCHEMAS['stock'], instrument, from_date=start_date, to_date=end_date,
+                                    as_json=as_json, order=order, interval=interval,
+                                    interval_source=interval_source)
+
+
+def iter_stock_historical_data(stock, country, from_date, to_date, as_json=False, order='ascending', interval='Daily', batch_size=None):
+    """
+    This function retrieves the historical data of the introduced stock from Investing.com in the specified date range,
+    just like :func:`investpy.stocks.get_stock_historical_data`, but yielding it by parts as soon as each part is
+    retrieved and parsed, instead of returning it at once. So on, long date ranges can be processed part by part
+    (e.g. appending each part to a file or to a database table) while the rest of the data is being retrieved, keeping
+    just the current part in memory. Each part contains either the data of a date interval of at most 19 years, or
+    `batch_size` rows, if specified.
+
+    Args:
+        stock (:obj:`str`): symbol of the stock to retrieve historical data from.
+        country (:obj:`str`): name of the country from where the stock is.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        as_json (:obj:`bool`, optional):
+            to determine the format of the output data, either a :obj:`pandas.DataFrame` if False and a :obj:`json` if True.
+        order (:obj:`str`, optional): to define the order of the retrieved data which can either be ascending or descending.
+        interval (:obj:`str`, optional):
+            value to define the historical data interval to retrieve, by default `Daily`, but it can also be `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part (but the last one), or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the specified stock, in the same format as the data returned by
+            :func:`investpy.stocks.get_stock_historical_data`, ordered as specified by `order`.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+        IOError: raised if stocks object/file was not found or unable to retrieve.
+        RuntimeError: raised if the introduced stock/country was not found or did not match any of the existing ones.
+        ConnectionError: raised if connection to Investing.com could not be established.
+        IndexError: raised if stock historical data was unavailable or not found in Investing.com.
+
+    Examples:
+        >>> for data in investpy.iter_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2010', to_date='01/01/2019', batch_size=1000):
+        ...     data.to_csv('stock.csv', mode='a', header=False)
+
+    """
+
+    if batch_size is not None and (not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1):
+        raise ValueError("ERR#0158: batch_size argument needs to be an integer greater than 0.")
+
+    instrument, start_date, end_date = _historical_data_instrument(stock, country, from_date, to_date, as_json, order, interval)
+
+    return iter_historical_data(HISTORICAL_SCHEMAS['stock'], instrument, from_date=start_date, to_date=end_date,
+                                as_json=as_json, order=order, interval=interval, batch_size=batch_size)
+
+
+def _historical_data_instrument(stock, country, from_date, to_date, as_json=False, order='ascending', interval='Daily'):
     if not stock:
         raise ValueError("ERR#0013: stock parameter is mandatory and must be a valid stock symbol.")
 
@@ -458,164 +436,23 @@ def get_stock_historical_data(stock, country, from_date, to_date, as_json=False,
     if start_date >= end_date:
         raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-    date_interval = {
-        'intervals': [],
-    }
-
-    flag = True
-
-    while flag is True:
-        diff = end_date.year - start_date.year
-
-        if diff > 19:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': start_date.replace(year=start_date.year + 19).strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            start_date = start_date.replace(year=start_date.year + 19, day=start_date.day + 1)
-        else:
-            obj = {
-                'start': start_date.strftime('%m/%d/%Y'),
-                'end': end_date.strftime('%m/%d/%Y'),
-            }
-
-            date_interval['intervals'].append(obj)
-
-            flag = False
-
-    interval_limit = len(date_interval['intervals'])
-    interval_counter = 0
-
-    data_flag = False
-
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_stock_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    stocks = stocks[stocks['country'] == unidecode(country.lower())]
-
     stock = stock.strip()
     stock = stock.lower()
 
-    if unidecode(stock) not in [unidecode(value.lower()) for value in stocks['symbol'].tolist()]:
-        raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
-
-    symbol = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'symbol']
-    id_ = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'id']
-    name = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'name']
-
-    stock_currency = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'currency']
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
 
-    final = list()
-
-    header = symbol + ' Historical Data'
-
-    for index in range(len(date_interval['intervals'])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval['intervals'][index]['start'],
-            "end_date": date_interval['intervals'][index]['end'],
-            "interval_sec": interval,
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        if not req.text:
-            continue
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-
-        result = list()
+    if not found_stocks:
+        raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
 
-        if path_:
-            for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == 'No results found':
-                    if interval_counter < interval_limit:
-                        data_flag = False
-                    else:
-                        raise IndexError("ERR#0007: stock information unavailable or not found.")
-                else:
-                    data_flag = True
-                
-                info = []
-            
-                for nested_ in elements_.xpath(".//td"):
-                    info.append(nested_.get('data-real-value'))
-
-                if data_flag is True:
-                    stock_date = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                    
-                    stock_close = float(info[1].replace(',', ''))
-                    stock_open = float(info[2].replace(',', ''))
-                    stock_high = float(info[3].replace(',', ''))
-                    stock_low = float(info[4].replace(',', ''))
-
-                    stock_volume = int(info[5])
-
-                    result.insert(len(result),
-                                  Data(stock_date, stock_open, stock_high, stock_low,
-                                       stock_close, stock_volume, stock_currency, None))
-
-            if data_flag is True:
-                if order in ['ascending', 'asc']:
-                    result = result[::-1]
-                elif order in ['descending', 'desc']:
-                    result = result
-
-                if as_json is True:
-                    json_ = {
-                        'name': name,
-                        'historical':
-                            [value.stock_as_json() for value in result]
-                    }
-                    
-                    final.append(json_)
-                elif as_json is False:
-                    df = pd.DataFrame.from_records([value.stock_to_dict() for value in result])
-                    df.set_index('Date', inplace=True)
-
-                    final.append(df)
-
-        else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-    if as_json is True:
-        return json.dumps(final[0], sort_keys=False)
-    elif as_json is False:
-        return pd.concat(final)
+    return found_stocks[0], start_date, end_date
 
 
 def get_stock_company_profile(stock, country='spain', language='english'):
@@ -705,19 +542,14 @@ def get_stock_company_profile(stock, country='spain', language='english'):
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
-    stocks = stocks[stocks['country'] == country]
-
     stock = unidecode(stock.strip().lower())
 
-    if stock not in [unidecode(value.lower()) for value in stocks['symbol'].tolist()]:
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
+
+    if not found_stocks:
         raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
 
     company_profile = {
@@ -726,7 +558,7 @@ def get_stock_company_profile(stock, country='spain', language='english'):
     }
 
     if selected_source == 'Bolsa de Madrid':
-        isin = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'isin']
+        isin = found_stocks[0]['isin']
 
         url = "http://www.bolsamadrid.es/esp/aspx/Empresas/FichaValor.aspx?ISIN=" + isin
 
@@ -740,7 +572,7 @@ def get_stock_company_profile(stock, country='spain', language='english'):
             "Connection": "keep-alive",
         }
 
-        req = requests.get(url, headers=head)
+        req = get_transport().get(url, headers=head)
 
         if req.status_code != 200:
             raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -762,7 +594,7 @@ def get_stock_company_profile(stock, country='spain', language='english'):
         return company_profile
         
     elif selected_source == 'Investing':
-        tag = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'tag']
+        tag = found_stocks[0]['tag']
 
         url = "https://www.investing.com/equities/" + tag + "-company-profile"
 
@@ -776,7 +608,7 @@ def get_stock_company_profile(stock, country='spain', language='english'):
             "Connection": "keep-alive",
         }
 
-        req = requests.get(url, headers=head)
+        req = get_transport().get(url, headers=head)
 
         if req.status_code != 200:
             raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -832,25 +664,20 @@ def get_stock_dividends(stock, country):
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_stock_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    stocks = stocks[stocks['country'].str.lower() == unidecode(country.lower())]
-
     stock = unidecode(stock.strip().lower())
 
-    if stock not in [unidecode(value.strip().lower()) for value in stocks['symbol'].tolist()]:
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
+
+    if not found_stocks:
         raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
 
-    tag_ = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'tag']
+    tag_ = found_stocks[0]['tag']
 
     headers = {
         "User-Agent": random_user_agent(),
@@ -862,7 +689,7 @@ def get_stock_dividends(stock, country):
 
     url = 'https://www.investing.com/equities/' + str(tag_) + '-dividends'
 
-    req = requests.get(url=url, headers=headers)
+    req = get_transport().get(url=url, headers=headers)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -933,7 +760,7 @@ def get_stock_dividends(stock, country):
 
                 url = 'https://www.investing.com/equities/MoreDividendsHistory'
 
-                req = requests.post(url=url, headers=headers, params=params)
+                req = get_transport().post(url=url, headers=headers, params=params)
 
                 if req.status_code != 200:
                     raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -1049,26 +876,21 @@ def get_stock_information(stock, country, as_json=False):
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_stock_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    stocks = stocks[stocks['country'] == unidecode(country.lower())]
-
     stock = stock.strip()
 
-    if unidecode(stock.lower()) not in [unidecode(value.lower()) for value in stocks['symbol'].tolist()]:
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
+
+    if not found_stocks:
         raise RuntimeError("ERR#0018: stock " + stock.lower() + " not found, check if it is correct.")
 
-    tag = stocks.loc[(stocks['symbol'].str.lower() == stock.lower()).idxmax(), 'tag']
-    stock = stocks.loc[(stocks['symbol'].str.lower() == stock.lower()).idxmax(), 'symbol']
+    tag = found_stocks[0]['tag']
+    stock = found_stocks[0]['symbol']
 
     url = "https://www.investing.com/equities/" + tag
 
@@ -1080,7 +902,7 @@ def get_stock_information(stock, country, as_json=False):
         "Connection": "keep-alive",
     }
 
-    req = requests.get(url, headers=head)
+    req = get_transport().get(url, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -1186,21 +1008,14 @@ def get_stocks_overview(country, as_json=False, n_results=100):
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     country = unidecode(country.lower())
 
     if country not in get_stock_countries():
         raise RuntimeError('ERR#0025: specified country value is not valid.')
 
-    stocks = stocks[stocks['country'] == country]
-
     head = {
         "User-Agent": random_user_agent(),
         "X-Requested-With": "XMLHttpRequest",
@@ -1219,7 +1034,7 @@ def get_stocks_overview(country, as_json=False, n_results=100):
 
     url = "https://www.investing.com/equities/StocksFilter"
 
-    req = requests.get(url, params=params, headers=head)
+    req = get_transport().get(url, params=params, headers=head)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -1261,17 +1076,20 @@ def get_stocks_overview(country, as_json=False, n_results=100):
             elif turnover.__contains__('M'):
                 turnover = float(turnover.replace('M', '').replace(',', '')) * 1e6
 
+            found_stocks = lookup_instruments(resource_path, 'name', name, country=country, keep_default_na=False)
+            found_stock = found_stocks[0] if found_stocks else dict()
+
             data = {
                 "country": country_check,
                 "name": name,
-                "symbol": stocks.loc[(stocks['name'] == name).idxmax(), 'symbol'],
+                "symbol": found_stock.get('symbol'),
                 "last": float(last.replace(',', '')),
                 "high": float(high.replace(',', '')),
                 "low": float(low.replace(',', '')),
                 "change": pc,
                 "change_percentage": pcp,
                 "turnover": int(turnover),
-                "currency": stocks.loc[(stocks['name'] == name).idxmax(), 'currency']
+                "currency": found_stock.get('currency')
             }
 
             results.append(data)
@@ -1281,7 +1099,7 @@ def get_stocks_overview(country, as_json=False, n_results=100):
     df = pd.DataFrame(results)
 
     if as_json:
-        return json.loads(df.to_json(orient='records'))
+        return frame_to_records(df)
     else:
         return df
 
@@ -1368,25 +1186,20 @@ def get_stock_financial_summary(stock, country, summary_type='income_statement',
 
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
-    else:
+    if not pkg_resources.resource_exists(resource_package, resource_path):
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
-    if stocks is None:
-        raise IOError("ERR#0001: stocks object not found or unable to retrieve.")
-
     if unidecode(country.lower()) not in get_stock_countries():
         raise RuntimeError("ERR#0034: country " + country.lower() + " not found, check if it is correct.")
 
-    stocks = stocks[stocks['country'] == unidecode(country.lower())]
-
     stock = unidecode(stock.strip().lower())
 
-    if stock not in [unidecode(value.strip().lower()) for value in stocks['symbol'].tolist()]:
+    found_stocks = lookup_instruments(resource_path, 'symbol', stock, country=country, keep_default_na=False)
+
+    if not found_stocks:
         raise RuntimeError("ERR#0018: stock " + stock + " not found, check if it is correct.")
 
-    id_ = stocks.loc[(stocks['symbol'].str.lower() == stock).idxmax(), 'id']
+    id_ = found_stocks[0]['id']
 
     headers = {
         "User-Agent": random_user_agent(),
@@ -1406,7 +1219,7 @@ def get_stock_financial_summary(stock, country, summary_type='income_statement',
 
     url = 'https://www.investing.com/instruments/Financials/changesummaryreporttypeajax'
     
-    req = requests.get(url, params=params, headers=headers)
+    req = get_transport().get(url, params=params, headers=headers)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -1480,7 +1293,7 @@ def search_stocks(by, value):
     resource_package = 'investpy'
     resource_path = '/'.join((('resources', 'stocks.csv')))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        stocks = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path), keep_default_na=False)
+        stocks = load_catalog(resource_path, keep_default_na=False)
     else:
         raise FileNotFoundError("ERR#0056: stocks file not found or errored.")
 
@@ -1,16 +1,22 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
+import numpy as np
 import pandas as pd
 
 import pkg_resources
 from unidecode import unidecode
 
-import requests
 from lxml.html import fromstring
 
 from .utils import constant as cst
 from .utils.extra import random_user_agent, resource_to_data
+from .utils.transport import get_transport
+from .utils.catalog import lookup_instruments
+from .utils.indicators import MOVING_AVERAGE_PERIODS, PIVOT_LEVELS, PIVOT_METHODS, TECHNICAL_INDICATORS, \
+    compact_rows, moving_averages_matrix, pivot_points_matrix, stack_columns, technical_indicators_matrix
+from .utils.panel import PricePanel
+from .utils.resample import resample_ohlcv
 
 
 def technical_indicators(name, country, product_type, interval='daily'):
@@ -107,11 +113,11 @@ def technical_indicators(name, country, product_type, interval='daily'):
 
             if country not in data['country'].tolist():
                 raise ValueError("ERR#0124: introduced country does not exist or is not available.")
-
-            data = data[data['country'] == country]
         else:
             if product_type != 'commodity':
                 raise ValueError("ERR#0123: country parameter is required with the introduced product_type.")
+    else:
+        country = None
 
     if product_type == 'stock':
         check = 'symbol'
@@ -120,10 +126,12 @@ def technical_indicators(name, country, product_type, interval='daily'):
 
     name = unidecode(name.lower().strip())
 
-    if name not in [unidecode(value.lower()) for value in data[check].tolist()]:
+    found_products = lookup_instruments('/'.join(('resources', cst.PRODUCT_TYPE_FILES[product_type])), check, name, country=country)
+
+    if not found_products:
         raise ValueError("ERR#0122: introduced name does not exist in the introduced country (if required).")
 
-    product_id = data.loc[(data[check].str.lower() == name).idxmax(), 'id']
+    product_id = found_products[0]['id']
 
     data_values = {
         'pairID': product_id,
@@ -141,7 +149,7 @@ def technical_indicators(name, country, product_type, interval='daily'):
 
     url = "https://www.investing.com/instruments/Service/GetTechincalData"
 
-    req = requests.post(url, headers=headers, data=data_values)
+    req = get_transport().post(url, headers=headers, data=data_values)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -257,11 +265,11 @@ def moving_averages(name, country, product_type, interval='daily'):
 
             if country not in data['country'].tolist():
                 raise ValueError("ERR#0124: introduced country does not exist or is not available.")
-
-            data = data[data['country'] == country]
         else:
             if product_type != 'commodity':
                 raise ValueError("ERR#0123: country parameter is required with the introduced product_type.")
+    else:
+        country = None
 
     if product_type == 'stock':
         check = 'symbol'
@@ -270,10 +278,12 @@ def moving_averages(name, country, product_type, interval='daily'):
 
     name = unidecode(name.lower().strip())
 
-    if name not in [unidecode(value.lower()) for value in data[check].tolist()]:
+    found_products = lookup_instruments('/'.join(('resources', cst.PRODUCT_TYPE_FILES[product_type])), check, name, country=country)
+
+    if not found_products:
         raise ValueError("ERR#0122: introduced name does not exist in the introduced country (if required).")
 
-    product_id = data.loc[(data[check].str.lower() == name).idxmax(), 'id']
+    product_id = found_products[0]['id']
 
     data_values = {
         'pairID': product_id,
@@ -291,7 +301,7 @@ def moving_averages(name, country, product_type, interval='daily'):
 
     url = "https://www.investing.com/instruments/Service/GetTechincalData"
 
-    req = requests.post(url, headers=headers, data=data_values)
+    req = get_transport().post(url, headers=headers, data=data_values)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -411,11 +421,11 @@ def pivot_points(name, country, product_type, interval='daily'):
 
             if country not in data['country'].tolist():
                 raise ValueError("ERR#0124: introduced country does not exist or is not available.")
-
-            data = data[data['country'] == country]
         else:
             if product_type != 'commodity':
                 raise ValueError("ERR#0123: country parameter is required with the introduced product_type.")
+    else:
+        country = None
 
     if product_type == 'stock':
         check = 'symbol'
@@ -424,10 +434,12 @@ def pivot_points(name, country, product_type, interval='daily'):
 
     name = unidecode(name.lower().strip())
 
-    if name not in [unidecode(value.lower()) for value in data[check].tolist()]:
+    found_products = lookup_instruments('/'.join(('resources', cst.PRODUCT_TYPE_FILES[product_type])), check, name, country=country)
+
+    if not found_products:
         raise ValueError("ERR#0122: introduced name does not exist in the introduced country (if required).")
 
-    product_id = data.loc[(data[check].str.lower() == name).idxmax(), 'id']
+    product_id = found_products[0]['id']
 
     data_values = {
         'pairID': product_id,
@@ -445,7 +457,7 @@ def pivot_points(name, country, product_type, interval='daily'):
 
     url = "https://www.investing.com/instruments/Service/GetTechincalData"
 
-    req = requests.post(url, headers=headers, data=data_values)
+    req = get_transport().post(url, headers=headers, data=data_values)
 
     if req.status_code != 200:
         raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -479,3 +491,275 @@ def pivot_points(name, country, product_type, interval='daily'):
         pivot_pts.append(pivot_pt)
 
     return pd.DataFrame(pivot_pts)
+
+
+def compute_technical_indicators(data):
+    """
+    This function calculates locally the technical indicators table that :func:`technical_indicators` retrieves from
+    Investing.com, i.e. RSI(14), STOCH(9,6), STOCHRSI(14), MACD(12,26), ADX(14), Williams %R, CCI(14), ATR(14),
+    Highs/Lows(14), Ultimate Oscillator, ROC and Bull/Bear Power(13), along with their signals, labelled the same way,
+    from the historical data of the financial product instead of sending a request to Investing.com. Several financial
+    products can be introduced at once (e.g. as returned by :func:`investpy.get_historical_data_bulk`), whose
+    indicators are calculated at once as a 2-D instruments × time array. The interval of the calculations is the
+    interval of the introduced historical data, which should contain a couple hundred periods so that the values
+    match the ones calculated by Investing.com.
+
+    Args:
+        data (:obj:`pandas.DataFrame`, :obj:`dict` or :obj:`investpy.utils.panel.PricePanel`):
+            historical data of the financial product as returned by the `get_*_historical_data` functions (i.e. with
+            the `High`, `Low` and `Close` columns), a :obj:`dict` whose values are the historical data of several
+            financial products, or a price panel with the historical data of several financial products.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`dict` - technical_indicators:
+            The resulting :obj:`pandas.DataFrame` contains the table with the technical indicators, which looks like
+            the one returned by :func:`technical_indicators`, while both the value and the signal are missing if
+            there is not enough data to calculate the indicator::
+
+                 technical_indicator | value | signal 
+                ---------------------|-------|--------
+                 xxxxxxxxxxxxxxxxxxx | xxxxx | xxxxxx
+
+            If a :obj:`dict` was introduced, a :obj:`dict` with the same keys and a table per financial product is
+            returned, while if a price panel was introduced, its keys are the ids of the panel.
+
+    Raises:
+        ValueError: raised if the introduced data is not valid.
+
+    Examples:
+        >>> data = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2019',
+        ...                                           to_date='01/01/2020')
+        >>> table = investpy.compute_technical_indicators(data)
+        >>> table['technical_indicator'].tolist() == investpy.technical_indicators(name='bbva', country='spain',
+        ...                                                                         product_type='stock')['technical_indicator'].tolist()
+        True
+
+    """
+
+    keys, (high, low, close) = _local_data(data, ['High', 'Low', 'Close'])
+
+    values, signals = technical_indicators_matrix(high, low, close)
+
+    tables = dict()
+
+    for row, key in enumerate(keys):
+        tables[key] = pd.DataFrame({
+            'technical_indicator': TECHNICAL_INDICATORS,
+            'value': values[row],
+            'signal': signals[row]
+        })
+
+    return tables if keys != [None] else tables[None]
+
+
+def compute_moving_averages(data, as_matrix=False):
+    """
+    This function calculates locally the moving averages table that :func:`moving_averages` retrieves from
+    Investing.com, i.e. the simple and exponential moving averages of 5, 10, 20, 50, 100 and 200 periods along with
+    their signals, labelled the same way, from the historical data of the financial product instead of sending a
+    request to Investing.com. Several financial products can be introduced at once, whose moving averages are
+    calculated at once as a 2-D instruments × time array. The interval of the calculations is the interval of the
+    introduced historical data.
+
+    Args:
+        data (:obj:`pandas.DataFrame`, :obj:`dict` or :obj:`investpy.utils.panel.PricePanel`):
+            historical data of the financial product as returned by the `get_*_historical_data` functions (i.e. with
+            the `Close` column), a :obj:`dict` whose values are the historical data of several financial products,
+            or a price panel with the historical data of several financial products.
+        as_matrix (:obj:`bool`, optional):
+            whether to return a single wide :obj:`pandas.DataFrame` with a row per financial product, so that many
+            financial products can be screened at once, instead of a table per financial product.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`dict` - moving_averages:
+            The resulting :obj:`pandas.DataFrame` contains the table with the moving averages, which looks like the
+            one returned by :func:`moving_averages`, while both the values and the signals are missing if there is
+            not enough data to calculate the moving average::
+
+                 period | sma_value | sma_signal | ema_value | ema_signal 
+                --------|-----------|------------|-----------|------------
+                 xxxxxx | xxxxxxxxx | xxxxxxxxxx | xxxxxxxxx | xxxxxxxxxx 
+
+            If a :obj:`dict` was introduced, a :obj:`dict` with the same keys and a table per financial product is
+            returned, while if a price panel was introduced, its keys are the ids of the panel. If `as_matrix` is
+            True, a single :obj:`pandas.DataFrame` indexed by those keys is returned instead, whose columns are the
+            `sma_value`, `sma_signal`, `ema_value` and `ema_signal` of every period::
+
+                     || sma_value         | ... | ema_signal
+                     || 5    | ... | 200  | ... | 5    | ... | 200
+                -----||------|-----|------|-----|------|-----|-----
+                 xxx || xxxx | ... | xxxx | ... | xxxx | ... | xxxx
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid.
+
+    Examples:
+        >>> data, errors = investpy.get_historical_data_bulk([('stock', 'bbva', 'spain'), ('stock', 'san', 'spain')],
+        ...                                                  from_date='01/01/2019', to_date='01/01/2020')
+        >>> matrix = investpy.compute_moving_averages(data, as_matrix=True)
+        >>> buy = matrix[(matrix['sma_signal'] == 'buy').all(axis=1)].index
+
+    """
+
+    if not isinstance(as_matrix, bool):
+        raise ValueError("ERR#0173: as_matrix argument can just be True or False, bool type.")
+
+    keys, (close,) = _local_data(data, ['Close'])
+
+    moving_averages = moving_averages_matrix(close, MOVING_AVERAGE_PERIODS)
+
+    periods = [str(period) for period in MOVING_AVERAGE_PERIODS]
+
+    if as_matrix is True:
+        columns = pd.MultiIndex.from_product([list(moving_averages.keys()), periods])
+
+        values = np.empty((len(keys), len(columns)), dtype=object)
+        for position, array in enumerate(moving_averages.values()):
+            values[:, position * len(periods):(position + 1) * len(periods)] = array
+
+        matrix = pd.DataFrame(values, columns=columns, index=pd.Index(keys) if keys != [None] else None)
+
+        for column in ['sma_value', 'ema_value']:
+            matrix[column] = matrix[column].astype(np.float64)
+
+        return matrix
+
+    tables = dict()
+
+    for row, key in enumerate(keys):
+        tables[key] = pd.DataFrame({
+            'period': periods,
+            'sma_value': moving_averages['sma_value'][row],
+            'sma_signal': moving_averages['sma_signal'][row],
+            'ema_value': moving_averages['ema_value'][row],
+            'ema_signal': moving_averages['ema_signal'][row]
+        })
+
+    return tables if keys != [None] else tables[None]
+
+
+def compute_pivot_points(data, interval='daily'):
+    """
+    This function calculates locally the pivot points table that :func:`pivot_points` retrieves from Investing.com,
+    i.e. the Classic, Fibonacci, Camarilla, Woodie's and DeMark's pivot points along with their support and resistance
+    levels, from the historical data of the financial product instead of sending a request to Investing.com. The pivot
+    points are calculated from the open, high, low and close prices of the last period of the historical data, whose
+    daily bars are resampled into weekly or monthly ones if required, so that the data should end on the last
+    complete period (e.g. yesterday for daily pivot points). Several financial products can be introduced at once,
+    whose pivot points are calculated at once.
+
+    Args:
+        data (:obj:`pandas.DataFrame`, :obj:`dict` or :obj:`investpy.utils.panel.PricePanel`):
+            daily historical data of the financial product as returned by the `get_*_historical_data` functions (i.e.
+            with the `Open`, `High`, `Low` and `Close` columns), a :obj:`dict` whose values are the daily historical
+            data of several financial products, or a price panel with the historical data of several financial
+            products.
+        interval (:obj:`str`, optional):
+            time interval of the resulting calculations, available values are: `daily`, `weekly` and `monthly`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`dict` - pivot_points:
+            The resulting :obj:`pandas.DataFrame` contains the table with the pivot points, which looks like the one
+            returned by :func:`pivot_points`::
+
+                 name | s3 | s2 | s1 | pivot_points | r1 | r2 | r3 
+                ------|----|----|----|--------------|----|----|----
+                 xxxx | xx | xx | xx | xxxxxxxxxxxx | xx | xx | xx 
+
+            If a :obj:`dict` was introduced, a :obj:`dict` with the same keys and a table per financial product is
+            returned, while if a price panel was introduced, its keys are the ids of the panel.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid.
+
+    Examples:
+        >>> data = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2020',
+        ...                                           to_date='31/03/2020')
+        >>> investpy.compute_pivot_points(data, interval='monthly')['name'].tolist()
+        ['Classic', 'Fibonacci', 'Camarilla', "Woodie's", "DeMark's"]
+
+    """
+
+    if interval not in ['daily', 'weekly', 'monthly']:
+        raise ValueError("ERR#0175: interval value should be a str type and it can just be either 'daily', 'weekly' or "
+                         "'monthly'.")
+
+    keys, columns, groups = _local_columns(data, ['Open', 'High', 'Low', 'Close'])
+
+    periods = resample_ohlcv(columns, interval.capitalize(), groups=groups)
+
+    last = np.full((len(keys), 4), np.nan)
+
+    if len(periods['group']) > 0:
+        ends = np.flatnonzero(np.append(periods['group'][1:] != periods['group'][:-1], True))
+        last[periods['group'][ends]] = np.stack([periods[field][ends] for field in ['open', 'high', 'low', 'close']],
+                                                axis=1)
+
+    pivot_points = pivot_points_matrix(*last.T)
+
+    tables = dict()
+
+    for row, key in enumerate(keys):
+        table = pd.DataFrame(pivot_points[row], columns=PIVOT_LEVELS)
+        table.insert(0, 'name', PIVOT_METHODS)
+
+        tables[key] = table
+
+    return tables if keys != [None] else tables[None]
+
+
+def _local_frames(data, columns):
+    # validates the historical data of every financial product, sorted in ascending order, along with their keys
+    frames = data if isinstance(data, dict) else {None: data}
+
+    for frame in frames.values():
+        if not isinstance(frame, pd.DataFrame) or not set(columns).issubset(frame.columns):
+            raise ValueError("ERR#0170: data must be a pandas.DataFrame with the " + ", ".join(columns) + " columns, as "
+                             "returned by the historical data functions, a dict of them or a PricePanel.")
+
+    ordered = [frame.sort_index() if not frame.index.is_monotonic_increasing else frame for frame in frames.values()]
+
+    return list(frames.keys()), ordered
+
+
+def _local_columns(data, columns):
+    # concatenates the historical data of every financial product as the columns expected by resample_ohlcv, along
+    # with the position of the financial product of every row
+    if isinstance(data, PricePanel):
+        values = [data.array(column.lower()) for column in columns]
+
+        present = np.ones(values[0].shape, dtype=bool)
+        for array in values:
+            present &= ~np.isnan(array)
+
+        groups, positions = np.nonzero(present.T)
+
+        concatenated = {'date': np.asarray(data.days)[positions]}
+        concatenated.update({column.lower(): array[positions, groups] for column, array in zip(columns, values)})
+
+        return list(data.ids), concatenated, groups
+
+    keys, frames = _local_frames(data, columns)
+
+    concatenated = {'date': np.concatenate([np.zeros(0, dtype=np.int64)] + [
+        frame.index.to_numpy().astype('datetime64[D]').astype(np.int64) for frame in frames
+    ])}
+    concatenated.update({column.lower(): np.concatenate([np.zeros(0)] + [frame[column].to_numpy(dtype=np.float64)
+                                                                          for frame in frames])
+                         for column in columns})
+
+    groups = np.repeat(np.arange(len(frames)), [len(frame) for frame in frames])
+
+    return keys, concatenated, groups
+
+
+def _local_data(data, columns):
+    # stacks the introduced columns of the historical data of every financial product as 2-D instruments x time
+    # arrays, aligned on their last value, along with the keys of the financial products (None for a single one)
+    if isinstance(data, PricePanel):
+        arrays = compact_rows([data.array(column.lower()).T for column in columns])
+        return list(data.ids), arrays
+
+    keys, frames = _local_frames(data, columns)
+
+    return keys, [stack_columns(frames, column) for column in columns]
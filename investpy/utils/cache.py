@@ -0,0 +1,211 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import re
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .transport import request_key, response_headers, build_response
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# endpoint: (pattern of the URL of its requests, default time to live in seconds of its responses)
+CACHE_ENDPOINTS = {
+    'company_profile': (r'-company-profile$|bolsamadrid\.es/', 7 * DAY),
+    'financial_summary': (r'/changesummaryreporttypeajax$', DAY),
+    'dividends': (r'-dividends$|/MoreDividendsHistory$', DAY),
+    'technical': (r'/GetTechincalData$', MINUTE),
+    'overview': (r'/StocksFilter$|/ChangeCurrency$|/LoadCryptoCurrencies$|/crypto/currencies$|'
+                 r'-(funds|etfs|indices|government-bonds|certificates)$', 5 * MINUTE),
+    # the URLs of the rest of the endpoints under the same paths are excluded, so that every URL has a single endpoint
+    'information': (r'^https?://www\.investing\.com/(equities|funds|etfs|indices|currencies|rates-bonds|commodities|'
+                    r'crypto|certificates)/(?!(StocksFilter|MoreDividendsHistory|currencies)$)'
+                    r'(?![^/]*-(company-profile|dividends|funds|etfs|indices|government-bonds|certificates)$)[^/]+$',
+                    5 * MINUTE),
+}
+
+
+class ResponseCache(object):
+    """
+    This class is used to cache the responses from Investing.com in a SQLite database on disk, which can be shared by
+    several processes, so that the same request (e.g. the information or the company profile of the same stock) is
+    just sent once while its cached response is fresh. Each request is identified by its method, URL and parameters,
+    but for the random `smlID` (see :func:`investpy.utils.transport.request_key`). The responses are kept for a time
+    to live which depends on the endpoint of the request, being long for company profiles, financial summaries and
+    dividends, and short for overviews, information and technical indicators. The responses of any other endpoint
+    (e.g. historical data) are not cached.
+
+    Args:
+        path (:obj:`str`): path to the SQLite database file, created if it does not exist.
+        ttls (:obj:`dict`, optional):
+            time to live in seconds of the responses of each endpoint, which overwrites the default one, where the
+            available endpoints are: `company_profile`, `financial_summary`, `dividends`, `technical`, `overview` and
+            `information`. A time to live of 0 disables the cache for that endpoint.
+
+    Attributes:
+        path (:obj:`str`): path to the SQLite database file.
+        ttls (:obj:`dict`): time to live in seconds of the responses of each endpoint.
+        stats (:obj:`dict`):
+            cache `hits` and `misses` of the current process, both in total and per endpoint (under `endpoints`).
+
+    Raises:
+        ValueError: raised if any of the introduced parameters is not valid or errored.
+
+    Examples:
+        >>> cache = investpy.utils.cache.ResponseCache('investpy.sqlite', ttls={'technical': 30})
+        >>> investpy.utils.transport.configure_transport(cache=cache)
+
+    """
+
+    def __init__(self, path, ttls=None):
+        if not path or not isinstance(path, str):
+            raise ValueError("ERR#0154: path argument needs to be a str.")
+
+        ttls = ttls if ttls is not None else dict()
+
+        if not isinstance(ttls, dict):
+            raise ValueError("ERR#0155: ttls argument needs to be a dict of endpoint: seconds.")
+
+        for endpoint, ttl in ttls.items():
+            if endpoint not in CACHE_ENDPOINTS.keys():
+                raise ValueError("ERR#0155: ttls argument needs to be a dict of endpoint: seconds, where the available "
+                                 "endpoints are: " + ', '.join(CACHE_ENDPOINTS.keys()))
+
+            if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl < 0:
+                raise ValueError("ERR#0155: ttls argument needs to be a dict of endpoint: seconds, where the seconds "
+                                 "are numbers greater or equal than 0.")
+
+        self.path = path
+        self.ttls = {endpoint: ttls.get(endpoint, ttl) for endpoint, (_, ttl) in CACHE_ENDPOINTS.items()}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'endpoints': {endpoint: {'hits': 0, 'misses': 0} for endpoint in CACHE_ENDPOINTS.keys()},
+        }
+
+        self._patterns = {endpoint: re.compile(pattern) for endpoint, (pattern, _) in CACHE_ENDPOINTS.items()}
+        self._lock = threading.Lock()
+
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, endpoint TEXT, "
+                               "expires REAL, status_code INTEGER, headers TEXT, encoding TEXT, content BLOB)")
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _count(self, endpoint, key):
+        with self._lock:
+            self.stats[key] += 1
+            self.stats['endpoints'][endpoint][key] += 1
+
+    def endpoint(self, url):
+        """
+        This method returns the endpoint of the introduced URL whose responses are cached, if any.
+
+        Args:
+            url (:obj:`str`): URL of the request.
+
+        Returns:
+            :obj:`str` - endpoint:
+                The endpoint of the introduced URL, or None if its responses are not cached.
+
+        """
+
+        url = url.split('?')[0].rstrip('/')
+
+        for endpoint, pattern in self._patterns.items():
+            if pattern.search(url):
+                return endpoint if self.ttls[endpoint] > 0 else None
+
+        return None
+
+    def get(self, method, url, params=None, data=None):
+        """
+        This method retrieves the cached response of the introduced request, if it is cached and still fresh.
+
+        Args:
+            method (:obj:`str`): HTTP method of the request, i.e. `GET` or `POST`.
+            url (:obj:`str`): URL of the request.
+            params (:obj:`dict`, optional): query parameters of the request.
+            data (:obj:`dict` or :obj:`str`, optional): form data of the request.
+
+        Returns:
+            :obj:`requests.Response` - response:
+                The cached response of the introduced request, or None if it is not cached or expired.
+
+        """
+
+        endpoint = self.endpoint(url)
+
+        if endpoint is None:
+            return None
+
+        with self._connect() as connection:
+            row = connection.execute("SELECT status_code, headers, encoding, content FROM responses "
+                                     "WHERE key = ? AND expires > ?",
+                                     (request_key(method, url, params, data), time.time())).fetchone()
+
+        if row is None:
+            self._count(endpoint, 'misses')
+            return None
+
+        self._count(endpoint, 'hits')
+
+        return build_response(status_code=row[0], headers=json.loads(row[1]), encoding=row[2], content=row[3], url=url)
+
+    def set(self, method, url, response, params=None, data=None):
+        """
+        This method caches the introduced response of the introduced request, if the responses of its endpoint are
+        cached, for the time to live of its endpoint.
+
+        Args:
+            method (:obj:`str`): HTTP method of the request, i.e. `GET` or `POST`.
+            url (:obj:`str`): URL of the request.
+            response (:obj:`requests.Response`): response of the request.
+            params (:obj:`dict`, optional): query parameters of the request.
+            data (:obj:`dict` or :obj:`str`, optional): form data of the request.
+
+        """
+
+        endpoint = self.endpoint(url)
+
+        if endpoint is None:
+            return
+
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (request_key(method, url, params, data), endpoint, time.time() + self.ttls[endpoint],
+                                response.status_code, json.dumps(response_headers(response)), response.encoding,
+                                sqlite3.Binary(response.content)))
+
+    def purge(self):
+        """
+        This method removes the expired responses from the cache.
+        """
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+
+    def clear(self):
+        """
+        This method removes every response from the cache.
+        """
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
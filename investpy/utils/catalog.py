@@ -0,0 +1,273 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import threading
+
+import pandas as pd
+import pkg_resources
+
+from unidecode import unidecode
+
+from . import constant as cst
+from .catalog_binary import read_compiled_catalog
+
+
+_CATALOGS = dict()
+_INDICES = dict()
+_LOCK = threading.RLock()
+
+
+def load_catalog(resource_path, keep_default_na=True):
+    """
+    This function loads the static data file located in the introduced resource path (relative to the investpy
+    package, e.g. `resources/stocks.csv`) just once per process, so that every later call is served from memory
+    instead of parsing the file again. Since the same table is shared by every function of investpy, the cached
+    :obj:`pandas.DataFrame` is never handed out; a copy of it is returned instead, so that callers are free to
+    filter, drop or modify the returned data without altering the shared catalog. If the static data file has been
+    compiled into a binary catalog (see :func:`investpy.utils.catalog_binary.compile_catalogs`), the binary catalog
+    is memory-mapped instead of parsing the static data file, which is noticeably faster.
+
+    Args:
+        resource_path (:obj:`str`): path to the static data file, relative to the investpy package.
+        keep_default_na (:obj:`bool`, optional):
+            whether the default NaN values should be parsed as NaN or kept as str, as in :obj:`pandas.read_csv`.
+
+    Returns:
+        :obj:`pandas.DataFrame` - data:
+            This function returns a :obj:`pandas.DataFrame` object with all the static file's data, which is a
+            private copy of the cached catalog.
+
+    Raises:
+        FileNotFoundError: raised if the static data file was not found.
+
+    """
+
+    key = (resource_path, keep_default_na)
+
+    with _LOCK:
+        data = _CATALOGS.get(key)
+
+        if data is None:
+            if not pkg_resources.resource_exists('investpy', resource_path):
+                raise FileNotFoundError("ERR#0115: data file not found or errored.")
+
+            data = read_compiled_catalog(resource_path, keep_default_na=keep_default_na)
+
+            if data is None:
+                data = pd.read_csv(pkg_resources.resource_filename('investpy', resource_path),
+                                   keep_default_na=keep_default_na)
+
+            _CATALOGS[key] = data
+
+    return data.copy()
+
+
+def invalidate_catalogs(resource_path=None):
+    """
+    This function drops the cached catalogs, so that the next call to :func:`load_catalog` parses the static
+    data file again. If a resource path is introduced, just the catalog loaded from that file will be dropped,
+    otherwise every cached catalog will be.
+
+    Args:
+        resource_path (:obj:`str`, optional): path to the static data file, relative to the investpy package.
+
+    """
+
+    with _LOCK:
+        if resource_path is None:
+            _CATALOGS.clear()
+            _INDICES.clear()
+        else:
+            for key in [key for key in _CATALOGS.keys() if key[0] == resource_path]:
+                del _CATALOGS[key]
+            for key in [key for key in _INDICES.keys() if key[0] == resource_path]:
+                del _INDICES[key]
+
+
+def reload_catalogs(resource_path=None):
+    """
+    This function reloads the cached catalogs from disk, which is useful when the static data files have been
+    updated while the current process was running. If a resource path is introduced, just the catalog loaded
+    from that file will be reloaded, otherwise every cached catalog will be.
+
+    Args:
+        resource_path (:obj:`str`, optional): path to the static data file, relative to the investpy package.
+
+    """
+
+    with _LOCK:
+        keys = [key for key in _CATALOGS.keys() if resource_path is None or key[0] == resource_path]
+
+        invalidate_catalogs(resource_path=resource_path)
+
+        for path, keep_default_na in keys:
+            load_catalog(path, keep_default_na=keep_default_na)
+
+
+def normalize_key(value):
+    """
+    This function normalizes the introduced value so that it can be used as a lookup key of the catalog
+    indices, which means that it is stripped, lower cased and transliterated to ASCII.
+
+    Args:
+        value (:obj:`str`): value to normalize.
+
+    Returns:
+        :obj:`str` - key:
+            The normalized lookup key of the introduced value.
+
+    """
+
+    return unidecode(value.strip().lower())
+
+
+def _normalize_column(column):
+    column = column.where(column.notnull(), '').astype(str).str.strip().str.lower()
+
+    non_ascii = column.str.contains(r'[^\x00-\x7f]', regex=True)
+
+    if non_ascii.any():
+        column = column.copy()
+        column[non_ascii] = [unidecode(value) for value in column[non_ascii].tolist()]
+
+    return column.tolist()
+
+
+def _catalog_index(resource_path, column, keep_default_na):
+    key = (resource_path, column, keep_default_na)
+
+    with _LOCK:
+        index = _INDICES.get(key)
+
+        if index is None:
+            load_catalog(resource_path, keep_default_na=keep_default_na)
+
+            data = _CATALOGS[(resource_path, keep_default_na)]
+
+            keys = _normalize_column(data[column])
+
+            if 'country' in data.columns:
+                countries = _normalize_column(data['country'])
+            else:
+                countries = [None] * len(keys)
+
+            positions = dict()
+
+            for position, (country, value) in enumerate(zip(countries, keys)):
+                positions.setdefault((None, value), list()).append(position)
+                if country is not None:
+                    positions.setdefault((country, value), list()).append(position)
+
+            index = {
+                'columns': data.columns.tolist(),
+                'values': [data[name].tolist() for name in data.columns],
+                'positions': positions,
+            }
+
+            _INDICES[key] = index
+
+    return index
+
+
+def lookup_instruments(resource_path, column, value, country=None, keep_default_na=True):
+    """
+    This function retrieves every row of the introduced static data file whose value in the introduced column
+    matches the introduced value, and whose country matches the introduced country if specified. Both the values
+    and the countries are compared once normalized, via :func:`normalize_key`. The lookup is served from an index
+    built just once per catalog, so every later lookup is a constant time operation instead of a full scan.
+
+    Args:
+        resource_path (:obj:`str`): path to the static data file, relative to the investpy package.
+        column (:obj:`str`): name of the column to match the introduced value against, e.g. `symbol` or `name`.
+        value (:obj:`str`): value to look for in the introduced column.
+        country (:obj:`str`, optional): name of the country to look for, if None every country is looked into.
+        keep_default_na (:obj:`bool`, optional):
+            whether the default NaN values should be parsed as NaN or kept as str, as in :obj:`pandas.read_csv`.
+
+    Returns:
+        :obj:`list` of :obj:`dict` - rows:
+            The resulting :obj:`list` contains a :obj:`dict` per matching row, in the same order as they appear
+            in the static data file, so it will be empty if no row matched the introduced values.
+
+    Raises:
+        FileNotFoundError: raised if the static data file was not found.
+
+    """
+
+    index = _catalog_index(resource_path, column, keep_default_na)
+
+    if country is not None:
+        country = normalize_key(country)
+
+    positions = index['positions'].get((country, normalize_key(value)), list())
+
+    return [dict(zip(index['columns'], [values[position] for values in index['values']])) for position in positions]
+
+
+def resolve(product_type, name, country=None):
+    """
+    This function resolves the introduced financial product to its full row as stored in the investpy static data
+    files, which includes the Investing.com id, symbol, currency, tag, etc. Products are resolved by their symbol
+    if the product_type is `stock` or by their name otherwise, and by the country if specified. Note that this
+    function does not send any request to Investing.com, so it can be used to resolve thousands of products at once.
+
+    Args:
+        product_type (:obj:`str`):
+            identifier of the introduced product, available ones are: `stock`, `fund`, `etf`, `index`, `currency_cross`,
+            `bond`, `certificate`, `commodity` and `crypto`.
+        name (:obj:`str`): symbol of the product if product_type is `stock`, or its name otherwise.
+        country (:obj:`str`, optional):
+            name of the country from where the product is, if None the first product matching the name will be returned.
+
+    Returns:
+        :obj:`dict` - instrument:
+            The resulting :obj:`dict` contains all the columns of the matching row of the static data file, e.g.::
+
+                instrument = {
+                    'country': 'spain',
+                    'name': 'BBVA',
+                    'full_name': 'BBVA',
+                    'tag': 'bbva',
+                    'isin': 'ES0113211835',
+                    'id': 446,
+                    'currency': 'EUR',
+                    'symbol': 'BBVA'
+                }
+
+    Raises:
+        ValueError: raised if any of the introduced parameters is not valid or errored.
+        FileNotFoundError: raised if the static data file was not found.
+        RuntimeError: raised if the introduced product was not found.
+
+    Examples:
+        >>> investpy.resolve('stock', 'bbva', 'spain')['id']
+        446
+
+    """
+
+    if not product_type or not isinstance(product_type, str):
+        raise ValueError("ERR#0118: product_type value is mandatory and must be a string.")
+
+    if not name or not isinstance(name, str):
+        raise ValueError("ERR#0116: the parameter name must be specified and must be a string.")
+
+    if country is not None and not isinstance(country, str):
+        raise ValueError("ERR#0117: this parameter can just be None or a string, if required.")
+
+    product_type = normalize_key(product_type)
+
+    if product_type not in cst.PRODUCT_TYPE_CATALOGS.keys():
+        raise ValueError("ERR#0119: introduced product_type value does not exist. Available values are: " + ', '.join(cst.PRODUCT_TYPE_CATALOGS.keys()))
+
+    catalog = cst.PRODUCT_TYPE_CATALOGS[product_type]
+
+    rows = lookup_instruments(resource_path='/'.join(('resources', catalog['file'])),
+                              column=catalog['key'],
+                              value=name,
+                              country=country,
+                              keep_default_na=catalog['keep_default_na'])
+
+    if not rows:
+        raise RuntimeError("ERR#0138: introduced " + product_type + " " + name + " not found, check if it is correct.")
+
+    return rows[0]
@@ -0,0 +1,292 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import os
+import io
+import json
+import mmap
+import hashlib
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+import pkg_resources
+
+
+FORMAT_VERSION = 2
+
+SEPARATOR = '\x00'
+
+
+def compiled_path(resource_path):
+    """
+    This function returns the path, relative to the investpy package, of the compiled binary catalog of the
+    introduced static data file, which is the same file with the `.npz` extension instead of `.csv`.
+
+    Args:
+        resource_path (:obj:`str`): path to the static data file, relative to the investpy package.
+
+    Returns:
+        :obj:`str` - compiled_path:
+            The path to the compiled binary catalog, relative to the investpy package.
+
+    """
+
+    return os.path.splitext(resource_path)[0] + '.npz'
+
+
+def source_digest(path):
+    """
+    This function computes the digest of the introduced static data file, which is stored in its compiled binary
+    catalog so that the compiled catalog is just used while it was compiled from the very same file.
+
+    Args:
+        path (:obj:`str`): absolute path to the static data file.
+
+    Returns:
+        :obj:`str` - digest:
+            The hexadecimal SHA-256 hash of the contents of the static data file.
+
+    """
+
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _resource_exists(resource_path, directory=None):
+    if directory is None:
+        return pkg_resources.resource_exists('investpy', resource_path)
+
+    return os.path.exists(_resource_filename(resource_path, directory))
+
+
+def _resource_filename(resource_path, directory=None):
+    if directory is None:
+        return pkg_resources.resource_filename('investpy', resource_path)
+
+    return os.path.join(directory, *resource_path.split('/'))
+
+
+def _encode_strings(values):
+    return np.frombuffer(SEPARATOR.join(values).encode('utf-8'), dtype=np.uint8)
+
+
+def _decode_strings(array):
+    if len(array) == 0:
+        return ['']
+
+    return bytes(array).decode('utf-8').split(SEPARATOR)
+
+
+def _encode_column(column, arrays):
+    if column.dtype != object and not pd.api.types.is_string_dtype(column.dtype):
+        return {'kind': 'values', 'values': _store(arrays, column.to_numpy())}
+
+    mask = column.isnull().to_numpy()
+    values = column.where(~column.isnull(), '').astype(str).tolist()
+
+    spec = {'na': _store(arrays, mask) if mask.any() else None}
+
+    categories, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+
+    if len(categories) * 2 <= len(values):
+        spec['kind'] = 'categories'
+        spec['categories'] = _store(arrays, _encode_strings(categories.tolist()))
+        spec['codes'] = _store(arrays, codes.astype(np.int16 if len(categories) < 2**15 else np.int32))
+    else:
+        spec['kind'] = 'strings'
+        spec['strings'] = _store(arrays, _encode_strings(values))
+
+    return spec
+
+
+def _store(arrays, array):
+    array = np.ascontiguousarray(array)
+    key = hashlib.sha1(array.dtype.str.encode('utf-8') + array.tobytes()).hexdigest()
+
+    arrays.setdefault(key, array)
+
+    return key
+
+
+def _decode_column(spec, arrays):
+    if spec['kind'] == 'values':
+        return arrays[spec['values']]
+
+    if spec['kind'] == 'categories':
+        categories = np.array(_decode_strings(arrays[spec['categories']]), dtype=object)
+        values = categories[arrays[spec['codes']]]
+    else:
+        values = np.array(_decode_strings(arrays[spec['strings']]), dtype=object)
+
+    if spec['na'] is not None:
+        values[arrays[spec['na']]] = np.nan
+
+    return values
+
+
+def compile_catalog(resource_path, directory=None):
+    """
+    This function compiles the introduced static data file into a columnar binary catalog, which is stored next to it
+    with the `.npz` extension. Low cardinality columns such as `country`, `currency` or `stock_exchange` are stored as
+    categorical codes, the rest of the text columns as a single UTF-8 buffer, and numeric columns as they are. Both the
+    `keep_default_na=True` and the `keep_default_na=False` parsings of the file are stored, so that the compiled catalog
+    can replace any :obj:`pandas.read_csv` call over the static data file. Once compiled, the binary catalog is checked
+    against the static data file, so that a compiled catalog that does not match it is never written.
+
+    Args:
+        resource_path (:obj:`str`): path to the static data file, relative to the investpy package.
+        directory (:obj:`str`, optional):
+            directory the resource path is relative to instead of the investpy package, if any.
+
+    Returns:
+        :obj:`str` - path:
+            The path of the written binary catalog.
+
+    Raises:
+        FileNotFoundError: raised if the static data file was not found.
+        RuntimeError: raised if the compiled catalog does not match the static data file.
+
+    """
+
+    if not _resource_exists(resource_path, directory):
+        raise FileNotFoundError("ERR#0115: data file not found or errored.")
+
+    source = _resource_filename(resource_path, directory)
+    target = _resource_filename(compiled_path(resource_path), directory)
+
+    arrays = dict()
+
+    meta = {
+        'version': FORMAT_VERSION,
+        'source_digest': source_digest(source),
+    }
+
+    for keep_default_na in [True, False]:
+        data = pd.read_csv(source, keep_default_na=keep_default_na)
+
+        meta[str(keep_default_na)] = [
+            dict(name=column, **_encode_column(data[column], arrays)) for column in data.columns
+        ]
+
+    arrays['__meta__'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+
+    with open(target, 'wb') as f:
+        np.savez(f, **arrays)
+
+    for keep_default_na in [True, False]:
+        try:
+            pd.testing.assert_frame_equal(read_compiled_catalog(resource_path, keep_default_na=keep_default_na,
+                                                                directory=directory),
+                                          pd.read_csv(source, keep_default_na=keep_default_na))
+        except AssertionError:
+            os.remove(target)
+            raise RuntimeError("ERR#0139: compiled catalog does not match the data file, so it was not written.")
+
+    return target
+
+
+def compile_catalogs():
+    """
+    This function compiles every static data file of investpy (`resources/*.csv`) into its columnar binary catalog,
+    which is the build step to run whenever any of the static data files is updated.
+
+    Returns:
+        :obj:`list` of :obj:`str` - paths:
+            The absolute paths of the written binary catalogs.
+
+    """
+
+    paths = list()
+
+    for filename in sorted(pkg_resources.resource_listdir('investpy', 'resources')):
+        if filename.endswith('.csv'):
+            paths.append(compile_catalog('/'.join(('resources', filename))))
+
+    return paths
+
+
+def _map_arrays(path):
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    arrays = dict()
+
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise IOError("ERR#0140: compiled catalog is compressed, so it can not be memory-mapped.")
+
+            name_length = int.from_bytes(buffer[info.header_offset + 26:info.header_offset + 28], 'little')
+            extra_length = int.from_bytes(buffer[info.header_offset + 28:info.header_offset + 30], 'little')
+
+            offset = info.header_offset + 30 + name_length + extra_length
+
+            header = io.BytesIO(buffer[offset:offset + min(info.file_size, 4096)])
+            version = np.lib.format.read_magic(header)
+
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+
+            count = int(np.prod(shape))
+
+            arrays[os.path.splitext(info.filename)[0]] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                                                        offset=offset + header.tell())
+
+    return arrays
+
+
+def read_compiled_catalog(resource_path, keep_default_na=True, directory=None):
+    """
+    This function reads the compiled binary catalog of the introduced static data file, if it exists and it is up to
+    date (i.e. it was compiled from a static data file with the same contents), by memory-mapping it so that no
+    intermediate copy of the file is made. The resulting :obj:`pandas.DataFrame` is the same one that
+    :obj:`pandas.read_csv` returns for the static data file.
+
+    Args:
+        resource_path (:obj:`str`): path to the static data file, relative to the investpy package.
+        keep_default_na (:obj:`bool`, optional):
+            whether the default NaN values should be parsed as NaN or kept as str, as in :obj:`pandas.read_csv`.
+        directory (:obj:`str`, optional):
+            directory the resource path is relative to instead of the investpy package, if any.
+
+    Returns:
+        :obj:`pandas.DataFrame` - data:
+            The static file's data, or None if there is no compiled catalog of the static data file or if it is
+            outdated, so that the static data file needs to be parsed instead.
+
+    """
+
+    if not _resource_exists(compiled_path(resource_path), directory):
+        return None
+
+    path = _resource_filename(compiled_path(resource_path), directory)
+
+    try:
+        arrays = _map_arrays(path)
+        meta = json.loads(bytes(arrays['__meta__']).decode('utf-8'))
+    except (IOError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    if meta['version'] != FORMAT_VERSION:
+        return None
+
+    source = _resource_filename(resource_path, directory)
+
+    if os.path.exists(source) and source_digest(source) != meta['source_digest']:
+        return None
+
+    columns = meta[str(keep_default_na)]
+
+    data = pd.DataFrame({column['name']: _decode_column(column, arrays) for column in columns},
+                        columns=[column['name'] for column in columns])
+
+    return data
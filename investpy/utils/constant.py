@@ -153,6 +153,18 @@ PRODUCT_TYPE_FILES = {
     'bond': 'bonds.csv'
 }
 
+PRODUCT_TYPE_CATALOGS = {
+    'bond': {'file': 'bonds.csv', 'key': 'name', 'keep_default_na': True},
+    'certificate': {'file': 'certificates.csv', 'key': 'name', 'keep_default_na': True},
+    'commodity': {'file': 'commodities.csv', 'key': 'name', 'keep_default_na': True},
+    'crypto': {'file': 'cryptos.csv', 'key': 'name', 'keep_default_na': True},
+    'currency_cross': {'file': 'currency_crosses.csv', 'key': 'name', 'keep_default_na': True},
+    'etf': {'file': 'etfs.csv', 'key': 'name', 'keep_default_na': True},
+    'fund': {'file': 'funds.csv', 'key': 'name', 'keep_default_na': True},
+    'index': {'file': 'indices.csv', 'key': 'name', 'keep_default_na': True},
+    'stock': {'file': 'stocks.csv', 'key': 'symbol', 'keep_default_na': False},
+}
+
 INTERVAL_FILTERS = {
     '5mins': 60*5,
     '15mins': 60*15,
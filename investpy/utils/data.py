@@ -1,246 +1,224 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
-class Data(object):
+import numpy as np
+import pandas as pd
+
+from .serializer import columns_to_json
+
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
+JSON_KEYS = {
+    'date': 'date',
+    'open': 'open',
+    'high': 'high',
+    'low': 'low',
+    'close': 'close',
+    'volume': 'volume',
+    'currency': 'currency',
+    'exchange': 'exchange',
+}
+
+
+def epoch_to_dates(epoch, unit='s', tz=None, name='Date'):
     """
-    This class is used to store the historical data of avery financial product retrieved from Investing.com either as
-    a :obj:`json` or as a :obj:`dict`.
+    This function converts the epoch values of the historical data retrieved from Investing.com into the dates they
+    refer to, at once, instead of converting each value into a :obj:`datetime.datetime` one by one. Since the values
+    sent by Investing.com are the UTC midnight of each date, every value is truncated to its UTC date. The dates are
+    timezone-naive by default, but they can also be localized to any timezone, so that each date is the midnight of
+    that date in the specified timezone.
 
     Args:
-        date_ (:obj:`str`): date in dd/mm/yyyy format.
-        open_ (:obj:`float`): open value of the market on the introduced date.
-        high_ (:obj:`float`): highest value of the market on the introduced date.
-        low_ (:obj:`float`): lowest value of the market on the introduced date.
-        close_ (:obj:`float`): close value of the market on the introduced date.
-        volume_ (:obj:`long`): number of shares traded on the introduced date.
-        currency_ (:obj:`str`): currency in which the data is displayed.
-        exchange_ (:obj:`str`): stock exchange that provides the data.
+        epoch (:obj:`numpy.ndarray` or :obj:`list`): epoch values, either in seconds or in days.
+        unit (:obj:`str`, optional): unit of the epoch values, which can either be `s` (seconds) or `D` (days).
+        tz (:obj:`str` or :obj:`datetime.tzinfo`, optional): timezone to localize the dates to, if any.
+        name (:obj:`str`, optional): name of the resulting index.
+
+    Returns:
+        :obj:`pandas.DatetimeIndex` - dates:
+            The dates of the introduced epoch values, in the same order.
+
+    Raises:
+        ValueError: raised if either the unit or the timezone are not valid.
+
+    Examples:
+        >>> investpy.utils.data.epoch_to_dates([1577836800, 1577923200], tz='Europe/Madrid')
+        DatetimeIndex(['2020-01-01 00:00:00+01:00', '2020-01-02 00:00:00+01:00'], dtype='datetime64[ns, Europe/Madrid]', name='Date', freq=None)
+
+    """
+
+    if unit not in ['s', 'D']:
+        raise ValueError("ERR#0156: unit argument can just be either 's' (seconds) or 'D' (days).")
+
+    days = np.asarray(epoch, dtype=np.int64)
+
+    if unit == 's':
+        days = np.floor_divide(days, SECONDS_PER_DAY)
+
+    dates = pd.DatetimeIndex(days.astype('datetime64[D]').astype('datetime64[ns]'), name=name)
+
+    if tz is None:
+        return dates
+
+    try:
+        # a midnight which does not exist or is repeated due to a daylight saving time change is moved to the
+        # first valid time of the date, so that every date is kept
+        return dates.tz_localize(tz, ambiguous=np.ones(len(dates), dtype=bool), nonexistent='shift_forward')
+    except Exception:
+        raise ValueError("ERR#0157: tz argument needs to be a valid timezone, either as a str or a tzinfo object.")
+
+
+class HistoricalData(object):
+    """
+    This class is used to build the historical data of any financial product retrieved from Investing.com, either as
+    a :obj:`pandas.DataFrame` or as a :obj:`json`, from the tables parsed by
+    :func:`investpy.utils.parser.parse_historical_data`. Instead of creating an object and a :obj:`dict` per row, the
+    values are accumulated as typed columns, i.e. the dates as :obj:`numpy.int64` days since epoch, the prices as
+    :obj:`numpy.float64` and the volume as :obj:`numpy.int64`, while the currency and the exchange are just stored once,
+    since they are the same for every row. So on, both the :obj:`pandas.DataFrame` and the :obj:`json` are built at
+    once from the same columns, once every table has been appended.
+
+    Args:
+        volume (:obj:`bool`, optional): whether the historical data contains the volume column.
+        currency (:obj:`str`, optional): currency in which the data is displayed, if it is included in the data.
+        exchange (:obj:`str`, optional): stock exchange that provides the data, if it is included in the data.
+        json_keys (:obj:`dict`, optional): keys of the :obj:`json` values to use instead of the default ones.
 
     Attributes:
-        date_ (:obj:`str`): date in dd/mm/yyyy format.
-        open_ (:obj:`float`): open value of the market on the introduced date.
-        high_ (:obj:`float`): highest value of the market on the introduced date.
-        low_ (:obj:`float`): lowest value of the market on the introduced date.
-        close_ (:obj:`float`): close value of the market on the introduced date.
-        volume_ (:obj:`long`): number of shares traded on the introduced date.
-        currency_ (:obj:`str`): currency in which the data is displayed.
-        exchange_ (:obj:`str`): stock exchange that provides the data.
-    
+        volume (:obj:`bool`): whether the historical data contains the volume column.
+        currency (:obj:`str`): currency in which the data is displayed, if it is included in the data.
+        exchange (:obj:`str`): stock exchange that provides the data, if it is included in the data.
+        json_keys (:obj:`dict`): keys of the :obj:`json` values.
+
     """
 
-    def __init__(self, date_, open_, high_, low_, close_, volume_, currency_, exchange_):
-        self.date = date_
-        self.open = open_
-        self.high = high_
-        self.low = low_
-        self.close = close_
-        self.volume = volume_
-        self.currency = currency_
-        self.exchange = exchange_
-
-    def stock_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Volume': self.volume,
-            'Currency': self.currency,
-        }
-
-    def stock_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'currency': self.currency,
-        }
-
-    def fund_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Currency': self.currency,
-        }
-
-    def fund_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'currency': self.currency,
-        }
-
-    def etf_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Volume': self.volume,
-            'Currency': self.currency,
-            'Exchange': self.exchange
-        }
-
-    def etf_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'currency': self.currency,
-            'exchange': self.exchange
-        }
-
-    def index_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Volume': self.volume,
-            'Currency': self.currency
-        }
-
-    def index_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'currency': self.currency,
-        }
-
-    def currency_cross_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'Currency': self.currency,
-        }
-
-    def currency_cross_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Currency': self.currency,
-        }
-
-    def bond_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-        }
-
-    def bond_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-        }
-
-    def commodity_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Volume': self.volume,
-            'Currency': self.currency
-        }
-
-    def commodity_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'currency': self.currency
-        }
-
-    def certificate_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close
-        }
-
-    def certificate_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close
-        }
-
-    def crypto_to_dict(self):
-        return {
-            'Date': self.date,
-            'Open': self.open,
-            'High': self.high,
-            'Low': self.low,
-            'Close': self.close,
-            'Volume': self.volume,
-            'Currency': self.currency
-        }
-
-    def crypto_as_json(self):
-        return {
-            'date': self.date.strftime('%d/%m/%Y'),
-            'open': self.open,
-            'high': self.high,
-            'low': self.low,
-            'close': self.close,
-            'volume': self.volume,
-            'currency': self.currency
-        }
-
-    def unknown_to_dict(self):
-        if self.volume is None:
-            return {
-                'Date': self.date,
-                'Open': self.open,
-                'High': self.high,
-                'Low': self.low,
-                'Close': self.close,
-            }
-        else:
-            return {
-                'Date': self.date,
-                'Open': self.open,
-                'High': self.high,
-                'Low': self.low,
-                'Close': self.close,
-                'Volume': self.volume
-            }
+    def __init__(self, volume=False, currency=None, exchange=None, json_keys=None):
+        self.volume = volume
+        self.currency = currency
+        self.exchange = exchange
+        self.json_keys = dict(JSON_KEYS, **json_keys) if json_keys else JSON_KEYS
+
+        self._chunks = list()
+
+    def __len__(self):
+        return sum(len(chunk['date']) for chunk in self._chunks)
+
+    def _keys(self):
+        return ['date'] + PRICE_COLUMNS + (['volume'] if self.volume is True else [])
+
+    def append(self, table):
+        """
+        This method appends the rows of a parsed historical data table, in any order.
+
+        Args:
+            table (:obj:`dict`): table as returned by :func:`investpy.utils.parser.parse_historical_data`.
+
+        """
+
+        chunk = {'date': np.floor_divide(np.asarray(table['date'], dtype=np.int64), SECONDS_PER_DAY)}
+
+        for column in PRICE_COLUMNS:
+            chunk[column] = np.asarray(table[column], dtype=np.float64)
+
+        if self.volume is True:
+            chunk['volume'] = np.asarray(table['volume'], dtype=np.int64)
+
+        self._chunks.append(chunk)
+
+    def columns(self, order='ascending'):
+        """
+        This method returns the appended rows as columns, ordered by date as specified by `order`. Since consecutive
+        date intervals may share the boundary date (or the boundary week or month), the rows of a duplicated date are
+        just kept once, as they were first appended.
+
+        Args:
+            order (:obj:`str`, optional): order of the returned rows which can either be ascending or descending.
+
+        Returns:
+            :obj:`dict` - columns:
+                The appended rows as a :obj:`dict` of NumPy columns: `date` (:obj:`numpy.int64` days since epoch),
+                `open`, `high`, `low` and `close` (:obj:`numpy.float64`) and `volume` (:obj:`numpy.int64`), just if
+                the historical data contains the volume.
+
+        """
+
+        if not self._chunks:
+            return {key: np.empty(0, dtype=np.float64 if key in PRICE_COLUMNS else np.int64) for key in self._keys()}
+
+        columns = {key: np.concatenate([chunk[key] for chunk in self._chunks]) for key in self._keys()}
+
+        # the sorted unique dates come along with the position of their first occurrence
+        _, index = np.unique(columns['date'], return_index=True)
+
+        if order in ['descending', 'desc']:
+            index = index[::-1]
+
+        return {key: column[index] for key, column in columns.items()}
+
+    def to_frame(self, order='ascending', columns=None):
+        """
+        This method builds the :obj:`pandas.DataFrame` of the appended rows, indexed by date.
+
+        Args:
+            order (:obj:`str`, optional): order of the returned rows which can either be ascending or descending.
+            columns (:obj:`dict`, optional):
+                columns as returned by :meth:`columns` (e.g. a slice of them) to build the data from, instead of the
+                appended rows, in which case `order` is ignored.
+
+        Returns:
+            :obj:`pandas.DataFrame` - data:
+                The historical data with the `Open`, `High`, `Low` and `Close` columns, followed by the `Volume`,
+                `Currency` and `Exchange` columns if included, where both the `Currency` and the `Exchange` are
+                categorical.
+
+        """
+
+        if columns is None:
+            columns = self.columns(order=order)
+
+        index = epoch_to_dates(columns['date'], unit='D')
+
+        data = {key.capitalize(): columns[key] for key in self._keys()[1:]}
+
+        for key, value in [('Currency', self.currency), ('Exchange', self.exchange)]:
+            if value is not None:
+                data[key] = pd.Categorical.from_codes(np.zeros(len(index), dtype=np.int8), categories=[value])
+
+        return pd.DataFrame(data, index=index)
+
+    def to_json(self, name, key='historical', order='ascending', columns=None):
+        """
+        This method builds the :obj:`json` of the appended rows.
+
+        Args:
+            name (:obj:`str`): name of the financial product.
+            key (:obj:`str`, optional): key of the rows in the :obj:`json`, which is either `historical` or `recent`.
+            order (:obj:`str`, optional): order of the returned rows which can either be ascending or descending.
+            columns (:obj:`dict`, optional):
+                columns as returned by :meth:`columns` (e.g. a slice of them) to build the data from, instead of the
+                appended rows, in which case `order` is ignored.
+
+        Returns:
+            :obj:`json` - data:
+                The historical data as a :obj:`json` with the `name` of the financial product and a :obj:`list` of
+                rows under `key`, where the dates are formatted as `dd/mm/yyyy`.
+
+        """
+
+        if columns is None:
+            columns = self.columns(order=order)
+
+        # the dates are formatted from their ISO representation, which NumPy builds at once
+        dates = [date[8:10] + '/' + date[5:7] + '/' + date[:4]
+                 for date in columns['date'].astype('datetime64[D]').astype(str).tolist()]
+
+        fields = [self.json_keys[column] for column in self._keys()]
+        values = [dates] + [columns[column] for column in self._keys()[1:]]
+
+        constants = [(self.json_keys[column], value)
+                     for column, value in [('currency', self.currency), ('exchange', self.exchange)] if value is not None]
+
+        return columns_to_json(name, key, fields, values, constants=constants)
@@ -1,18 +1,19 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
-import pandas as pd
 import pkg_resources
 
 import random
 
 from . import constant as cst
+from .catalog import load_catalog
 
 
 def resource_to_data(path_to_data):
     """
     This is an auxiliar function to read data from a given path, so as to wrap the load
-    process of the static data files from investpy.
+    process of the static data files from investpy. Note that the static data files are just
+    parsed once per process, since they are served from the shared catalog cache.
 
     Returns:
         :obj:`pandas.DataFrame` - data:
@@ -28,7 +29,7 @@ def resource_to_data(path_to_data):
     resource_package = 'investpy'
     resource_path = '/'.join(('resources', path_to_data))
     if pkg_resources.resource_exists(resource_package, resource_path):
-        data = pd.read_csv(pkg_resources.resource_filename(resource_package, resource_path))
+        data = load_catalog(resource_path)
     else:
         raise FileNotFoundError("ERR#0115: data file not found or errored.")
 
@@ -0,0 +1,675 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from random import randint
+
+import numpy as np
+
+from .catalog import resolve
+from .data import HistoricalData
+from .extra import random_user_agent
+from .parser import parse_historical_data
+from .transport import get_transport, post_concurrently, iter_post
+from .store import get_store
+from .resample import resample_ohlcv
+
+
+HISTORICAL_DATA_URL = "https://www.investing.com/instruments/HistoricalDataAjax"
+
+# Investing.com does not return more than 20 years of historical data per request
+MAX_INTERVAL_YEARS = 19
+
+
+class HistoricalSchema(object):
+    """
+    This class is used to describe the historical data of a financial product type as retrieved from Investing.com,
+    so that the recent and historical data of every financial product type is retrieved, parsed and built by the same
+    functions, which just differ on the schema they receive.
+
+    Args:
+        product (:obj:`str`): name of the financial product type, i.e. `stock`, `fund`, `etf`, etc.
+        header (:obj:`str`):
+            format of the header of the historical data requests, filled with the values of the financial product as
+            found in its static data file (e.g. `{symbol} Historical Data`).
+        key (:obj:`str`, optional): column of the static data file used to look up the financial products.
+        volume (:obj:`bool`, optional): whether the historical data contains the volume column.
+        currency (:obj:`str`, optional):
+            column of the static data file containing the currency of the historical data, if it is included.
+        exchange (:obj:`str`, optional):
+            column of the static data file containing the stock exchange of the historical data, if it is included.
+        json_keys (:obj:`dict`, optional): keys of the :obj:`json` values to use instead of the default ones.
+        not_found (:obj:`str`, optional): message of the error raised if Investing.com found no historical data.
+
+    """
+
+    def __init__(self, product, header, key='name', volume=False, currency=None, exchange=None, json_keys=None,
+                 not_found=None):
+        self.product = product
+        self.header = header
+        self.key = key
+        self.volume = volume
+        self.currency = currency
+        self.exchange = exchange
+        self.json_keys = json_keys
+        self.not_found = not_found if not_found is not None else \
+            "ERR#0033: " + product + " information unavailable or not found."
+
+    def __repr__(self):
+        return "HistoricalSchema(" + repr(self.product) + ")"
+
+    def builder(self, instrument):
+        """
+        This method creates the :obj:`investpy.utils.data.HistoricalData` builder of the introduced financial product.
+
+        Args:
+            instrument (:obj:`dict`): financial product as found in its static data file.
+
+        Returns:
+            :obj:`investpy.utils.data.HistoricalData` - data:
+                The empty builder of the historical data of the introduced financial product.
+
+        """
+
+        return HistoricalData(volume=self.volume,
+                              currency=instrument[self.currency] if self.currency is not None else None,
+                              exchange=instrument[self.exchange] if self.exchange is not None else None,
+                              json_keys=self.json_keys)
+
+
+HISTORICAL_SCHEMAS = {
+    'stock': HistoricalSchema('stock', '{symbol} Historical Data', key='symbol', volume=True, currency='currency',
+                              not_found="ERR#0007: stock information unavailable or not found."),
+    'fund': HistoricalSchema('fund', '{symbol} Historical Data', currency='currency',
+                             not_found="ERR#0008: fund information unavailable or not found."),
+    'etf': HistoricalSchema('etf', '{symbol} Historical Data', volume=True, currency='currency',
+                            exchange='stock_exchange', not_found="ERR#0010: etf information unavailable or not found."),
+    'index': HistoricalSchema('index', '{full_name} Historical Data', volume=True, currency='currency',
+                              not_found="ERR#0046: index information unavailable or not found."),
+    'currency_cross': HistoricalSchema('currency_cross', '{name} Historical Data', currency='second',
+                                       json_keys={'currency': 'Currency'},
+                                       not_found="ERR#0055: currency_cross information unavailable or not found."),
+    'bond': HistoricalSchema('bond', '{full_name} Bond Yield Historical Data',
+                             not_found="ERR#0069: bond information unavailable or not found."),
+    'commodity': HistoricalSchema('commodity', '{full_name} Historical Data', volume=True, currency='currency',
+                                  not_found="ERR#0080: commodity information unavailable or not found."),
+    'crypto': HistoricalSchema('crypto', '{name} Historical Data', volume=True, currency='currency',
+                               not_found="ERR#0087: crypto information unavailable or not found."),
+    'certificate': HistoricalSchema('certificate', '{symbol} Historical Data',
+                                    not_found="ERR#0102: certificate information unavailable or not found."),
+}
+
+
+def split_date_range(from_date, to_date):
+    """
+    This function splits the introduced date range into consecutive intervals of at most 19 years, since
+    Investing.com does not return more than 20 years of historical data per request.
+
+    Args:
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+
+    Returns:
+        :obj:`list` - intervals:
+            The :obj:`list` of `(start, end)` dates (as :obj:`datetime.datetime`) of every interval.
+
+    """
+
+    intervals = list()
+
+    while to_date.year - from_date.year > MAX_INTERVAL_YEARS:
+        try:
+            end_date = from_date.replace(year=from_date.year + MAX_INTERVAL_YEARS)
+        except ValueError:
+            end_date = from_date.replace(year=from_date.year + MAX_INTERVAL_YEARS, day=28)
+
+        intervals.append((from_date, end_date))
+
+        from_date = end_date + timedelta(days=1)
+
+    intervals.append((from_date, to_date))
+
+    return intervals
+
+
+def date_intervals(from_date, to_date):
+    """
+    This function splits the introduced date range into consecutive intervals of at most 19 years, as
+    :func:`split_date_range` does, but formats their dates as the requests to Investing.com expect them.
+
+    Args:
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+
+    Returns:
+        :obj:`list` - intervals:
+            The :obj:`list` of `(start, end)` dates of every interval, formatted as `mm/dd/yyyy`.
+
+    """
+
+    return [(start.strftime('%m/%d/%Y'), end.strftime('%m/%d/%Y'))
+            for start, end in split_date_range(from_date, to_date)]
+
+
+def coalesce_date_ranges(ranges):
+    """
+    This function coalesces the introduced sorted date ranges (e.g. the gaps of the stored historical data) into as
+    few requests as possible, by joining consecutive date ranges as long as the resulting one fits in a single request
+    (i.e. it spans at most 19 years), even if the dates between them are retrieved again, and by splitting the date
+    ranges which do not fit in a single request.
+
+    Args:
+        ranges (:obj:`list`): sorted `(start, end)` dates (as :obj:`datetime.datetime`) of the date ranges.
+
+    Returns:
+        :obj:`list` - intervals:
+            The :obj:`list` of `(start, end)` dates (as :obj:`datetime.datetime`) of every request, which cover all
+            the introduced date ranges.
+
+    """
+
+    joined = list()
+
+    for start, end in ranges:
+        if joined and end.year - joined[-1][0].year <= MAX_INTERVAL_YEARS:
+            joined[-1] = (joined[-1][0], end)
+        else:
+            joined.append((start, end))
+
+    return [interval for start, end in joined for interval in split_date_range(start, end)]
+
+
+def historical_request(schema, instrument, interval='Daily', date_range=None):
+    """
+    This function builds the form data of a request to the `HistoricalDataAjax` endpoint of Investing.com.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        instrument (:obj:`dict`): financial product as found in its static data file.
+        interval (:obj:`str`, optional): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+        date_range (:obj:`tuple`, optional):
+            `(start, end)` dates formatted as `mm/dd/yyyy` of the historical data, or None for the recent data.
+
+    Returns:
+        :obj:`dict` - params:
+            The form data of the request.
+
+    """
+
+    params = {
+        "curr_id": instrument['id'],
+        "smlID": str(randint(1000000, 99999999)),
+        "header": schema.header.format(**instrument),
+    }
+
+    if date_range is not None:
+        params["st_date"], params["end_date"] = date_range
+
+    params.update({
+        "interval_sec": interval,
+        "sort_col": "date",
+        "sort_ord": "DESC",
+        "action": "historical_data"
+    })
+
+    return params
+
+
+def historical_headers():
+    """
+    This function builds the headers of a request to the `HistoricalDataAjax` endpoint of Investing.com.
+    """
+
+    return {
+        "User-Agent": random_user_agent(),
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+    }
+
+
+def parse_historical_response(schema, req, allow_empty=False):
+    """
+    This function parses the historical data table of a response of the `HistoricalDataAjax` endpoint of Investing.com.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        req (:obj:`requests.Response`): response of the request.
+        allow_empty (:obj:`bool`, optional): whether an empty table is returned instead of raising an error.
+
+    Returns:
+        :obj:`dict` - table:
+            The parsed table as returned by :func:`investpy.utils.parser.parse_historical_data`, or None if the
+            response had no content.
+
+    Raises:
+        ConnectionError: raised if the request to Investing.com did not succeed.
+        RuntimeError: raised if the response did not contain the historical data table.
+        IndexError: raised if Investing.com found no historical data and `allow_empty` is False.
+
+    """
+
+    if req.status_code != 200:
+        raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
+
+    if not req.text:
+        return None
+
+    table = parse_historical_data(req.text, volume=schema.volume)
+
+    if table is None:
+        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+    if len(table['date']) == 0 and allow_empty is False:
+        raise IndexError(schema.not_found)
+
+    return table
+
+
+def retrieve_recent_data(schema, instrument, as_json=False, order='ascending', interval='Daily'):
+    """
+    This function retrieves the recent historical data of the introduced financial product from Investing.com, which
+    has been previously validated and found in its static data file.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        instrument (:obj:`dict`): financial product as found in its static data file.
+        as_json (:obj:`bool`, optional): whether the data is returned as a :obj:`json` or as a :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional): order of the returned data which can either be ascending or descending.
+        interval (:obj:`str`, optional): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            The recent data of the introduced financial product, as returned by the `get_*_recent_data` functions.
+
+    Raises:
+        ConnectionError: raised if the request to Investing.com did not succeed.
+        RuntimeError: raised if the response did not contain the historical data table.
+        IndexError: raised if Investing.com found no recent data.
+
+    """
+
+    req = get_transport().post(HISTORICAL_DATA_URL, headers=historical_headers(),
+                               data=historical_request(schema, instrument, interval=interval))
+
+    table = parse_historical_response(schema, req)
+
+    if table is None:
+        raise RuntimeError("ERR#0004: data retrieval error while scraping.")
+
+    data = schema.builder(instrument)
+    data.append(table)
+
+    if as_json is True:
+        return data.to_json(instrument['name'], key='recent', order=order)
+
+    return data.to_frame(order=order)
+
+
+def retrieve_historical_data(schema, instrument, from_date, to_date, as_json=False, order='ascending',
+                             interval='Daily', interval_source='remote', limiter=None):
+    """
+    This function retrieves the historical data of the introduced financial product from Investing.com in the
+    introduced date range, which has been previously validated and found in its static data file. The date range is
+    split into intervals of at most 19 years, whose requests are sent concurrently. If a historical data store has
+    been set (see :func:`investpy.utils.store.set_store`), the daily historical data is served from it, and just the
+    dates it does not cover are retrieved from Investing.com, and then stored.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        instrument (:obj:`dict`): financial product as found in its static data file.
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        as_json (:obj:`bool`, optional): whether the data is returned as a :obj:`json` or as a :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional): order of the returned data which can either be ascending or descending.
+        interval (:obj:`str`, optional): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+        interval_source (:obj:`str`, optional):
+            whether the weekly and monthly historical data is retrieved from Investing.com (`remote`) or resampled
+            locally from the daily historical data (`local`), which can be served from the historical data store, see
+            :func:`investpy.utils.resample.resample_ohlcv`.
+        limiter (:obj:`threading.Semaphore`, optional):
+            semaphore shared with the requests of other financial products to cap how many requests are sent at the
+            same time, see :func:`investpy.utils.transport.post_concurrently`.
+
+    Returns:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            The historical data of the introduced financial product, as returned by the `get_*_historical_data`
+            functions.
+
+    Raises:
+        ConnectionError: raised if any request to Investing.com did not succeed.
+        RuntimeError: raised if any response did not contain the historical data table.
+        IndexError: raised if Investing.com found no historical data in the last interval.
+
+    """
+
+    source = 'Daily' if interval_source == 'local' else interval
+
+    data = historical_data_builder(schema, instrument, from_date, to_date, interval=source, limiter=limiter)
+
+    columns = data.columns()
+
+    if source != interval:
+        columns = resample_ohlcv(columns, interval)
+
+    if order in ['descending', 'desc']:
+        columns = {key: column[::-1] for key, column in columns.items()}
+
+    if as_json is True:
+        return data.to_json(instrument['name'], columns=columns)
+
+    return data.to_frame(columns=columns)
+
+
+def historical_data_builder(schema, instrument, from_date, to_date, interval='Daily', limiter=None):
+    """
+    This function retrieves the historical data of the introduced financial product in the introduced date range, as
+    :func:`retrieve_historical_data` does, but returns the builder it is appended to instead of the resulting data,
+    so that its columns can be used as they are (e.g. to feed a :class:`investpy.utils.panel.PricePanel`).
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        instrument (:obj:`dict`): financial product as found in its static data file.
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        interval (:obj:`str`, optional): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+        limiter (:obj:`threading.Semaphore`, optional):
+            semaphore shared with the requests of other financial products to cap how many requests are sent at the
+            same time, see :func:`investpy.utils.transport.post_concurrently`.
+
+    Returns:
+        :obj:`investpy.utils.data.HistoricalData` - data:
+            The builder of the historical data of the introduced financial product.
+
+    Raises:
+        ConnectionError: raised if any request to Investing.com did not succeed.
+        RuntimeError: raised if any response did not contain the historical data table.
+        IndexError: raised if Investing.com found no historical data in the last interval.
+
+    """
+
+    store = get_store() if interval == 'Daily' else None
+
+    if store is not None:
+        return _stored_data(store, schema, instrument, from_date, to_date, limiter=limiter)
+
+    return _remote_data(schema, instrument, from_date, to_date, interval=interval, limiter=limiter)
+
+
+def _remote_data(schema, instrument, from_date, to_date, interval='Daily', limiter=None):
+    params = [historical_request(schema, instrument, interval=interval, date_range=date_range)
+              for date_range in date_intervals(from_date, to_date)]
+
+    responses = post_concurrently(HISTORICAL_DATA_URL, headers=historical_headers(), data=params, limiter=limiter)
+
+    data = schema.builder(instrument)
+
+    for index, req in enumerate(responses):
+        # the earlier intervals may have no data, e.g. if the financial product did not exist yet
+        table = parse_historical_response(schema, req, allow_empty=index < len(responses) - 1)
+
+        if table is not None:
+            data.append(table)
+
+    return data
+
+
+def _stored_data(store, schema, instrument, from_date, to_date, limiter=None):
+    product, id_ = schema.product, instrument['id']
+
+    intervals = coalesce_date_ranges(store.missing(product, id_, from_date, to_date))
+
+    if intervals:
+        params = [historical_request(schema, instrument, interval='Daily',
+                                     date_range=(start.strftime('%m/%d/%Y'), end.strftime('%m/%d/%Y')))
+                  for start, end in intervals]
+
+        responses = post_concurrently(HISTORICAL_DATA_URL, headers=historical_headers(), data=params,
+                                      return_exceptions=True, limiter=limiter)
+
+        error = None
+
+        # every retrieved interval is stored even if another one failed, so that it is not retrieved again
+        for (start, end), req in zip(intervals, responses):
+            try:
+                if isinstance(req, Exception):
+                    raise req
+
+                # the missing dates may have no data at all (e.g. holidays), which is checked on the stored data
+                table = parse_historical_response(schema, req, allow_empty=True)
+            except Exception as e:
+                error = error or e
+                continue
+
+            store.update(product, id_, [table] if table is not None else [], start, end)
+
+        if error is not None:
+            raise error
+
+    data = schema.builder(instrument)
+    data.append(store.read(product, id_, from_date, to_date))
+
+    if len(data) == 0:
+        raise IndexError(schema.not_found)
+
+    return data
+
+
+def iter_historical_data(schema, instrument, from_date, to_date, as_json=False, order='ascending', interval='Daily',
+                         batch_size=None):
+    """
+    This function retrieves the historical data of the introduced financial product from Investing.com in the
+    introduced date range, which has been previously validated and found in its static data file, yielding it by parts
+    as soon as each part is retrieved and parsed, instead of returning it at once. The date range is split into
+    intervals of at most 19 years, which are retrieved one after another (while the next one is already being
+    retrieved), so that just the data of the current interval is kept in memory.
+
+    Args:
+        schema (:obj:`investpy.utils.historical.HistoricalSchema`): schema of the financial product type.
+        instrument (:obj:`dict`): financial product as found in its static data file.
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        as_json (:obj:`bool`, optional): whether the data is yielded as :obj:`json` or as :obj:`pandas.DataFrame`.
+        order (:obj:`str`, optional):
+            order of the yielded data which can either be ascending or descending, both within each part and
+            across parts.
+        interval (:obj:`str`, optional): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+        batch_size (:obj:`int`, optional):
+            number of rows of each yielded part, but the last one, or None to yield the data of each date interval.
+
+    Yields:
+        :obj:`pandas.DataFrame` or :obj:`json`:
+            Each part of the historical data of the introduced financial product, as returned by the
+            `get_*_historical_data` functions.
+
+    Raises:
+        ConnectionError: raised if any request to Investing.com did not succeed.
+        RuntimeError: raised if any response did not contain the historical data table.
+        IndexError: raised if Investing.com found no historical data in the last interval.
+
+    """
+
+    descending = order in ['descending', 'desc']
+
+    intervals = date_intervals(from_date, to_date)
+    latest = intervals[-1]
+
+    if descending is True:
+        intervals = intervals[::-1]
+
+    params = [historical_request(schema, instrument, interval=interval, date_range=date_range)
+              for date_range in intervals]
+
+    def build(data, columns):
+        if as_json is True:
+            return data.to_json(instrument['name'], columns=columns)
+
+        return data.to_frame(columns=columns)
+
+    last = None
+    pending = None
+
+    for date_range, req in zip(intervals, iter_post(HISTORICAL_DATA_URL, headers=historical_headers(), data=params)):
+        table = parse_historical_response(schema, req, allow_empty=date_range != latest)
+
+        if table is None:
+            continue
+
+        data = schema.builder(instrument)
+        data.append(table)
+
+        columns = data.columns(order=order)
+
+        # consecutive intervals may share the boundary week or month, which has already been yielded
+        if last is not None:
+            mask = columns['date'] < last if descending is True else columns['date'] > last
+            columns = {key: column[mask] for key, column in columns.items()}
+
+        if len(columns['date']) == 0:
+            continue
+
+        last = columns['date'][-1]
+
+        if batch_size is None:
+            yield build(data, columns)
+            continue
+
+        if pending is not None:
+            columns = {key: np.concatenate([pending[key], column]) for key, column in columns.items()}
+
+        for start in range(0, len(columns['date']) - batch_size + 1, batch_size):
+            yield build(data, {key: column[start:start + batch_size] for key, column in columns.items()})
+
+        rest = len(columns['date']) % batch_size
+
+        pending = {key: column[len(column) - rest:] for key, column in columns.items()} if rest > 0 else None
+
+    if pending is not None:
+        yield build(schema.builder(instrument), pending)
+
+
+def check_instruments(instruments):
+    """
+    This function checks that the introduced financial products are a non empty :obj:`list` of
+    `(product_type, name, country)` or `(product_type, name)` tuples, as the functions which retrieve the historical
+    data of several financial products at once expect them.
+
+    Args:
+        instruments (:obj:`list` of :obj:`tuple`): financial products to retrieve historical data from.
+
+    Raises:
+        ValueError: raised if the introduced financial products are not valid.
+
+    """
+
+    if not isinstance(instruments, list) or not instruments:
+        raise ValueError("ERR#0144: instruments argument needs to be a non empty list of (product_type, name, country) "
+                         "tuples.")
+
+    for instrument in instruments:
+        if not isinstance(instrument, tuple) or len(instrument) not in [2, 3]:
+            raise ValueError("ERR#0144: instruments argument needs to be a non empty list of (product_type, name, "
+                             "country) tuples.")
+
+
+def check_date_range(from_date, to_date):
+    """
+    This function checks that the introduced dates are formatted as `dd/mm/yyyy` and that they make a valid date range,
+    i.e. that the from_date is before the to_date.
+
+    Args:
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+
+    Returns:
+        :obj:`tuple` - start_date, end_date:
+            The introduced dates, as :obj:`datetime.datetime`.
+
+    Raises:
+        ValueError: raised if any of the introduced dates is not valid or if they do not make a valid date range.
+
+    """
+
+    try:
+        start_date = datetime.strptime(from_date, '%d/%m/%Y')
+    except (ValueError, TypeError):
+        raise ValueError("ERR#0011: incorrect from_date date format, it should be 'dd/mm/yyyy'.")
+
+    try:
+        end_date = datetime.strptime(to_date, '%d/%m/%Y')
+    except (ValueError, TypeError):
+        raise ValueError("ERR#0012: incorrect to_date format, it should be 'dd/mm/yyyy'.")
+
+    if start_date >= end_date:
+        raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
+
+    return start_date, end_date
+
+
+def retrieve_instruments(instruments, from_date, to_date, max_workers, retrieve=historical_data_builder, check=None,
+                         limiter=None):
+    """
+    This function resolves the introduced financial products against their static data files and retrieves the
+    historical data of the resolved ones concurrently, on a pool of at most `max_workers` threads. An error resolving
+    or retrieving a financial product does not abort the rest of them, since the errors are collected and returned.
+
+    Args:
+        instruments (:obj:`list` of :obj:`tuple`):
+            financial products to retrieve historical data from, as checked by :func:`check_instruments`.
+        from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+        to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+        max_workers (:obj:`int`): maximum number of financial products being retrieved at the same time.
+        retrieve (:obj:`function`, optional):
+            function called with the schema, the static data row, the dates and the limiter of every resolved
+            financial product to retrieve its historical data, by default :func:`historical_data_builder`.
+        check (:obj:`function`, optional):
+            function called with the static data row of every resolved financial product, which raises if it can not
+            be retrieved, if any.
+        limiter (:obj:`threading.Semaphore`, optional):
+            semaphore shared by the requests of every financial product to cap how many of them are sent at the same
+            time, see :func:`investpy.utils.transport.post_concurrently`.
+
+    Returns:
+        :obj:`tuple` - retrieved, errors:
+            The static data row and the retrieved historical data of every retrieved financial product, and the
+            exceptions raised by the rest of them, both as :obj:`dict` whose keys are the introduced tuples.
+
+    """
+
+    errors = dict()
+    resolved = dict()
+
+    for instrument in instruments:
+        product_type, name, country = instrument if len(instrument) == 3 else instrument + (None,)
+
+        try:
+            row = resolve(product_type, name, country)
+
+            if check is not None:
+                check(row)
+
+            resolved[instrument] = (product_type.strip().lower(), row)
+        except Exception as e:
+            errors[instrument] = e
+
+    def retrieve_instrument(instrument):
+        product_type, row = resolved[instrument]
+
+        # the financial product has already been resolved, so its historical data is retrieved straight away
+        return retrieve(HISTORICAL_SCHEMAS[product_type], row, from_date, to_date, limiter=limiter)
+
+    retrieved = dict()
+
+    if resolved:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(resolved))) as executor:
+            futures = {instrument: executor.submit(retrieve_instrument, instrument) for instrument in resolved.keys()}
+
+        for instrument, future in futures.items():
+            try:
+                retrieved[instrument] = (resolved[instrument][1], future.result())
+            except Exception as e:
+                errors[instrument] = e
+
+    return retrieved, errors
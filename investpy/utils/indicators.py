@@ -0,0 +1,489 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import numpy as np
+
+
+TECHNICAL_INDICATORS = [
+    'RSI(14)', 'STOCH(9,6)', 'STOCHRSI(14)', 'MACD(12,26)', 'ADX(14)', 'Williams %R', 'CCI(14)', 'ATR(14)',
+    'Highs/Lows(14)', 'Ultimate Oscillator', 'ROC', 'Bull/Bear Power(13)'
+]
+
+# (upper, lower) bounds of the oscillators, above and below which they are overbought and oversold, respectively,
+# while they signal buy or sell depending on whether they are above or below the midpoint of both bounds
+OSCILLATOR_BOUNDS = {
+    'RSI(14)': (70., 30.),
+    'STOCH(9,6)': (80., 20.),
+    'STOCHRSI(14)': (80., 20.),
+    'Williams %R': (-20., -80.),
+    'CCI(14)': (200., -200.),
+    'Ultimate Oscillator': (70., 30.),
+}
+
+# below this ADX value there is no trend, so its signal is neutral
+ADX_TREND = 20.
+
+ROC_PERIOD = 12
+
+MOVING_AVERAGE_PERIODS = [5, 10, 20, 50, 100, 200]
+
+PIVOT_METHODS = ['Classic', 'Fibonacci', 'Camarilla', "Woodie's", "DeMark's"]
+
+PIVOT_LEVELS = ['s3', 's2', 's1', 'pivot_points', 'r1', 'r2', 'r3']
+
+
+def stack_columns(frames, column, length=None):
+    """
+    This function stacks the introduced column of several historical data :obj:`pandas.DataFrame` into a 2-D
+    instruments × time array, aligned on their last (most recent) value, so that the indicators of all of them can be
+    calculated at once. Shorter histories are padded with NaN on their beginning, which the indicators treat as not
+    enough data.
+
+    Args:
+        frames (:obj:`list`): historical data as returned by the historical data functions, in ascending order.
+        column (:obj:`str`): column to stack, i.e. `Open`, `High`, `Low` or `Close`.
+        length (:obj:`int`, optional): number of values to keep from every frame, if None all of them are kept.
+
+    Returns:
+        :obj:`numpy.ndarray` - values:
+            The values of the column, with a row per frame.
+
+    """
+
+    if length is None:
+        length = max([len(frame) for frame in frames] + [0])
+
+    values = np.full((len(frames), length), np.nan)
+
+    for row, frame in enumerate(frames):
+        column_values = frame[column].to_numpy(dtype=np.float64)[-length:] if length > 0 else np.empty(0)
+        values[row, length - len(column_values):] = column_values
+
+    return values
+
+
+def compact_rows(arrays):
+    """
+    This function moves the missing values of every row of the introduced 2-D instruments × time arrays to its
+    beginning, keeping the order of the rest of values, so that every row is aligned on its last value as if it was
+    stacked with :func:`stack_columns`. A value is missing if it is NaN in any of the arrays, e.g. the days on which
+    a financial product was not traded in a :class:`investpy.utils.panel.PricePanel`.
+
+    Args:
+        arrays (:obj:`list`): 2-D instruments × time arrays with the same shape, in ascending order.
+
+    Returns:
+        :obj:`list` - arrays:
+            The compacted arrays, in the same order as the introduced ones.
+
+    """
+
+    arrays = [np.asarray(values, dtype=np.float64) for values in arrays]
+
+    present = np.ones(arrays[0].shape, dtype=bool)
+    for values in arrays:
+        present &= ~np.isnan(values)
+
+    order = np.argsort(present, axis=1, kind='stable')
+    present = np.take_along_axis(present, order, axis=1)
+
+    return [np.where(present, np.take_along_axis(values, order, axis=1), np.nan) for values in arrays]
+
+
+def _shift(x, periods):
+    shifted = np.full(x.shape, np.nan)
+    shifted[:, periods:] = x[:, :x.shape[1] - periods]
+    return shifted
+
+
+def _rolling(x, window, reducer):
+    # rolling sums are calculated from the cumulative sums and rolling extremes by reducing the shifted arrays, as
+    # reducing over the windows of a strided view is several times slower, while any NaN in a window leads to NaN
+    rolled = np.full(x.shape, np.nan)
+    length = x.shape[1] - window + 1
+
+    if length <= 0:
+        return rolled
+
+    if reducer is np.add:
+        missing = np.isnan(x)
+        sums = np.concatenate([np.zeros((x.shape[0], 1)), np.cumsum(np.where(missing, 0., x), axis=1)], axis=1)
+        counts = np.concatenate([np.zeros((x.shape[0], 1), dtype=np.int64), np.cumsum(missing, axis=1)], axis=1)
+
+        rolled[:, window - 1:] = np.where(counts[:, window:] - counts[:, :length] > 0, np.nan,
+                                          sums[:, window:] - sums[:, :length])
+    else:
+        result = x[:, window - 1:].copy()
+
+        for offset in range(1, window):
+            reducer(result, x[:, window - 1 - offset:window - 1 - offset + length], out=result)
+
+        rolled[:, window - 1:] = result
+
+    return rolled
+
+
+def _sma(x, window):
+    return _rolling(x, window, np.add) / window
+
+
+def _mean_deviation(x, averages, window):
+    # mean absolute deviation of every window from its average, accumulated over the shifted arrays as the rolling
+    # extremes are, since the average of every window is different
+    deviation = np.full(x.shape, np.nan)
+    length = x.shape[1] - window + 1
+
+    if length <= 0:
+        return deviation
+
+    result = np.zeros((x.shape[0], length))
+
+    for offset in range(window):
+        result += np.abs(x[:, offset:offset + length] - averages[:, window - 1:])
+
+    deviation[:, window - 1:] = result / window
+
+    return deviation
+
+
+def _recursive(x, seeds, alpha):
+    # exponential smoothing of every row, which starts on the first value of its seeds, i.e. the first complete
+    # window of the row, that may be at a different position for every row, with a smoothing factor per row if any
+    smoothed = np.full(x.shape, np.nan)
+
+    complete = ~np.isnan(seeds)
+    if not complete.any():
+        return smoothed
+
+    previous = np.full(x.shape[0], np.nan)
+
+    for position in range(int(np.argmax(complete.any(axis=0))), x.shape[1]):
+        previous = np.where(np.isnan(previous), seeds[:, position], alpha * x[:, position] + (1. - alpha) * previous)
+        smoothed[:, position] = previous
+
+    return smoothed
+
+
+def _smooth(x, window, alpha):
+    # seeded with the simple average of the first `window` values of every row
+    return _recursive(x, _sma(x, window), alpha)
+
+
+def ema(x, window):
+    """
+    This function calculates the exponential moving average of every row of the introduced array, seeded with the
+    simple moving average of its first `window` values.
+
+    Args:
+        x (:obj:`numpy.ndarray`): 2-D instruments × time array, in ascending order.
+        window (:obj:`int`): number of periods of the average.
+
+    Returns:
+        :obj:`numpy.ndarray` - values:
+            The moving average, being NaN until there are `window` values.
+
+    """
+
+    return _smooth(x, window, 2. / (window + 1.))
+
+
+def wilder(x, window):
+    """
+    This function calculates the Wilder's smoothing of every row of the introduced array, i.e. an exponential moving
+    average with a smoothing factor of 1/`window`, as used by the RSI, the ATR and the ADX.
+
+    Args:
+        x (:obj:`numpy.ndarray`): 2-D instruments × time array, in ascending order.
+        window (:obj:`int`): number of periods of the average.
+
+    Returns:
+        :obj:`numpy.ndarray` - values:
+            The smoothed values, being NaN until there are `window` values.
+
+    """
+
+    return _smooth(x, window, 1. / window)
+
+
+def _divide(numerator, denominator, fill=np.nan):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = numerator / denominator
+
+    return np.where(denominator == 0, fill, result)
+
+
+def _true_range(high, low, previous_close):
+    # NaN on the first value of every row, as the previous close is unknown
+    return np.maximum(high, previous_close) - np.minimum(low, previous_close)
+
+
+def _masked(values, mask):
+    values[mask] = np.nan
+    return values
+
+
+def _rsi(close, window):
+    changes = close - _shift(close, 1)
+
+    gains, losses = wilder(np.maximum(changes, 0.), window), wilder(np.maximum(-changes, 0.), window)
+
+    values = 100. - _divide(100., 1. + _divide(gains, losses, fill=np.inf), fill=0.)
+    values[np.isnan(gains) | np.isnan(losses)] = np.nan
+
+    return values
+
+
+def technical_indicators_matrix(high, low, close):
+    """
+    This function calculates locally the technical indicators that Investing.com calculates, as retrieved by
+    :func:`investpy.technical.technical_indicators`, for several financial products at once from their high, low and
+    close prices, along with their buy/sell/neutral signals, labelled the same way. The indicators are calculated as:
+
+        * RSI(14): relative strength index, with Wilder's smoothing.
+        * STOCH(9,6): 9 periods stochastic %K, smoothed with a 6 periods simple moving average.
+        * STOCHRSI(14): 14 periods stochastic of the RSI(14).
+        * MACD(12,26): difference between the 12 and the 26 periods exponential moving averages of the close.
+        * ADX(14): average directional index, whose signal depends on the direction of the trend (+DI vs -DI).
+        * Williams %R: 14 periods Williams percent range.
+        * CCI(14): commodity channel index of the typical price.
+        * ATR(14): average true range, with Wilder's smoothing, whose signal depends on whether it is above its 14
+          periods simple moving average (high volatility) or not (less volatility).
+        * Highs/Lows(14): 14 periods average of the amount by which every high (low) exceeds the highest high (lowest
+          low) of the previous 14 periods.
+        * Ultimate Oscillator: 7, 14 and 28 periods ultimate oscillator.
+        * ROC: 12 periods rate of change, as a percentage.
+        * Bull/Bear Power(13): sum of the bull and bear powers, i.e. distances of the high and the low to the 13
+          periods exponential moving average of the close.
+
+    Note that the exponential averages depend on the first value of the history, so that enough history (i.e. a
+    couple hundred periods) should be provided for the values to match the ones calculated by Investing.com.
+
+    Args:
+        high (:obj:`numpy.ndarray`): 2-D instruments × time array of high prices, in ascending order.
+        low (:obj:`numpy.ndarray`): 2-D instruments × time array of low prices, in ascending order.
+        close (:obj:`numpy.ndarray`): 2-D instruments × time array of close prices, in ascending order.
+
+    Returns:
+        :obj:`tuple` - values, signals:
+            The values of the indicators, as a :obj:`numpy.ndarray` with a row per financial product and a column per
+            indicator (in the order of :const:`TECHNICAL_INDICATORS`), and their signals, as an array of :obj:`str`
+            with the same shape, which are None where there is not enough history to calculate the indicator.
+
+    Raises:
+        ValueError: raised if the introduced arrays are not 2-D or do not have the same shape.
+
+    """
+
+    high, low, close = [np.asarray(values, dtype=np.float64) for values in (high, low, close)]
+
+    if high.ndim != 2 or not high.shape == low.shape == close.shape:
+        raise ValueError("ERR#0169: high, low and close must be 2-D instruments x time arrays with the same shape.")
+
+    if close.shape[1] == 0:
+        values = np.full((close.shape[0], len(TECHNICAL_INDICATORS)), np.nan)
+        return values, np.full(values.shape, None, dtype=object)
+
+    previous_close = _shift(close, 1)
+    true_range = _true_range(high, low, previous_close)
+    highest, lowest = _rolling(high, 14, np.maximum), _rolling(low, 14, np.minimum)
+
+    rsi_values = _rsi(close, 14)
+
+    stoch_high, stoch_low = _rolling(high, 9, np.maximum), _rolling(low, 9, np.minimum)
+    fast_k = 100. * _divide(close - stoch_low, stoch_high - stoch_low)
+
+    rsi_high, rsi_low = _rolling(rsi_values, 14, np.maximum), _rolling(rsi_values, 14, np.minimum)
+    stoch_rsi = 100. * _divide(rsi_values - rsi_low, rsi_high - rsi_low)
+
+    high_moves, low_moves = high - _shift(high, 1), _shift(low, 1) - low
+    unknown = np.isnan(high_moves) | np.isnan(low_moves)
+    plus_dm = _masked(np.where((high_moves > low_moves) & (high_moves > 0), high_moves, 0.), unknown)
+    minus_dm = _masked(np.where((low_moves > high_moves) & (low_moves > 0), low_moves, 0.), unknown)
+
+    atr_values = wilder(true_range, 14)
+    plus_di = 100. * _divide(wilder(plus_dm, 14), atr_values)
+    minus_di = 100. * _divide(wilder(minus_dm, 14), atr_values)
+    dx = _masked(100. * _divide(np.abs(plus_di - minus_di), plus_di + minus_di, fill=0.),
+                 np.isnan(plus_di) | np.isnan(minus_di))
+    adx_values = wilder(dx, 14)
+
+    typical = (high + low + close) / 3.
+    typical_sma = _sma(typical, 14)
+    cci_values = _divide(typical - typical_sma, 0.015 * _mean_deviation(typical, typical_sma, 14))
+
+    new_highs, new_lows = high - _shift(highest, 1), low - _shift(lowest, 1)
+    highs_lows = _sma(_masked(np.where(new_highs > 0, new_highs, 0.) + np.where(new_lows < 0, new_lows, 0.),
+                              np.isnan(new_highs) | np.isnan(new_lows)), 14)
+
+    buying_pressure = close - np.minimum(low, previous_close)
+    averages = [_divide(_rolling(buying_pressure, window, np.add), _rolling(true_range, window, np.add))
+                for window in (7, 14, 28)]
+    ultimate = 100. * (4. * averages[0] + 2. * averages[1] + averages[2]) / 7.
+
+    close_ema = ema(close, 13)
+
+    columns = {
+        'RSI(14)': rsi_values,
+        'STOCH(9,6)': _sma(fast_k, 6),
+        'STOCHRSI(14)': stoch_rsi,
+        'MACD(12,26)': ema(close, 12) - ema(close, 26),
+        'ADX(14)': adx_values,
+        'Williams %R': -100. * _divide(highest - close, highest - lowest),
+        'CCI(14)': cci_values,
+        'ATR(14)': atr_values,
+        'Highs/Lows(14)': highs_lows,
+        'Ultimate Oscillator': ultimate,
+        'ROC': 100. * _divide(close - _shift(close, ROC_PERIOD), _shift(close, ROC_PERIOD)),
+        'Bull/Bear Power(13)': (high - close_ema) + (low - close_ema),
+    }
+
+    values = np.stack([columns[indicator][:, -1] for indicator in TECHNICAL_INDICATORS], axis=1)
+
+    signals = np.full(values.shape, None, dtype=object)
+
+    for position, indicator in enumerate(TECHNICAL_INDICATORS):
+        value = values[:, position]
+
+        if indicator in OSCILLATOR_BOUNDS:
+            upper, lower = OSCILLATOR_BOUNDS[indicator]
+            middle = (upper + lower) / 2.
+            signal = np.select([value > upper, value < lower, value > middle, value < middle],
+                               ['overbought', 'oversold', 'buy', 'sell'], 'neutral')
+        elif indicator == 'ADX(14)':
+            direction = plus_di[:, -1] - minus_di[:, -1]
+            signal = np.select([value < ADX_TREND, direction > 0, direction < 0], ['neutral', 'buy', 'sell'],
+                               'neutral')
+        elif indicator == 'ATR(14)':
+            signal = np.where(value > _sma(atr_values, 14)[:, -1], 'high_volatility', 'less_volatility')
+        else:
+            signal = np.select([value > 0, value < 0], ['buy', 'sell'], 'neutral')
+
+        signals[:, position] = np.where(np.isnan(value), None, signal.astype(object))
+
+    return values, signals
+
+
+def moving_averages_matrix(close, periods=None):
+    """
+    This function calculates locally the simple and exponential moving averages that Investing.com calculates, as
+    retrieved by :func:`investpy.technical.moving_averages`, for several financial products at once from their close
+    prices, along with their signals, which are `buy` if the last close is above the moving average and `sell` if it
+    is below it. Every simple moving average is calculated from the same cumulative sums, while the exponential
+    moving averages of every period are calculated in a single recursive pass, seeded with the simple ones.
+
+    Args:
+        close (:obj:`numpy.ndarray`): 2-D instruments × time array of close prices, in ascending order.
+        periods (:obj:`list`, optional): periods of the moving averages, if None :const:`MOVING_AVERAGE_PERIODS`.
+
+    Returns:
+        :obj:`dict` - moving_averages:
+            The `sma_value`, `sma_signal`, `ema_value` and `ema_signal` of every financial product, each one as a
+            :obj:`numpy.ndarray` with a row per financial product and a column per period, where the signals are None
+            if there is not enough history to calculate the moving average.
+
+    Raises:
+        ValueError: raised if the introduced arguments are not valid.
+
+    """
+
+    close = np.asarray(close, dtype=np.float64)
+    periods = MOVING_AVERAGE_PERIODS if periods is None else list(periods)
+
+    if close.ndim != 2:
+        raise ValueError("ERR#0171: close must be a 2-D instruments x time array.")
+
+    if not periods or not all(isinstance(period, int) and period > 0 for period in periods):
+        raise ValueError("ERR#0172: periods must be a list of positive int values.")
+
+    rows, length = close.shape
+
+    missing = np.isnan(close)
+    sums = np.concatenate([np.zeros((rows, 1)), np.cumsum(np.where(missing, 0., close), axis=1)], axis=1)
+    counts = np.concatenate([np.zeros((rows, 1), dtype=np.int64), np.cumsum(missing, axis=1)], axis=1)
+
+    seeds = np.full((len(periods) * rows, length), np.nan)
+
+    for position, period in enumerate(periods):
+        if period <= length:
+            seeds[position * rows:(position + 1) * rows, period - 1:] = np.where(
+                counts[:, period:] - counts[:, :length - period + 1] > 0, np.nan,
+                (sums[:, period:] - sums[:, :length - period + 1]) / period
+            )
+
+    alphas = np.repeat([2. / (period + 1.) for period in periods], rows)
+    emas = _recursive(np.tile(close, (len(periods), 1)), seeds, alphas)
+
+    if length == 0:
+        sma_values = ema_values = np.full((rows, len(periods)), np.nan)
+        last = np.full(rows, np.nan)
+    else:
+        sma_values = seeds[:, -1].reshape(len(periods), rows).T
+        ema_values = emas[:, -1].reshape(len(periods), rows).T
+        last = close[:, -1]
+
+    moving_averages = {'sma_value': sma_values, 'ema_value': ema_values}
+
+    for kind in ['sma', 'ema']:
+        values = moving_averages[kind + '_value']
+        signals = np.select([last[:, None] > values, last[:, None] < values], ['buy', 'sell'], 'neutral')
+        moving_averages[kind + '_signal'] = np.where(np.isnan(values), None, signals.astype(object))
+
+    return {key: moving_averages[key] for key in ['sma_value', 'sma_signal', 'ema_value', 'ema_signal']}
+
+
+def pivot_points_matrix(open_, high, low, close):
+    """
+    This function calculates locally the pivot points that Investing.com calculates, as retrieved by
+    :func:`investpy.technical.pivot_points`, for several financial products at once from the open, high, low and
+    close prices of their previous period, with the Classic, Fibonacci, Camarilla, Woodie's and DeMark's methods.
+    Note that the Camarilla pivot point is the Classic one and that DeMark's method has just one support and one
+    resistance level.
+
+    Args:
+        open_ (:obj:`numpy.ndarray`): open price of the previous period of every financial product.
+        high (:obj:`numpy.ndarray`): high price of the previous period of every financial product.
+        low (:obj:`numpy.ndarray`): low price of the previous period of every financial product.
+        close (:obj:`numpy.ndarray`): close price of the previous period of every financial product.
+
+    Returns:
+        :obj:`numpy.ndarray` - pivot_points:
+            The levels of every method for every financial product, with shape (financial products, methods, levels),
+            in the order of :const:`PIVOT_METHODS` and :const:`PIVOT_LEVELS`, where the levels that the method does not
+            define are NaN.
+
+    Raises:
+        ValueError: raised if the introduced arrays are not 1-D or do not have the same shape.
+
+    """
+
+    open_, high, low, close = [np.asarray(values, dtype=np.float64) for values in (open_, high, low, close)]
+
+    if open_.ndim != 1 or not open_.shape == high.shape == low.shape == close.shape:
+        raise ValueError("ERR#0174: open, high, low and close must be 1-D arrays with a value per financial product.")
+
+    pivot_points = np.full((len(close), len(PIVOT_METHODS), len(PIVOT_LEVELS)), np.nan)
+
+    pivot = (high + low + close) / 3.
+    spread = high - low
+
+    pivot_points[:, 0] = np.stack([low - 2. * (high - pivot), pivot - spread, 2. * pivot - high, pivot,
+                                   2. * pivot - low, pivot + spread, high + 2. * (pivot - low)], axis=1)
+
+    pivot_points[:, 1] = pivot[:, None] + np.outer(spread, [-1., -.618, -.382, 0., .382, .618, 1.])
+
+    pivot_points[:, 2] = close[:, None] + np.outer(spread, [-1.1 / 4., -1.1 / 6., -1.1 / 12., 0., 1.1 / 12.,
+                                                            1.1 / 6., 1.1 / 4.])
+    pivot_points[:, 2, 3] = pivot
+
+    woodie = (high + low + 2. * close) / 4.
+    pivot_points[:, 3] = np.stack([low - 2. * (high - woodie), woodie - spread, 2. * woodie - high, woodie,
+                                   2. * woodie - low, woodie + spread, high + 2. * (woodie - low)], axis=1)
+
+    demark = np.select([close < open_, close > open_], [high + 2. * low + close, 2. * high + low + close],
+                       high + low + 2. * close)
+    demark[np.isnan(open_) | np.isnan(close)] = np.nan
+    pivot_points[:, 4, 2] = demark / 2. - high
+    pivot_points[:, 4, 3] = demark / 4.
+    pivot_points[:, 4, 4] = demark / 2. - low
+
+    return pivot_points
@@ -0,0 +1,621 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import os
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .data import epoch_to_dates
+from .historical import check_date_range, check_instruments, retrieve_instruments
+
+
+PANEL_MAGIC = b'INVPANEL'
+
+PANEL_VERSION = 1
+
+PANEL_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+# the data of every panel file starts at a multiple of this amount of bytes, so that every value is aligned
+ALIGNMENT = 64
+
+DEFAULT_MAX_WORKERS = 8
+
+CALENDARS = ['union', 'intersection']
+
+# None leaves the days without a bar as NaN, `ffill` repeats the previous bar and `close` fills the open, high, low
+# and close with the previous close, while the volume of the filled days is always 0
+FILL_RULES = [None, 'ffill', 'close']
+
+
+class PricePanel(object):
+    """
+    This class is used to keep the daily OHLCV data of a universe of financial products in a single memory-mapped file
+    on disk, as aligned arrays indexed by trading day and financial product, so that e.g. the close values of thousands
+    of stocks can be loaded at once as a NumPy array or as a :obj:`pandas.DataFrame` without copying them. Each
+    financial product is identified by its id in the static data files, and the universe of financial products is
+    fixed when the file is created. The file contains a record per trading day, with its date and its open, high, low,
+    close and volume values for every financial product (NaN if there is no data), so that new trading days are just
+    appended to the end of the file.
+
+    Args:
+        path (:obj:`str`): path to the panel file, created if it does not exist.
+        ids (:obj:`list`, optional):
+            ids of the financial products of the universe of the panel, as found in the static data files, which are
+            mandatory to create the file, and checked against the ones of the file otherwise.
+
+    Attributes:
+        path (:obj:`str`): path to the panel file.
+        ids (:obj:`list` of :obj:`str`): ids of the financial products of the universe of the panel, in order.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or if the file is not a panel file.
+
+    Examples:
+        >>> panel = investpy.utils.panel.PricePanel('closes.panel', ids=[446, 474])
+        >>> investpy.utils.panel.update_panel(panel, [('stock', 'bbva', 'spain'), ('stock', 'san', 'spain')],
+        ...                                   from_date='01/01/2019', to_date='01/01/2020')
+        {}
+        >>> panel.frame('close').head(2)
+                      446    474
+        Date
+        2019-01-02  4.676  3.975
+        2019-01-03  4.600  3.929
+
+    """
+
+    def __init__(self, path, ids=None):
+        if not path or not isinstance(path, str):
+            raise ValueError("ERR#0164: path argument needs to be a str.")
+
+        if ids is not None:
+            if not isinstance(ids, list) or not ids:
+                raise ValueError("ERR#0165: ids argument needs to be a non empty list of ids of financial products.")
+
+            ids = [str(id_) for id_ in ids]
+
+            if len(set(ids)) != len(ids):
+                raise ValueError("ERR#0165: ids argument needs to be a non empty list of unique ids of financial "
+                                 "products.")
+
+        self.path = path
+
+        if os.path.exists(path):
+            self.ids, self._offset = self._read_header(path)
+
+            if ids is not None and ids != self.ids:
+                raise ValueError("ERR#0165: ids argument does not match the ids of the existing panel file.")
+        elif ids is None:
+            raise ValueError("ERR#0165: ids argument is mandatory to create a new panel file.")
+        else:
+            self.ids = ids
+            self._offset = self._write_header(path, ids)
+
+        self._positions = {id_: position for position, id_ in enumerate(self.ids)}
+        self._dtype = np.dtype([('date', '<i8'), ('values', '<f8', (len(PANEL_FIELDS), len(self.ids)))])
+
+        self._map()
+
+    @staticmethod
+    def _read_header(path):
+        with open(path, 'rb') as f:
+            prefix = f.read(16)
+
+            if len(prefix) < 16 or prefix[:8] != PANEL_MAGIC:
+                raise ValueError("ERR#0166: " + path + " is not a panel file.")
+
+            version = int.from_bytes(prefix[8:12], 'little')
+            length = int.from_bytes(prefix[12:16], 'little')
+
+            if version != PANEL_VERSION:
+                raise ValueError("ERR#0166: " + path + " is a panel file of an unsupported version.")
+
+            header = json.loads(f.read(length).decode('utf-8'))
+
+        return header['ids'], _aligned(16 + length)
+
+    @staticmethod
+    def _write_header(path, ids, size=0):
+        header = json.dumps({'ids': ids, 'fields': PANEL_FIELDS}).encode('utf-8')
+        offset = _aligned(16 + len(header))
+
+        with open(path, 'wb') as f:
+            f.write(PANEL_MAGIC + PANEL_VERSION.to_bytes(4, 'little') + len(header).to_bytes(4, 'little') + header)
+            f.truncate(offset + size)
+
+        return offset
+
+    def _map(self, mode='r'):
+        length = (os.path.getsize(self.path) - self._offset) // self._dtype.itemsize
+
+        if length == 0:
+            self._records = np.zeros(0, dtype=self._dtype)
+        else:
+            self._records = np.memmap(self.path, dtype=self._dtype, mode=mode, offset=self._offset, shape=(length,))
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return "PricePanel(" + repr(self.path) + ", days=" + str(len(self)) + ", ids=" + str(len(self.ids)) + ")"
+
+    @property
+    def days(self):
+        """
+        The trading days of the panel, in ascending order, as a :obj:`numpy.int64` array of days since epoch, which
+        is a view of the file.
+        """
+
+        return self._records['date']
+
+    @property
+    def dates(self):
+        """
+        The trading days of the panel, in ascending order, as a :obj:`pandas.DatetimeIndex`.
+        """
+
+        return epoch_to_dates(self.days, unit='D')
+
+    def array(self, field):
+        """
+        This method returns the values of the introduced field of every financial product on every trading day, as a
+        view of the file, so that no data is copied nor read until it is used. Note that the view is not updated when
+        new trading days are added to the panel.
+
+        Args:
+            field (:obj:`str`): field to return, which can either be `open`, `high`, `low`, `close` or `volume`.
+
+        Returns:
+            :obj:`numpy.ndarray` - values:
+                The :obj:`numpy.float64` values of the introduced field, with a row per trading day and a column per
+                financial product, in the order of :attr:`ids`.
+
+        Raises:
+            ValueError: raised if the introduced field is not valid.
+
+        """
+
+        if field not in PANEL_FIELDS:
+            raise ValueError("ERR#0167: field argument can just be either 'open', 'high', 'low', 'close' or 'volume'.")
+
+        return self._records['values'][:, PANEL_FIELDS.index(field), :]
+
+    def frame(self, field, ids=None):
+        """
+        This method returns the values of the introduced field as a :obj:`pandas.DataFrame` indexed by trading day,
+        with a column per financial product, which is a view of the file if no ids are introduced.
+
+        Args:
+            field (:obj:`str`): field to return, which can either be `open`, `high`, `low`, `close` or `volume`.
+            ids (:obj:`list`, optional): ids of the financial products to return, if None every one is returned.
+
+        Returns:
+            :obj:`pandas.DataFrame` - values:
+                The values of the introduced field, with a row per trading day and a column per financial product.
+
+        Raises:
+            ValueError: raised if any of the introduced arguments is not valid.
+
+        """
+
+        values = self.array(field)
+
+        if ids is None:
+            return pd.DataFrame(values, index=self.dates, columns=self.ids, copy=False)
+
+        ids = [str(id_) for id_ in ids]
+
+        for id_ in ids:
+            if id_ not in self._positions:
+                raise ValueError("ERR#0168: id " + id_ + " is not in the universe of the panel.")
+
+        return pd.DataFrame(values[:, [self._positions[id_] for id_ in ids]], index=self.dates, columns=ids)
+
+    def update(self, data):
+        """
+        This method writes the introduced historical data into the panel, replacing the values of the same trading days
+        and financial products. The trading days which are not in the panel yet are added to it, which just appends
+        them to the end of the file if they are later than every trading day in the panel, and rewrites the file
+        otherwise.
+
+        Args:
+            data (:obj:`dict`):
+                historical data of each financial product, with the id of the financial product as key and its daily
+                historical data as value, as returned by :meth:`investpy.utils.data.HistoricalData.columns`.
+
+        Raises:
+            ValueError: raised if any of the introduced financial products is not in the universe of the panel.
+
+        """
+
+        data = {str(id_): columns for id_, columns in data.items()}
+
+        for id_ in data.keys():
+            if id_ not in self._positions:
+                raise ValueError("ERR#0168: id " + id_ + " is not in the universe of the panel.")
+
+        if not data:
+            return
+
+        days = np.asarray(self.days)
+        union = np.union1d(days, np.concatenate([np.asarray(columns['date'], dtype=np.int64)
+                                                 for columns in data.values()]))
+
+        if len(union) > len(days):
+            if np.array_equal(union[:len(days)], days):
+                self._append(union[len(days):])
+            else:
+                self._rewrite(union)
+
+        self._map(mode='r+')
+
+        values = self._records['values']
+        days = self._records['date']
+
+        for id_, columns in data.items():
+            rows = np.searchsorted(days, np.asarray(columns['date'], dtype=np.int64))
+
+            for index, field in enumerate(PANEL_FIELDS):
+                if field in columns:
+                    values[rows, index, self._positions[id_]] = columns[field]
+
+        if isinstance(self._records, np.memmap):
+            self._records.flush()
+
+        self._map()
+
+    def _empty(self, days):
+        records = np.empty(len(days), dtype=self._dtype)
+        records['date'] = days
+        records['values'] = np.nan
+
+        return records
+
+    def _append(self, days):
+        self._records = None
+
+        with open(self.path, 'ab') as f:
+            f.write(self._empty(days).tobytes())
+
+    def _rewrite(self, days):
+        previous = self._records
+        path = self.path + '.tmp'
+
+        self._write_header(path, self.ids, size=len(days) * self._dtype.itemsize)
+
+        records = np.memmap(path, dtype=self._dtype, mode='r+', offset=self._offset, shape=(len(days),))
+        records['date'] = days
+        records['values'] = np.nan
+
+        if len(previous) > 0:
+            records[np.searchsorted(days, previous['date'])] = previous
+
+        records.flush()
+
+        del records
+        self._records = previous = None
+
+        os.replace(path, self.path)
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class AlignedPanel(object):
+    """
+    This class contains the historical data of several financial products aligned on a common trading calendar, as a
+    single 3-D array of values indexed by field, trading day and financial product, so that it can be used as a
+    matrix without concatenating a :obj:`pandas.DataFrame` per financial product. The metadata of every financial
+    product, such as its currency, is stored once per financial product instead of on every row.
+
+    Args:
+        instruments (:obj:`list` of :obj:`tuple`): financial products of the panel, as introduced.
+        days (:obj:`numpy.ndarray`): trading days of the panel, as :obj:`numpy.int64` days since epoch.
+        values (:obj:`numpy.ndarray`): values of the panel, with shape (fields, trading days, financial products).
+        metadata (:obj:`pandas.DataFrame`): metadata of the financial products, with a row per financial product.
+
+    Attributes:
+        instruments (:obj:`list` of :obj:`tuple`): financial products of the panel, in order.
+        fields (:obj:`list` of :obj:`str`): fields of the values, i.e. `open`, `high`, `low`, `close` and `volume`.
+        days (:obj:`numpy.ndarray`): trading days of the panel, as :obj:`numpy.int64` days since epoch.
+        values (:obj:`numpy.ndarray`): values of the panel, with shape (fields, trading days, financial products).
+        metadata (:obj:`pandas.DataFrame`):
+            metadata of the financial products, indexed by position, with their `product_type`, `name`, `country`,
+            `id`, `currency` and `exchange`.
+
+    """
+
+    def __init__(self, instruments, days, values, metadata):
+        self.instruments = list(instruments)
+        self.fields = list(PANEL_FIELDS)
+        self.days = days
+        self.values = values
+        self.metadata = metadata
+
+    def __len__(self):
+        return len(self.days)
+
+    def __repr__(self):
+        return "AlignedPanel(days=" + str(len(self)) + ", instruments=" + str(len(self.instruments)) + \
+               ", dtype=" + str(self.values.dtype) + ")"
+
+    @property
+    def dates(self):
+        """
+        The trading days of the panel, in ascending order, as a :obj:`pandas.DatetimeIndex`.
+        """
+
+        return epoch_to_dates(self.days, unit='D')
+
+    @property
+    def currencies(self):
+        """
+        The currency of every financial product, as a :obj:`dict` whose keys are the introduced tuples.
+        """
+
+        return dict(zip(self.instruments, self.metadata['currency'].tolist()))
+
+    def array(self, field):
+        """
+        This method returns the values of the introduced field of every financial product on every trading day, as a
+        view of the values of the panel.
+
+        Args:
+            field (:obj:`str`): field to return, which can either be `open`, `high`, `low`, `close` or `volume`.
+
+        Returns:
+            :obj:`numpy.ndarray` - values:
+                The values of the introduced field, with a row per trading day and a column per financial product.
+
+        Raises:
+            ValueError: raised if the introduced field is not valid.
+
+        """
+
+        if field not in self.fields:
+            raise ValueError("ERR#0167: field argument can just be either 'open', 'high', 'low', 'close' or 'volume'.")
+
+        return self.values[self.fields.index(field)]
+
+    def frame(self, field):
+        """
+        This method returns the values of the introduced field as a wide :obj:`pandas.DataFrame` indexed by trading
+        day, with a column per financial product, named after the introduced tuples.
+
+        Args:
+            field (:obj:`str`): field to return, which can either be `open`, `high`, `low`, `close` or `volume`.
+
+        Returns:
+            :obj:`pandas.DataFrame` - values:
+                The values of the introduced field, with a row per trading day and a column per financial product.
+
+        Raises:
+            ValueError: raised if the introduced field is not valid.
+
+        """
+
+        return pd.DataFrame(self.array(field), index=self.dates,
+                            columns=pd.Index(self.instruments, tupleize_cols=False), copy=False)
+
+
+def align_columns(data, calendar='union', fill=None, dtype=np.float64):
+    """
+    This function aligns the daily historical data of several financial products on a common trading calendar, which
+    is either the union of their trading days or the intersection of them, i.e. the days on which every financial
+    product was traded, into a single 3-D array.
+
+    Args:
+        data (:obj:`list` of :obj:`dict`):
+            historical data of every financial product, as returned by
+            :meth:`investpy.utils.data.HistoricalData.columns`.
+        calendar (:obj:`str`, optional): trading calendar, which can either be `union` or `intersection`.
+        fill (:obj:`str`, optional):
+            how to fill the trading days without a bar of a financial product: None leaves them as NaN, `ffill`
+            repeats the previous bar and `close` fills the open, high, low and close with the previous close, while
+            the volume of the filled days is 0. The days before the first bar of a financial product are never filled.
+        dtype (:obj:`numpy.dtype`, optional): type of the values, either :obj:`numpy.float64` or :obj:`numpy.float32`.
+
+    Returns:
+        :obj:`tuple` - days, values:
+            The trading days of the calendar, as :obj:`numpy.int64` days since epoch, and the values of the financial
+            products, with shape (fields, trading days, financial products), where the fields are `open`, `high`,
+            `low`, `close` and `volume` (NaN if the financial product has no volume).
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid.
+
+    """
+
+    if calendar not in CALENDARS:
+        raise ValueError("ERR#0179: calendar argument can just be either 'union' or 'intersection'.")
+
+    if fill not in FILL_RULES:
+        raise ValueError("ERR#0180: fill argument can just be either None, 'ffill' or 'close'.")
+
+    if np.dtype(dtype) not in [np.dtype(np.float32), np.dtype(np.float64)]:
+        raise ValueError("ERR#0181: dtype argument can just be either numpy.float32 or numpy.float64.")
+
+    dates = [np.asarray(columns['date'], dtype=np.int64) for columns in data]
+
+    if not dates:
+        days = np.zeros(0, dtype=np.int64)
+    elif calendar == 'union':
+        days = np.unique(np.concatenate(dates))
+    else:
+        days, counts = np.unique(np.concatenate([np.unique(values) for values in dates]), return_counts=True)
+        days = days[counts == len(dates)]
+
+    # every financial product is written as a contiguous row, which is several times faster than writing strided
+    # columns, and then the values are transposed at once
+    values = np.full((len(PANEL_FIELDS), len(data), len(days)), np.nan, dtype=dtype)
+
+    for row, (columns, positions) in enumerate(zip(data, dates)):
+        indices = np.searchsorted(days, positions)
+        found = indices < len(days)
+        found[found] = days[indices[found]] == positions[found]
+
+        for index, field in enumerate(PANEL_FIELDS):
+            if field in columns:
+                values[index, row, indices[found]] = np.asarray(columns[field])[found]
+
+    values = np.ascontiguousarray(values.transpose(0, 2, 1))
+
+    if fill is not None and len(days) > 0:
+        present = ~np.isnan(values[PANEL_FIELDS.index('close')])
+
+        # position of the last bar on or before every trading day, -1 if there is none yet
+        last = np.maximum.accumulate(np.where(present, np.arange(len(days))[:, None], -1), axis=0)
+        filled = ~present & (last >= 0)
+
+        rows, columns = np.nonzero(filled)
+        sources = last[rows, columns]
+
+        for index, field in enumerate(PANEL_FIELDS):
+            if field == 'volume':
+                values[index, rows, columns] = 0
+            else:
+                source = field if fill == 'ffill' else 'close'
+                values[index, rows, columns] = values[PANEL_FIELDS.index(source), sources, columns]
+
+    return days, values
+
+
+def update_panel(panel, instruments, from_date, to_date, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    This function retrieves the daily historical data of the introduced financial products in the introduced date
+    range, concurrently, and writes it into the introduced panel. The historical data is retrieved as the
+    `get_*_historical_data` functions retrieve it, so it is served from the historical data store if it has been set
+    (see :func:`investpy.utils.store.set_store`). Note that an error retrieving the historical data of a financial
+    product does not abort the retrieval of the rest of them, since the errors are collected and returned.
+
+    Args:
+        panel (:obj:`investpy.utils.panel.PricePanel`): panel to write the historical data into.
+        instruments (:obj:`list` of :obj:`tuple`):
+            financial products to retrieve historical data from, as `(product_type, name, country)` tuples, as in
+            :func:`investpy.get_historical_data_bulk`, which need to be in the universe of the panel.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        max_workers (:obj:`int`, optional):
+            maximum number of financial products being retrieved, and of requests being sent, at the same time.
+
+    Returns:
+        :obj:`dict` - errors:
+            The introduced tuples of the financial products that could not be retrieved, along with the raised
+            exceptions.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+
+    """
+
+    check_instruments(instruments)
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        raise ValueError("ERR#0146: max_workers argument needs to be an integer greater than 0.")
+
+    start_date, end_date = check_date_range(from_date, to_date)
+
+    def check(row):
+        if str(row['id']) not in panel.ids:
+            raise ValueError("ERR#0168: id " + str(row['id']) + " is not in the universe of the panel.")
+
+    retrieved, errors = retrieve_instruments(instruments, start_date, end_date, max_workers, check=check,
+                                             limiter=threading.BoundedSemaphore(max_workers))
+
+    panel.update({row['id']: data.columns() for instrument, (row, data) in retrieved.items()})
+
+    return errors
+
+
+def build_aligned_panel(instruments, from_date, to_date, calendar='union', fill=None, dtype='float64',
+                        max_workers=DEFAULT_MAX_WORKERS):
+    """
+    This function retrieves the daily historical data of the introduced financial products in the introduced date
+    range, concurrently, and aligns it on a common trading calendar as an :class:`AlignedPanel`, i.e. a single 3-D
+    array indexed by field, trading day and financial product, with the currency of every financial product stored
+    once, instead of a :obj:`pandas.DataFrame` per financial product with a `Currency` value per row. The historical
+    data is retrieved as the `get_*_historical_data` functions retrieve it, so it is served from the historical data
+    store if it has been set (see :func:`investpy.utils.store.set_store`). Note that an error retrieving the historical
+    data of a financial product does not abort the retrieval of the rest of them, since the errors are collected and
+    returned, and those financial products are not included in the panel.
+
+    Args:
+        instruments (:obj:`list` of :obj:`tuple`):
+            financial products to retrieve historical data from, as `(product_type, name, country)` tuples, as in
+            :func:`investpy.get_historical_data_bulk`.
+        from_date (:obj:`str`): date formatted as `dd/mm/yyyy`, since when data is going to be retrieved.
+        to_date (:obj:`str`): date formatted as `dd/mm/yyyy`, until when data is going to be retrieved.
+        calendar (:obj:`str`, optional):
+            trading calendar of the panel, which can either be `union` (the days on which any financial product was
+            traded) or `intersection` (the days on which every financial product was traded).
+        fill (:obj:`str`, optional):
+            how to fill the trading days without a bar of a financial product, which can either be None (NaN),
+            `ffill` (the previous bar) or `close` (the previous close), as in :func:`align_columns`.
+        dtype (:obj:`str`, optional): type of the values, which can either be `float64` or `float32`.
+        max_workers (:obj:`int`, optional):
+            maximum number of financial products being retrieved, and of requests being sent, at the same time.
+
+    Returns:
+        :obj:`tuple` - panel, errors:
+            The :class:`AlignedPanel` with the historical data of the retrieved financial products, in the introduced
+            order, and the errors, as a :obj:`dict` whose keys are the introduced tuples of the financial products that
+            could not be retrieved and whose values are the raised exceptions.
+
+    Raises:
+        ValueError: raised whenever any of the introduced arguments is not valid or errored.
+
+    Examples:
+        >>> panel, errors = investpy.build_aligned_panel([('stock', 'bbva', 'spain'), ('index', 'ibex 35', 'spain'),
+        ...                                              ('currency_cross', 'EUR/USD')],
+        ...                                             from_date='01/01/2019', to_date='01/01/2020', fill='close')
+        >>> panel.currencies
+        {('stock', 'bbva', 'spain'): 'EUR', ('index', 'ibex 35', 'spain'): 'EUR', ('currency_cross', 'EUR/USD'): 'USD'}
+        >>> closes = panel.frame('close')
+
+    """
+
+    check_instruments(instruments)
+
+    if dtype not in ['float64', 'float32']:
+        raise ValueError("ERR#0181: dtype argument can just be either 'float64' or 'float32'.")
+
+    if calendar not in CALENDARS:
+        raise ValueError("ERR#0179: calendar argument can just be either 'union' or 'intersection'.")
+
+    if fill not in FILL_RULES:
+        raise ValueError("ERR#0180: fill argument can just be either None, 'ffill' or 'close'.")
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        raise ValueError("ERR#0146: max_workers argument needs to be an integer greater than 0.")
+
+    start_date, end_date = check_date_range(from_date, to_date)
+
+    retrieved, errors = retrieve_instruments(instruments, start_date, end_date, max_workers,
+                                             limiter=threading.BoundedSemaphore(max_workers))
+
+    instruments = [instrument for instrument in instruments if instrument in retrieved]
+
+    days, values = align_columns([retrieved[instrument][1].columns() for instrument in instruments],
+                                 calendar=calendar, fill=fill, dtype=dtype)
+
+    metadata = list()
+
+    for instrument in instruments:
+        product_type, name, country = instrument if len(instrument) == 3 else instrument + (None,)
+        row, data = retrieved[instrument]
+
+        metadata.append({
+            'product_type': product_type,
+            'name': name,
+            'country': country,
+            'id': row['id'],
+            'currency': data.currency,
+            'exchange': data.exchange,
+        })
+
+    metadata = pd.DataFrame(metadata, columns=['product_type', 'name', 'country', 'id', 'currency', 'exchange'])
+
+    return AlignedPanel(instruments, days, values, metadata), errors
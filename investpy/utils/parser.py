@@ -0,0 +1,134 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import re
+
+import numpy as np
+
+from lxml.html import fromstring
+
+
+TABLE_ID = re.compile(r'''\bid=["']curr_table["']''')
+REAL_VALUE = re.compile(r'''data-real-value=["']([^"']*)''')
+
+ROWS = ".//table[@id='curr_table']/tbody/tr"
+
+NO_RESULTS = 'No results found'
+
+PRICE_COLUMNS = ['close', 'open', 'high', 'low']
+
+
+def parse_historical_data(text, volume=False):
+    """
+    This function parses the historical data table (`curr_table`) of a response of the `HistoricalDataAjax` endpoint
+    of Investing.com into NumPy columns, which is the response sent when retrieving both recent and historical data
+    from any financial product. The table is parsed in a single pass over the raw response, collecting the
+    `data-real-value` attribute of every cell, whose values are then converted at once per column, instead of
+    parsing the whole HTML tree and then converting the values of each row one by one. If the table is not regular
+    (e.g. a cell without `data-real-value`), the table is parsed from the HTML tree instead, row by row, where the
+    missing values are NaN (or 0 if it is a volume).
+
+    Args:
+        text (:obj:`str`): text of the response of the `HistoricalDataAjax` endpoint.
+        volume (:obj:`bool`, optional):
+            whether the table contains the volume column, which is the case of stocks, etfs, indices, commodities
+            and cryptos.
+
+    Returns:
+        :obj:`dict` - table:
+            The parsed table as a :obj:`dict` of NumPy columns, ordered as sent by Investing.com (i.e. descending by
+            date): `date` (:obj:`numpy.int64` UTC epoch in seconds), `open`, `high`, `low` and `close`
+            (:obj:`numpy.float64`) and `volume` (:obj:`numpy.int64`), just if `volume` is True. All the columns are
+            empty if Investing.com found no results, and if the response contains no table at all, None is returned.
+
+    """
+
+    match = TABLE_ID.search(text)
+
+    if match is None:
+        return None
+
+    start = text.find('<tbody', match.end())
+    end = text.find('</tbody>', start)
+
+    if start == -1 or end == -1:
+        return None
+
+    body = text[start:end]
+
+    n_columns = 6 if volume is True else 5
+    n_rows = body.count('</tr>')
+
+    if n_rows == 0:
+        return None
+
+    if n_rows == 1 and NO_RESULTS in body:
+        return _empty_table(volume)
+
+    values = REAL_VALUE.findall(body)
+
+    if len(values) == body.count('data-real-value=') and len(values) % n_rows == 0 and \
+            len(values) // n_rows >= n_columns:
+        numbers = ' '.join(values).replace(',', '').split()
+
+        if len(numbers) == len(values):
+            try:
+                matrix = np.array(numbers, dtype=np.float64).reshape(n_rows, len(values) // n_rows)
+            except ValueError:
+                matrix = None
+
+            # every row holds the same number of values, so the dates, sent in descending order, are aligned
+            if matrix is not None and np.all(np.diff(matrix[:, 0]) < 0):
+                return _table_from_matrix(matrix, volume)
+
+    return _parse_rows(text, volume)
+
+
+def _empty_table(volume):
+    table = {'date': np.empty(0, dtype=np.int64)}
+
+    for column in PRICE_COLUMNS:
+        table[column] = np.empty(0, dtype=np.float64)
+
+    if volume is True:
+        table['volume'] = np.empty(0, dtype=np.int64)
+
+    return table
+
+
+def _table_from_matrix(matrix, volume):
+    table = {'date': matrix[:, 0].astype(np.int64)}
+
+    for index, column in enumerate(PRICE_COLUMNS):
+        table[column] = np.ascontiguousarray(matrix[:, index + 1])
+
+    if volume is True:
+        table['volume'] = np.nan_to_num(matrix[:, 5]).astype(np.int64)
+
+    return table
+
+
+def _parse_rows(text, volume):
+    rows = fromstring(text).xpath(ROWS)
+
+    if not rows:
+        return None
+
+    if rows[0].text_content().strip() == NO_RESULTS:
+        return _empty_table(volume)
+
+    n_columns = 6 if volume is True else 5
+
+    matrix = np.full((len(rows), n_columns), np.nan, dtype=np.float64)
+
+    for row, cells in enumerate(rows):
+        for column, cell in enumerate(cells[:n_columns]):
+            value = cell.get('data-real-value')
+
+            if value:
+                try:
+                    matrix[row, column] = float(value.replace(',', ''))
+                except ValueError:
+                    pass
+
+    return _table_from_matrix(matrix, volume)
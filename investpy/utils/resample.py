@@ -0,0 +1,132 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import numpy as np
+
+from .data import PRICE_COLUMNS
+
+
+INTERVALS = ['Daily', 'Weekly', 'Monthly']
+
+# weekday (being Monday 0) on which the weeks of the weekly historical data of Investing.com start, which is the date
+# of each weekly bar, while each monthly bar is dated on the first day of its month
+WEEK_START = 6
+
+# weekday (being Monday 0) of the epoch, i.e. 1970-01-01 was a Thursday
+EPOCH_WEEKDAY = 3
+
+
+def period_start(days, interval):
+    """
+    This function returns the first day of the period (i.e. week or month) each introduced date belongs to, following
+    the conventions of Investing.com, where weeks start on Sunday and months on their first day.
+
+    Args:
+        days (:obj:`numpy.ndarray`): dates as :obj:`numpy.int64` days since epoch.
+        interval (:obj:`str`): historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+    Returns:
+        :obj:`numpy.ndarray` - days:
+            The first day of the period of each date, as :obj:`numpy.int64` days since epoch.
+
+    Raises:
+        ValueError: raised if the introduced interval is not valid.
+
+    """
+
+    days = np.asarray(days, dtype=np.int64)
+
+    if interval == 'Daily':
+        return days
+
+    if interval == 'Weekly':
+        return days - (days + EPOCH_WEEKDAY - WEEK_START) % 7
+
+    if interval == 'Monthly':
+        return days.astype('datetime64[D]').astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+
+    raise ValueError("ERR#0073: interval value should be a str type and it can just be either 'Daily', 'Weekly' or "
+                     "'Monthly'.")
+
+
+def resample_ohlcv(columns, interval, groups=None):
+    """
+    This function resamples the introduced daily OHLCV bars into weekly or monthly bars locally, the way Investing.com
+    builds them, instead of retrieving them from Investing.com: each bar is dated on the first day of its period, its
+    open is the open of the first date of the period, its high and low the highest high and the lowest low, its close
+    the close of the last date of the period and its volume the sum of the volumes. The bars of several financial
+    products can be resampled at once, by concatenating their columns and identifying the financial product of each
+    row with `groups`, in which case the rows do not need to be sorted.
+
+    Args:
+        columns (:obj:`dict`):
+            daily bars as returned by :meth:`investpy.utils.data.HistoricalData.columns`, i.e. `date` (as
+            :obj:`numpy.int64` days since epoch), `open`, `high`, `low` and `close`, and optionally `volume`.
+        interval (:obj:`str`): interval of the resampled bars, which can either be `Daily`, `Weekly` or `Monthly`.
+        groups (:obj:`numpy.ndarray`, optional): financial product each row belongs to, if several ones are included.
+
+    Returns:
+        :obj:`dict` - columns:
+            The resampled bars in ascending order (by financial product and date), with the same columns as the
+            introduced ones, along with `group` (the financial product of each bar) if `groups` is not None.
+
+    Raises:
+        ValueError: raised if the introduced interval is not valid.
+
+    Examples:
+        >>> columns = {'date': np.array([18267, 18268, 18274]), 'open': np.array([1., 2., 3.]),
+        ...            'high': np.array([2., 4., 3.]), 'low': np.array([1., 1., 2.]), 'close': np.array([2., 3., 3.])}
+        >>> investpy.utils.resample.resample_ohlcv(columns, 'Weekly')
+        {'date': array([18266, 18273]), 'open': array([1., 3.]), 'high': array([4., 3.]), 'low': array([1., 2.]), 'close': array([3., 3.])}
+
+    """
+
+    keys = ['date'] + [key for key in PRICE_COLUMNS + ['volume'] if key in columns]
+
+    days = np.asarray(columns['date'], dtype=np.int64)
+    periods = period_start(days, interval)
+
+    if groups is not None:
+        groups = np.asarray(groups)
+        order = np.lexsort((days, groups))
+    else:
+        order = np.argsort(days, kind='stable')
+
+    if not np.array_equal(order, np.arange(len(days))):
+        days, periods = days[order], periods[order]
+        columns = {key: np.asarray(columns[key])[order] for key in keys}
+
+        if groups is not None:
+            groups = groups[order]
+
+    if len(days) == 0:
+        resampled = {key: np.asarray(columns[key])[:0] for key in keys}
+
+        if groups is not None:
+            resampled['group'] = groups[:0]
+
+        return resampled
+
+    boundaries = periods[1:] != periods[:-1]
+
+    if groups is not None:
+        boundaries |= groups[1:] != groups[:-1]
+
+    starts = np.concatenate([[0], np.flatnonzero(boundaries) + 1])
+    ends = np.concatenate([starts[1:], [len(days)]]) - 1
+
+    resampled = {
+        'date': periods[starts],
+        'open': np.asarray(columns['open'])[starts],
+        'high': np.maximum.reduceat(np.asarray(columns['high']), starts),
+        'low': np.minimum.reduceat(np.asarray(columns['low']), starts),
+        'close': np.asarray(columns['close'])[ends],
+    }
+
+    if 'volume' in keys:
+        resampled['volume'] = np.add.reduceat(np.asarray(columns['volume']), starts)
+
+    if groups is not None:
+        resampled['group'] = groups[starts]
+
+    return resampled
@@ -1,17 +1,17 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
-import requests
 from lxml.html import fromstring
-import pandas as pd
 
 import json
 from datetime import datetime, date
-import pytz
-from random import randint
 
-from .data import Data
 from .extra import random_user_agent
+from .historical import HistoricalSchema, retrieve_recent_data, retrieve_historical_data
+from .transport import get_transport
+
+
+VOLUME_PRODUCTS = ['stocks', 'etfs', 'indices', 'fxfutures', 'cryptos']
 
 
 class SearchObj(object):
@@ -71,18 +71,8 @@ class SearchObj(object):
 
         """
 
-        if self.pair_type in ['stocks', 'funds', 'etfs', 'currencies', 'certificates']:
-            header = self.symbol + ' Historical Data'
-            head, params = self._prepare_request(header)
-        elif self.pair_type in ['bonds']:
-            header = self.name + ' Bond Yield Historical Data'
-            head, params = self._prepare_request(header)
-        elif self.pair_type in ['indices', 'commodities', 'cryptos', 'fxfutures']:
-            header = self.name + ' Historical Data'
-            head, params = self._prepare_request(header)
+        data = retrieve_recent_data(self._historical_schema(), self._instrument())
 
-        data = self._data_retrieval(product=self.pair_type, head=head, params=params)
-        
         return data
 
     def retrieve_historical_data(self, from_date, to_date):
@@ -126,33 +116,8 @@ class SearchObj(object):
         if from_date >= to_date:
             raise ValueError("ERR#0032: to_date should be greater than from_date, both formatted as 'dd/mm/yyyy'.")
 
-        if self.pair_type in ['stocks', 'funds', 'etfs', 'currencies', 'certificates']:
-            header = self.symbol + ' Historical Data'
-        elif self.pair_type in ['bonds']:
-            header = self.name + ' Bond Yield Historical Data'
-        elif self.pair_type in ['indices', 'commodities', 'cryptos', 'fxfutures']:
-            header = self.name + ' Historical Data'
-
-        if to_date.year - from_date.year > 19:
-            intervals = self._calculate_intervals(from_date, to_date)
-
-            result = list()
-
-            for interval in intervals['intervals']:
-                head, params = self._prepare_historical_request(header=header, from_date=interval['from'], to_date=interval['to'])
-                try:
-                    res = self._data_retrieval(product=self.pair_type, head=head, params=params)
-                    result.append(res)
-                except:
-                    continue
-
-            if len(result) > 0:
-                data = pd.concat(result)
-            else:
-                raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-        else:
-            head, params = self._prepare_historical_request(header=header, from_date=from_date.strftime('%m/%d/%Y'), to_date=to_date.strftime('%m/%d/%Y'))
-            data = self._data_retrieval(product=self.pair_type, head=head, params=params)
+        data = retrieve_historical_data(self._historical_schema(), self._instrument(), from_date=from_date,
+                                        to_date=to_date)
 
         return data
 
@@ -187,7 +152,7 @@ class SearchObj(object):
             "Connection": "keep-alive",
         }
 
-        req = requests.get(url, headers=head)
+        req = get_transport().get(url, headers=head)
 
         if req.status_code != 200:
             raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
@@ -251,128 +216,16 @@ class SearchObj(object):
 
         return result
 
-    def _prepare_request(self, header):
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        params = {
-            "curr_id": self.id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "interval_sec": "Daily",
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        return head, params
-
-    def _prepare_historical_request(self, header, from_date, to_date):
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        params = {
-            "curr_id": self.id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": from_date,
-            "end_date": to_date,
-            "interval_sec": "Daily",
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data"
-        }
-
-        return head, params
-
-    def _calculate_intervals(self, from_date, to_date):
-        date_interval = {
-            'intervals': [],
-        }
-
-        flag = True
-
-        while flag is True:
-            diff = to_date.year - from_date.year
-
-            if diff > 19:
-                obj = {
-                    'from': from_date.strftime('%m/%d/%Y'),
-                    'to': from_date.replace(year=from_date.year + 19).strftime('%m/%d/%Y'),
-                }
-
-                date_interval['intervals'].append(obj)
-
-                from_date = from_date.replace(year=from_date.year + 19)
-            else:
-                obj = {
-                    'from': from_date.strftime('%m/%d/%Y'),
-                    'to': to_date.strftime('%m/%d/%Y'),
-                }
-
-                date_interval['intervals'].append(obj)
-
-                flag = False
-        
-        return date_interval
-    
-    def _data_retrieval(self, product, head, params):
-        if product in ['stocks', 'etfs', 'indices', 'fxfutures', 'cryptos']:
-            has_volume = True
-        else:
-            has_volume = False
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
-
-        req = requests.post(url, headers=head, data=params)
-
-        if req.status_code != 200:
-            raise ConnectionError("ERR#0015: error " + str(req.status_code) + ", try again later.")
-
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
-        result = list()
-
-        if path_:
-            for elements_ in path_:
-                info = []
-
-                for nested_ in elements_.xpath(".//td"):
-                    val = nested_.get('data-real-value')
-                    if val is None and nested_.text_content() == 'No results found':
-                        raise IndexError("ERR#0033: information unavailable or not found.")
-                    info.append(val)
-
-                date_ = datetime.strptime(str(datetime.fromtimestamp(int(info[0]), tz=pytz.utc).date()), '%Y-%m-%d')
-                
-                close_ = float(info[1].replace(',', ''))
-                open_ = float(info[2].replace(',', ''))
-                high_ = float(info[3].replace(',', ''))
-                low_ = float(info[4].replace(',', ''))
-
-                volume_ = None
-                
-                if has_volume is True:
-                    volume_ = int(info[5])
-
-                result.insert(len(result),
-                              Data(date_, open_, high_, low_, close_, volume_, self.exchange, None))
+    def _historical_schema(self):
+        if self.pair_type in ['stocks', 'funds', 'etfs', 'currencies', 'certificates']:
+            header = '{symbol} Historical Data'
+        elif self.pair_type in ['bonds']:
+            header = '{name} Bond Yield Historical Data'
         else:
-            raise RuntimeError("ERR#0004: data retrieval error while scraping.")
-
-        result = result[::-1]
+            header = '{name} Historical Data'
 
-        df = pd.DataFrame.from_records([value.unknown_to_dict() for value in result])
-        df.set_index('Date', inplace=True)
+        return HistoricalSchema(self.pair_type, header, volume=self.pair_type in VOLUME_PRODUCTS,
+                                not_found="ERR#0033: information unavailable or not found.")
 
-        return df
+    def _instrument(self):
+        return {'id': self.id_, 'symbol': self.symbol, 'name': self.name}
@@ -0,0 +1,229 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import json
+import re
+import threading
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_BACKENDS = ['json', 'orjson']
+
+_BACKEND = None
+_RAW = False
+_LOCK = threading.Lock()
+
+# characters which need to be escaped (or which json.dumps escapes) inside a JSON string
+_ESCAPED = re.compile(r'["\\]|[^\x20-\x7e]')
+
+
+def configure_json(backend=None, raw=False):
+    """
+    This function configures how investpy serializes the :obj:`json` documents it returns when `as_json=True`, i.e.
+    the historical and recent data. By default, the documents are serialized with the standard :mod:`json` module,
+    and they are returned as :obj:`str`; `orjson` is just used if explicitly configured, even if it is installed.
+    Note that `orjson` writes compact documents (without whitespace after the separators), which are otherwise equal
+    to the standard ones, except for non-finite values, which are written as `null`.
+
+    Args:
+        backend (:obj:`str`, optional):
+            serializer to use, which can either be `json` or `orjson`, if None the standard `json` is used.
+        raw (:obj:`bool`, optional):
+            whether the documents are returned as UTF-8 encoded :obj:`bytes` instead of as :obj:`str`, so that they
+            can be sent as they are (e.g. as the body of a response) without being encoded again.
+
+    Returns:
+        :obj:`str` - backend:
+            The name of the serializer that will be used.
+
+    Raises:
+        ValueError: raised if any of the introduced arguments is not valid or if `orjson` is not installed.
+
+    Examples:
+        >>> investpy.utils.serializer.configure_json(backend='json', raw=True)
+        'json'
+
+    """
+
+    global _BACKEND, _RAW
+
+    if backend is not None and backend not in JSON_BACKENDS:
+        raise ValueError("ERR#0159: backend argument can just be None, 'json' or 'orjson'.")
+
+    if backend == 'orjson' and orjson is None:
+        raise ValueError("ERR#0160: orjson backend is not available since orjson is not installed.")
+
+    if not isinstance(raw, bool):
+        raise ValueError("ERR#0161: raw argument can just be True or False, bool type.")
+
+    if backend is None:
+        backend = 'json'
+
+    with _LOCK:
+        _BACKEND = backend
+        _RAW = raw
+
+    return backend
+
+
+def set_json_backend(backend):
+    """
+    This function sets the serializer of the :obj:`json` documents investpy returns, keeping whether they are returned
+    as :obj:`bytes` or not, e.g. to opt in to the faster `orjson` serializer, see :func:`configure_json`.
+
+    Args:
+        backend (:obj:`str`): serializer to use, which can either be `json` or `orjson`.
+
+    Returns:
+        :obj:`str` - backend:
+            The name of the serializer that will be used.
+
+    Raises:
+        ValueError: raised if the introduced backend is not valid or if `orjson` is not installed.
+
+    Examples:
+        >>> investpy.utils.serializer.set_json_backend('orjson')
+        'orjson'
+
+    """
+
+    return configure_json(backend=backend, raw=_RAW)
+
+
+def get_json_backend():
+    """
+    This function returns the serializer that investpy is currently using, as configured via
+    :func:`configure_json` or :func:`set_json_backend`.
+
+    Returns:
+        :obj:`tuple` - backend:
+            The name of the serializer (either `json` or `orjson`) and whether the documents are returned as
+            :obj:`bytes`.
+
+    """
+
+    if _BACKEND is None:
+        return 'json', _RAW
+
+    return _BACKEND, _RAW
+
+
+def dumps(obj):
+    """
+    This function serializes the introduced object with the configured serializer.
+
+    Args:
+        obj (:obj:`dict` or :obj:`list`): object to serialize, made of built-in types.
+
+    Returns:
+        :obj:`str` or :obj:`bytes` - document:
+            The :obj:`json` document, as :obj:`bytes` if configured as raw.
+
+    """
+
+    backend, raw = get_json_backend()
+
+    if backend == 'orjson':
+        document = orjson.dumps(obj)
+        return document if raw is True else document.decode('utf-8')
+
+    document = json.dumps(obj, sort_keys=False)
+    return document.encode('utf-8') if raw is True else document
+
+
+def _placeholder(values):
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'f' and np.isfinite(values).all():
+            return '%r', values.tolist()
+        if values.dtype.kind in 'iu':
+            return '%d', values.tolist()
+        values = values.tolist()
+
+    if all(isinstance(value, str) for value in values) and not _ESCAPED.search(''.join(values)):
+        return '"%s"', values
+
+    # anything else (strings, non-finite floats...) is just serialized value by value
+    return '%s', [json.dumps(value) for value in values]
+
+
+def columns_to_json(name, key, fields, columns, constants=None):
+    """
+    This function serializes the introduced columns as a :obj:`json` document with the `name` of the financial
+    product and a :obj:`list` of rows under `key`, without building a :obj:`dict` per row. When the standard
+    :mod:`json` module is used, every row is written at once from a template, so that the document is the same one
+    :func:`json.dumps` would have written.
+
+    Args:
+        name (:obj:`str`): name of the financial product.
+        key (:obj:`str`): key of the rows in the document.
+        fields (:obj:`list`): keys of the values of each row, one per column.
+        columns (:obj:`list`): columns of the rows, either NumPy arrays or lists, all of the same length.
+        constants (:obj:`list`, optional): (key, value) pairs to append to every row, if any.
+
+    Returns:
+        :obj:`str` or :obj:`bytes` - document:
+            The :obj:`json` document, as :obj:`bytes` if configured as raw.
+
+    """
+
+    constants = constants or list()
+
+    backend, raw = get_json_backend()
+
+    if backend == 'orjson':
+        columns = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns]
+        rows = [dict(zip(fields, row), **dict(constants)) for row in zip(*columns)]
+
+        return dumps({'name': name, key: rows})
+
+    placeholders, values = zip(*[_placeholder(column) for column in columns]) if columns else ((), ())
+
+    items = [json.dumps(field).replace('%', '%%') + ': ' + placeholder
+             for field, placeholder in zip(fields, placeholders)]
+    items += [json.dumps(field).replace('%', '%%') + ': ' + json.dumps(value).replace('%', '%%')
+              for field, value in constants]
+
+    template = '{' + ', '.join(items) + '}'
+
+    document = '{"name": ' + json.dumps(name) + ', ' + json.dumps(key) + ': [' + \
+               ', '.join([template % row for row in zip(*values)]) + ']}'
+
+    return document.encode('utf-8') if raw is True else document
+
+
+def frame_to_records(df):
+    """
+    This function converts the introduced :obj:`pandas.DataFrame` into a :obj:`list` of rows as :obj:`dict`, made of
+    built-in types, column by column, where missing values are converted into None.
+
+    Args:
+        df (:obj:`pandas.DataFrame`): data to convert.
+
+    Returns:
+        :obj:`list` - records:
+            The rows of the data, as a :obj:`dict` per row.
+
+    """
+
+    fields = [str(field) for field in df.columns]
+
+    columns = list()
+
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        mask = column.isna().to_numpy()
+
+        values = column.tolist()
+
+        if mask.any():
+            values = [None if missing else value for value, missing in zip(values, mask.tolist())]
+
+        columns.append(values)
+
+    return [dict(zip(fields, row)) for row in zip(*columns)]
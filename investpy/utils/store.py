@@ -0,0 +1,449 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from .data import SECONDS_PER_DAY, PRICE_COLUMNS
+
+
+EPOCH = date(1970, 1, 1)
+
+# version of the layout of the database
+STORE_VERSION = 1
+
+_STORE = None
+_LOCK = threading.Lock()
+
+
+def date_to_days(value):
+    """
+    This function converts the introduced date into the number of days since epoch.
+
+    Args:
+        value (:obj:`datetime.datetime` or :obj:`datetime.date`): date to convert.
+
+    Returns:
+        :obj:`int` - days:
+            The number of days since epoch of the introduced date.
+
+    """
+
+    if isinstance(value, datetime):
+        value = value.date()
+
+    return (value - EPOCH).days
+
+
+def days_to_date(days):
+    """
+    This function converts the introduced number of days since epoch into the date it refers to.
+
+    Args:
+        days (:obj:`int`): number of days since epoch.
+
+    Returns:
+        :obj:`datetime.datetime` - date:
+            The date of the introduced number of days since epoch, at midnight.
+
+    """
+
+    return datetime(1970, 1, 1) + timedelta(days=int(days))
+
+
+class DateRanges(object):
+    """
+    This class is used to keep a set of date ranges, as days since epoch, which are kept sorted and merged, so that
+    any two ranges are neither overlapping nor consecutive. Ranges can be added, which merges them with the ranges
+    they overlap or follow, and removed, which splits the ranges they are in, and the uncovered sub-ranges of any date
+    range (i.e. its gaps) can be computed.
+
+    Args:
+        ranges (:obj:`list`, optional): `(start, end)` days since epoch of the initial ranges, both included.
+
+    Examples:
+        >>> ranges = investpy.utils.store.DateRanges([(0, 9), (20, 29)])
+        >>> ranges.add(10, 14)
+        >>> list(ranges)
+        [(0, 14), (20, 29)]
+        >>> ranges.gaps(5, 39)
+        [(15, 19), (30, 39)]
+
+    """
+
+    def __init__(self, ranges=None):
+        self._ranges = list()
+
+        for start, end in ranges or list():
+            self.add(start, end)
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def __eq__(self, other):
+        return isinstance(other, DateRanges) and self._ranges == other._ranges
+
+    def __repr__(self):
+        return "DateRanges(" + repr(self._ranges) + ")"
+
+    def add(self, start, end):
+        """
+        This method adds the introduced date range, merging it with the ranges it overlaps or follows.
+
+        Args:
+            start (:obj:`int`): first day of the range, as days since epoch.
+            end (:obj:`int`): last day of the range, as days since epoch.
+
+        """
+
+        if start > end:
+            return
+
+        ranges = list()
+
+        for start_, end_ in self._ranges:
+            if end_ < start - 1 or start_ > end + 1:
+                ranges.append((start_, end_))
+            else:
+                start, end = min(start, start_), max(end, end_)
+
+        ranges.append((start, end))
+
+        self._ranges = sorted(ranges)
+
+    def remove(self, start, end):
+        """
+        This method removes the introduced date range, splitting the ranges it is in.
+
+        Args:
+            start (:obj:`int`): first day of the range, as days since epoch.
+            end (:obj:`int`): last day of the range, as days since epoch.
+
+        """
+
+        if start > end:
+            return
+
+        ranges = list()
+
+        for start_, end_ in self._ranges:
+            if end_ < start or start_ > end:
+                ranges.append((start_, end_))
+                continue
+
+            if start_ < start:
+                ranges.append((start_, start - 1))
+
+            if end_ > end:
+                ranges.append((end + 1, end_))
+
+        self._ranges = ranges
+
+    def gaps(self, start, end):
+        """
+        This method returns the sub-ranges of the introduced date range which are not covered by any range.
+
+        Args:
+            start (:obj:`int`): first day of the range, as days since epoch.
+            end (:obj:`int`): last day of the range, as days since epoch.
+
+        Returns:
+            :obj:`list` - gaps:
+                The sorted :obj:`list` of `(start, end)` days since epoch of the uncovered sub-ranges, which is empty
+                if the introduced date range is fully covered.
+
+        """
+
+        gaps = list()
+
+        for start_, end_ in self._ranges:
+            if end_ < start:
+                continue
+
+            if start_ > end:
+                break
+
+            if start_ > start:
+                gaps.append((start, start_ - 1))
+
+            start = end_ + 1
+
+        if start <= end:
+            gaps.append((start, end))
+
+        return gaps
+
+    def covers(self, start, end):
+        """
+        This method checks whether the introduced date range is fully covered by the ranges.
+
+        Args:
+            start (:obj:`int`): first day of the range, as days since epoch.
+            end (:obj:`int`): last day of the range, as days since epoch.
+
+        Returns:
+            :obj:`bool` - covered:
+                True if the introduced date range is fully covered, False otherwise.
+
+        """
+
+        return not self.gaps(start, end)
+
+
+class HistoricalStore(object):
+    """
+    This class is used to keep the historical data retrieved from Investing.com in a SQLite database on disk, so
+    that the historical data of each financial product is just retrieved once. Each financial product is identified
+    by its type and by its id in the static data files, and the store keeps, for each interval, both its rows and the
+    date ranges they cover (i.e. the dates whose data has already been retrieved, even if there was no data for some
+    of them, e.g. weekends and holidays), so that just the gaps between those ranges are retrieved from Investing.com.
+    Since the data of the current date may still change, the covered date ranges never include it nor any later date,
+    which are always retrieved again.
+
+    Args:
+        path (:obj:`str`): path to the SQLite database file, created if it does not exist.
+
+    Attributes:
+        path (:obj:`str`): path to the SQLite database file.
+
+    Raises:
+        ValueError: raised if the introduced path is not valid.
+
+    Examples:
+        >>> store = investpy.utils.store.HistoricalStore('investpy-historical.sqlite')
+        >>> investpy.utils.store.set_store(store)
+
+    """
+
+    def __init__(self, path):
+        if not path or not isinstance(path, str):
+            raise ValueError("ERR#0162: path argument needs to be a str.")
+
+        self.path = path
+
+        with self._connect() as connection:
+            # the stored data is just a copy of the one in Investing.com, so a store with another layout is reset
+            if connection.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+                connection.execute("DROP TABLE IF EXISTS rows")
+                connection.execute("DROP TABLE IF EXISTS coverage")
+
+            connection.execute("CREATE TABLE IF NOT EXISTS rows (product TEXT, id TEXT, interval TEXT, date INTEGER, "
+                               "open REAL, high REAL, low REAL, close REAL, volume INTEGER, "
+                               "PRIMARY KEY (product, id, interval, date))")
+            connection.execute("CREATE TABLE IF NOT EXISTS coverage (product TEXT, id TEXT, interval TEXT, "
+                               "start_day INTEGER, end_day INTEGER, PRIMARY KEY (product, id, interval, start_day))")
+            connection.execute("PRAGMA user_version = " + str(STORE_VERSION))
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _coverage(connection, product, id_, interval):
+        return DateRanges(connection.execute("SELECT start_day, end_day FROM coverage "
+                                             "WHERE product = ? AND id = ? AND interval = ?",
+                                             (product, str(id_), interval)).fetchall())
+
+    def coverage(self, product, id_, interval='Daily'):
+        """
+        This method returns the date ranges covered by the stored historical data of the introduced financial product.
+
+        Args:
+            product (:obj:`str`): financial product type, i.e. `stock`, `fund`, `etf`, etc.
+            id_ (:obj:`str`): id of the financial product as found in its static data file.
+            interval (:obj:`str`, optional):
+                historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+        Returns:
+            :obj:`investpy.utils.store.DateRanges` - coverage:
+                The covered date ranges, which are empty if there is no stored historical data of the introduced
+                financial product.
+
+        """
+
+        with self._connect() as connection:
+            return self._coverage(connection, product, id_, interval)
+
+    def missing(self, product, id_, from_date, to_date, interval='Daily'):
+        """
+        This method returns the minimal set of date ranges of the introduced date range which need to be retrieved
+        from Investing.com, since they are not covered by the stored historical data of the introduced financial
+        product.
+
+        Args:
+            product (:obj:`str`): financial product type, i.e. `stock`, `fund`, `etf`, etc.
+            id_ (:obj:`str`): id of the financial product as found in its static data file.
+            from_date (:obj:`datetime.datetime`): date since when data is going to be retrieved.
+            to_date (:obj:`datetime.datetime`): date until when data is going to be retrieved.
+            interval (:obj:`str`, optional):
+                historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+        Returns:
+            :obj:`list` - ranges:
+                The sorted :obj:`list` of `(start, end)` dates (as :obj:`datetime.datetime`) to retrieve, which is
+                empty if the introduced date range is fully covered.
+
+        """
+
+        gaps = self.coverage(product, id_, interval=interval).gaps(date_to_days(from_date), date_to_days(to_date))
+
+        return [(days_to_date(start), days_to_date(end)) for start, end in gaps]
+
+    def update(self, product, id_, tables, from_date, to_date, interval='Daily'):
+        """
+        This method stores the introduced historical data tables of the introduced financial product, replacing the
+        stored rows of the same dates, and adds the introduced date range to its covered date ranges, but for the
+        current date and any later one.
+
+        Args:
+            product (:obj:`str`): financial product type, i.e. `stock`, `fund`, `etf`, etc.
+            id_ (:obj:`str`): id of the financial product as found in its static data file.
+            tables (:obj:`list`):
+                tables as returned by :func:`investpy.utils.parser.parse_historical_data`, retrieved for the
+                introduced date range.
+            from_date (:obj:`datetime.datetime`): date since when data has been retrieved.
+            to_date (:obj:`datetime.datetime`): date until when data has been retrieved.
+            interval (:obj:`str`, optional):
+                historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+        """
+
+        rows = list()
+
+        for table in tables:
+            days = np.floor_divide(np.asarray(table['date'], dtype=np.int64), SECONDS_PER_DAY).tolist()
+            volume = table['volume'].tolist() if 'volume' in table else [None] * len(days)
+
+            rows += zip([product] * len(days), [str(id_)] * len(days), [interval] * len(days), days,
+                        *[table[column].tolist() for column in PRICE_COLUMNS], volume)
+
+        start = date_to_days(from_date)
+        end = min(date_to_days(to_date), date_to_days(datetime.now(timezone.utc)) - 1)
+
+        with self._connect() as connection:
+            # the coverage is read and written in the same transaction, which may be shared by several processes
+            connection.execute("BEGIN IMMEDIATE")
+
+            connection.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+            if start > end:
+                return
+
+            coverage = self._coverage(connection, product, id_, interval)
+            coverage.add(start, end)
+
+            connection.execute("DELETE FROM coverage WHERE product = ? AND id = ? AND interval = ?",
+                               (product, str(id_), interval))
+            connection.executemany("INSERT INTO coverage VALUES (?, ?, ?, ?, ?)",
+                                   [(product, str(id_), interval, start_, end_) for start_, end_ in coverage])
+
+    def read(self, product, id_, from_date, to_date, interval='Daily'):
+        """
+        This method reads the stored historical data of the introduced financial product in the introduced date range.
+
+        Args:
+            product (:obj:`str`): financial product type, i.e. `stock`, `fund`, `etf`, etc.
+            id_ (:obj:`str`): id of the financial product as found in its static data file.
+            from_date (:obj:`datetime.datetime`): date since when data is going to be read.
+            to_date (:obj:`datetime.datetime`): date until when data is going to be read.
+            interval (:obj:`str`, optional):
+                historical data interval, which can either be `Daily`, `Weekly` or `Monthly`.
+
+        Returns:
+            :obj:`dict` - table:
+                The stored rows in ascending order, as returned by :func:`investpy.utils.parser.parse_historical_data`
+                with `volume=True`, where missing volumes are 0.
+
+        """
+
+        with self._connect() as connection:
+            rows = connection.execute("SELECT date, open, high, low, close, IFNULL(volume, 0) FROM rows "
+                                      "WHERE product = ? AND id = ? AND interval = ? AND date BETWEEN ? AND ? "
+                                      "ORDER BY date", (product, str(id_), interval, date_to_days(from_date),
+                                                        date_to_days(to_date))).fetchall()
+
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), 6)
+
+        table = {'date': matrix[:, 0].astype(np.int64) * SECONDS_PER_DAY}
+
+        for index, column in enumerate(PRICE_COLUMNS):
+            table[column] = matrix[:, index + 1]
+
+        table['volume'] = matrix[:, 5].astype(np.int64)
+
+        return table
+
+    def clear(self, product=None, id_=None):
+        """
+        This method removes the stored historical data, either of every financial product, of every financial product
+        of the introduced type, or of the introduced financial product.
+
+        Args:
+            product (:obj:`str`, optional): financial product type, i.e. `stock`, `fund`, `etf`, etc.
+            id_ (:obj:`str`, optional): id of the financial product as found in its static data file.
+
+        """
+
+        condition, values = '', tuple()
+
+        if product is not None:
+            condition, values = " WHERE product = ?", (product,)
+
+            if id_ is not None:
+                condition, values = condition + " AND id = ?", values + (str(id_),)
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM rows" + condition, values)
+            connection.execute("DELETE FROM coverage" + condition, values)
+
+
+def get_store():
+    """
+    This function returns the historical data store shared by every function of investpy, if any.
+
+    Returns:
+        :obj:`investpy.utils.store.HistoricalStore` - store:
+            The store the daily historical data is kept in, or None if the historical data is not stored.
+
+    """
+
+    return _STORE
+
+
+def set_store(store):
+    """
+    This function sets the introduced store as the one shared by every function of investpy, so that the daily
+    historical data retrieved by the `get_*_historical_data` functions is served from it, and just the dates it does
+    not cover are retrieved from Investing.com.
+
+    Args:
+        store (:obj:`investpy.utils.store.HistoricalStore`):
+            store to keep the historical data in, or None to not store it.
+
+    Returns:
+        :obj:`investpy.utils.store.HistoricalStore` - store:
+            The introduced store.
+
+    """
+
+    global _STORE
+
+    with _LOCK:
+        _STORE = store
+
+    return store
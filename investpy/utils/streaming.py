@@ -0,0 +1,480 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import abc
+
+import numpy as np
+
+
+ROLLING_REDUCERS = ['max', 'min', 'mean', 'sum']
+
+
+def _check_size(size, window):
+    if not isinstance(size, int) or size < 0:
+        raise ValueError("ERR#0176: size argument needs to be a non negative int value.")
+
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("ERR#0176: window arguments need to be positive int values.")
+
+
+def _divide(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, np.nan, numerator / denominator)
+
+
+class IndicatorState(abc.ABC):
+    """
+    This class is the base class of the incremental indicators of the local technical engine, which keep the state
+    of an indicator for a group of financial products, so that every new bar of all of them is ingested at once in
+    constant time, instead of calculating the indicator again over the whole history, e.g. when polling the recent data
+    of thousands of financial products every few minutes. Every state is advanced with :meth:`update`, whose arguments
+    are arrays with a value per financial product of the group, where the financial products without a new bar are
+    NaN and are left as they were. The values of the indicators are the same ones calculated by
+    :func:`investpy.utils.indicators.technical_indicators_matrix` over the same bars.
+
+    The state can be saved as a :obj:`dict` made of built-in types (e.g. to be written as a :obj:`json` document)
+    with :meth:`to_dict`, and restored with :func:`load_state`, so that it survives restarts.
+
+    Attributes:
+        size (:obj:`int`): number of financial products of the group.
+
+    """
+
+    # names of the arguments of the constructor, of the NumPy arrays and of the nested states that make the state
+    _params = ('size',)
+    _arrays = ()
+    _states = ()
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + ", ".join(name + "=" + repr(getattr(self, name))
+                                                     for name in self._params) + ")"
+
+    def _values(self, *arrays):
+        values = [np.asarray(array, dtype=np.float64) for array in arrays]
+
+        for array in values:
+            if array.shape != (self.size,):
+                raise ValueError("ERR#0177: every update must contain a value per financial product of the group, "
+                                 "i.e. 1-D arrays of length " + str(self.size) + ".")
+
+        return values if len(values) > 1 else values[0]
+
+    @abc.abstractmethod
+    def update(self, *arrays):
+        """
+        This method ingests a new bar of every financial product of the group, which every indicator implements.
+
+        Returns:
+            :obj:`numpy.ndarray` - values:
+                The value of the indicator of every financial product, NaN while there is not enough history.
+
+        """
+
+    def run(self, *arrays):
+        """
+        This method ingests several bars of every financial product of the group, e.g. to warm the state up from
+        their historical data, as 2-D instruments × time arrays in ascending order, like the ones returned by
+        :func:`investpy.utils.indicators.stack_columns`.
+
+        Returns:
+            :obj:`numpy.ndarray` - values:
+                The value of the indicator of every financial product after the last bar.
+
+        """
+
+        arrays = [np.asarray(array, dtype=np.float64) for array in arrays]
+
+        values = np.full(self.size, np.nan)
+
+        for position in range(arrays[0].shape[1] if arrays[0].ndim == 2 else 0):
+            values = self.update(*[array[:, position] for array in arrays])
+
+        return values
+
+    def to_dict(self):
+        """
+        This method returns the state as a :obj:`dict` made of built-in types, where NaN values are None.
+
+        Returns:
+            :obj:`dict` - state:
+                The state, which can be restored with :func:`load_state`.
+
+        """
+
+        arrays = dict()
+
+        for name in self._arrays:
+            array = getattr(self, name)
+
+            if array.dtype.kind == 'f':
+                array = np.where(np.isnan(array), None, array.astype(object))
+
+            arrays[name] = array.tolist()
+
+        return {
+            'indicator': type(self).__name__,
+            'params': {name: getattr(self, name) for name in self._params},
+            'arrays': arrays,
+            'states': {name: getattr(self, name).to_dict() for name in self._states},
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        This method restores a state saved with :meth:`to_dict`.
+
+        Args:
+            state (:obj:`dict`): state as returned by :meth:`to_dict`.
+
+        Returns:
+            :obj:`investpy.utils.streaming.IndicatorState` - state:
+                The restored state.
+
+        Raises:
+            ValueError: raised if the introduced state is not valid.
+
+        """
+
+        try:
+            if state['indicator'] != cls.__name__:
+                raise ValueError
+
+            restored = cls(**state['params'])
+
+            for name in cls._arrays:
+                array = getattr(restored, name)
+                values = np.array(state['arrays'][name], dtype=np.float64).astype(array.dtype)
+
+                if values.shape != array.shape:
+                    raise ValueError
+
+                setattr(restored, name, values)
+
+            for name in cls._states:
+                setattr(restored, name, type(getattr(restored, name)).from_dict(state['states'][name]))
+        except (ValueError, TypeError, KeyError):
+            raise ValueError("ERR#0178: state is not a valid " + cls.__name__ + " state.")
+
+        return restored
+
+
+class EMAState(IndicatorState):
+    """
+    This class keeps the exponential moving average of a group of financial products, seeded with the simple moving
+    average of their first `window` values, or their Wilder's smoothing if `wilder` is True.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`): number of periods of the average.
+        wilder (:obj:`bool`, optional): whether to use a smoothing factor of 1/`window` instead of 2/(`window` + 1).
+
+    """
+
+    _params = ('size', 'window', 'wilder')
+    _arrays = ('count', 'total', 'value')
+
+    def __init__(self, size, window, wilder=False):
+        _check_size(size, window)
+
+        self.size = size
+        self.window = window
+        self.wilder = bool(wilder)
+        self.alpha = 1. / window if self.wilder else 2. / (window + 1.)
+
+        self.count = np.zeros(size, dtype=np.int64)
+        self.total = np.zeros(size)
+        self.value = np.full(size, np.nan)
+
+    def update(self, values):
+        values = self._values(values)
+
+        present = ~np.isnan(values)
+        count = self.count + present
+
+        self.total = np.where(present & (count <= self.window), self.total + values, self.total)
+        self.value = np.where(present & (count == self.window), self.total / self.window, self.value)
+        self.value = np.where(present & (count > self.window),
+                              self.alpha * values + (1. - self.alpha) * self.value, self.value)
+        self.count = count
+
+        return self.value.copy()
+
+
+class RollingState(IndicatorState):
+    """
+    This class keeps the highest, lowest, average or total value of the last `window` values of a group of financial
+    products, e.g. their rolling highs and lows, in a ring buffer of `window` values per financial product.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`): number of periods of the window.
+        reducer (:obj:`str`, optional): value of the window to keep, which can either be `max`, `min`, `mean` or `sum`.
+
+    """
+
+    _params = ('size', 'window', 'reducer')
+    _arrays = ('count', 'buffer')
+
+    def __init__(self, size, window, reducer='max'):
+        _check_size(size, window)
+
+        if reducer not in ROLLING_REDUCERS:
+            raise ValueError("ERR#0176: reducer argument can just be either 'max', 'min', 'mean' or 'sum'.")
+
+        self.size = size
+        self.window = window
+        self.reducer = reducer
+
+        self.count = np.zeros(size, dtype=np.int64)
+        self.buffer = np.full((size, window), np.nan)
+
+    def update(self, values):
+        values = self._values(values)
+
+        present = np.flatnonzero(~np.isnan(values))
+
+        self.buffer[present, self.count[present] % self.window] = values[present]
+        self.count[present] += 1
+
+        reduced = getattr(np, self.reducer)(self.buffer, axis=1)
+
+        return np.where(self.count >= self.window, reduced, np.nan)
+
+
+class RSIState(IndicatorState):
+    """
+    This class keeps the relative strength index of a group of financial products, with Wilder's smoothing.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`, optional): number of periods of the index.
+
+    """
+
+    _params = ('size', 'window')
+    _arrays = ('previous',)
+    _states = ('gains', 'losses')
+
+    def __init__(self, size, window=14):
+        _check_size(size, window)
+
+        self.size = size
+        self.window = window
+
+        self.previous = np.full(size, np.nan)
+        self.gains = EMAState(size, window, wilder=True)
+        self.losses = EMAState(size, window, wilder=True)
+
+    def update(self, close):
+        close = self._values(close)
+
+        changes = close - self.previous
+        self.previous = np.where(np.isnan(close), self.previous, close)
+
+        gains, losses = self.gains.update(np.maximum(changes, 0.)), self.losses.update(np.maximum(-changes, 0.))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.where(losses == 0, 100., 100. - 100. / (1. + gains / losses))
+
+        return np.where(np.isnan(gains) | np.isnan(losses), np.nan, values)
+
+
+class MACDState(IndicatorState):
+    """
+    This class keeps the MACD of a group of financial products, i.e. the difference between the `fast` and the
+    `slow` periods exponential moving averages of their close.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        fast (:obj:`int`, optional): number of periods of the fast moving average.
+        slow (:obj:`int`, optional): number of periods of the slow moving average.
+
+    """
+
+    _params = ('size', 'fast', 'slow')
+    _states = ('fast_ema', 'slow_ema')
+
+    def __init__(self, size, fast=12, slow=26):
+        _check_size(size, fast)
+        _check_size(size, slow)
+
+        self.size = size
+        self.fast = fast
+        self.slow = slow
+
+        self.fast_ema = EMAState(size, fast)
+        self.slow_ema = EMAState(size, slow)
+
+    def update(self, close):
+        close = self._values(close)
+
+        return self.fast_ema.update(close) - self.slow_ema.update(close)
+
+
+class ATRState(IndicatorState):
+    """
+    This class keeps the average true range of a group of financial products, with Wilder's smoothing.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`, optional): number of periods of the average.
+
+    """
+
+    _params = ('size', 'window')
+    _arrays = ('previous',)
+    _states = ('true_range',)
+
+    def __init__(self, size, window=14):
+        _check_size(size, window)
+
+        self.size = size
+        self.window = window
+
+        self.previous = np.full(size, np.nan)
+        self.true_range = EMAState(size, window, wilder=True)
+
+    def update(self, high, low, close):
+        high, low, close = self._values(high, low, close)
+
+        true_range = np.maximum(high, self.previous) - np.minimum(low, self.previous)
+        self.previous = np.where(np.isnan(close), self.previous, close)
+
+        return self.true_range.update(true_range)
+
+
+class ADXState(IndicatorState):
+    """
+    This class keeps the average directional index of a group of financial products, along with their +DI and -DI,
+    with Wilder's smoothing.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`, optional): number of periods of the index.
+
+    Attributes:
+        plus_di (:obj:`numpy.ndarray`): +DI of every financial product after the last bar.
+        minus_di (:obj:`numpy.ndarray`): -DI of every financial product after the last bar.
+
+    """
+
+    _params = ('size', 'window')
+    _arrays = ('previous_high', 'previous_low', 'previous_close', 'plus_di', 'minus_di')
+    _states = ('true_range', 'plus_dm', 'minus_dm', 'dx')
+
+    def __init__(self, size, window=14):
+        _check_size(size, window)
+
+        self.size = size
+        self.window = window
+
+        self.previous_high = np.full(size, np.nan)
+        self.previous_low = np.full(size, np.nan)
+        self.previous_close = np.full(size, np.nan)
+        self.plus_di = np.full(size, np.nan)
+        self.minus_di = np.full(size, np.nan)
+
+        self.true_range = EMAState(size, window, wilder=True)
+        self.plus_dm = EMAState(size, window, wilder=True)
+        self.minus_dm = EMAState(size, window, wilder=True)
+        self.dx = EMAState(size, window, wilder=True)
+
+    def update(self, high, low, close):
+        high, low, close = self._values(high, low, close)
+
+        present = ~np.isnan(close)
+
+        high_moves, low_moves = high - self.previous_high, self.previous_low - low
+        unknown = np.isnan(high_moves) | np.isnan(low_moves)
+
+        plus_dm = np.where(unknown, np.nan, np.where((high_moves > low_moves) & (high_moves > 0), high_moves, 0.))
+        minus_dm = np.where(unknown, np.nan, np.where((low_moves > high_moves) & (low_moves > 0), low_moves, 0.))
+        true_range = np.maximum(high, self.previous_close) - np.minimum(low, self.previous_close)
+
+        self.previous_high = np.where(present, high, self.previous_high)
+        self.previous_low = np.where(present, low, self.previous_low)
+        self.previous_close = np.where(present, close, self.previous_close)
+
+        atr = self.true_range.update(true_range)
+        plus_di = 100. * _divide(self.plus_dm.update(plus_dm), atr)
+        minus_di = 100. * _divide(self.minus_dm.update(minus_dm), atr)
+
+        self.plus_di = np.where(present, plus_di, self.plus_di)
+        self.minus_di = np.where(present, minus_di, self.minus_di)
+
+        totals = plus_di + minus_di
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dx = np.where(totals == 0, 0., 100. * np.abs(plus_di - minus_di) / totals)
+
+        return self.dx.update(np.where(present, dx, np.nan))
+
+
+class StochasticState(IndicatorState):
+    """
+    This class keeps the stochastic oscillator of a group of financial products, i.e. their `window` periods %K,
+    smoothed with a `smoothing` periods simple moving average.
+
+    Args:
+        size (:obj:`int`): number of financial products of the group.
+        window (:obj:`int`, optional): number of periods of the %K.
+        smoothing (:obj:`int`, optional): number of periods of the moving average of the %K.
+
+    """
+
+    _params = ('size', 'window', 'smoothing')
+    _states = ('highs', 'lows', 'fast_k')
+
+    def __init__(self, size, window=9, smoothing=6):
+        _check_size(size, window)
+        _check_size(size, smoothing)
+
+        self.size = size
+        self.window = window
+        self.smoothing = smoothing
+
+        self.highs = RollingState(size, window, reducer='max')
+        self.lows = RollingState(size, window, reducer='min')
+        self.fast_k = RollingState(size, smoothing, reducer='mean')
+
+    def update(self, high, low, close):
+        high, low, close = self._values(high, low, close)
+
+        highest, lowest = self.highs.update(high), self.lows.update(low)
+
+        fast_k = 100. * _divide(close - lowest, highest - lowest)
+
+        return self.fast_k.update(fast_k)
+
+
+def load_state(state):
+    """
+    This function restores an incremental indicator saved with :meth:`IndicatorState.to_dict`.
+
+    Args:
+        state (:obj:`dict`): state as returned by :meth:`IndicatorState.to_dict`.
+
+    Returns:
+        :obj:`investpy.utils.streaming.IndicatorState` - state:
+            The restored incremental indicator.
+
+    Raises:
+        ValueError: raised if the introduced state is not valid.
+
+    Examples:
+        >>> rsi = investpy.utils.streaming.RSIState(size=3000)
+        >>> values = rsi.run(closes)
+        >>> with open('rsi.json', 'w') as f:
+        ...     json.dump(rsi.to_dict(), f)
+        >>> with open('rsi.json', 'r') as f:
+        ...     rsi = investpy.utils.streaming.load_state(json.load(f))
+        >>> values = rsi.update(last_closes)
+
+    """
+
+    states = {cls.__name__: cls for cls in [EMAState, RollingState, RSIState, MACDState, ATRState, ADXState,
+                                           StochasticState]}
+
+    if not isinstance(state, dict) or state.get('indicator') not in states:
+        raise ValueError("ERR#0178: state is not a valid indicator state.")
+
+    return states[state['indicator']].from_dict(state)
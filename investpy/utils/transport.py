@@ -0,0 +1,657 @@
+# Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
+# See LICENSE for details.
+
+import os
+import json
+import time
+import base64
+import random
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_SIZE = 10
+
+DEFAULT_TIMEOUT = 30
+
+DEFAULT_MAX_WORKERS = 4
+
+DEFAULT_MAX_RETRIES = 3
+
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+DEFAULT_MAX_BACKOFF = 30
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+INVESTING_URL = 'https://www.investing.com'
+
+# random request parameters which are not part of the identity of a request
+IGNORED_PARAMETERS = ('smlID',)
+
+_TRANSPORT = None
+_LOCK = threading.Lock()
+
+
+class RateLimiter(object):
+    """
+    This class is used to limit the rate at which requests are sent to Investing.com with a token bucket, which is
+    refilled at `rate` tokens per second up to `burst` tokens, so that up to `burst` requests can be sent at once but
+    no more than `rate` requests per second are sent in the long run. The class is thread safe, so a single instance
+    can be shared by every thread sending requests.
+
+    Args:
+        rate (:obj:`float`): maximum number of requests per second.
+        burst (:obj:`int`, optional): maximum number of requests that can be sent at once, by default `rate`.
+
+    Attributes:
+        rate (:obj:`float`): maximum number of requests per second.
+        burst (:obj:`int`): maximum number of requests that can be sent at once.
+
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst if burst is not None else rate))
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        This method takes a token from the bucket, waiting until one is available if the bucket is empty.
+
+        Returns:
+            :obj:`float` - waited:
+                The time in seconds that had to be waited until a token was available, 0 if none.
+
+        """
+
+        with self._lock:
+            now = time.monotonic()
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # tokens can go negative, so that the threads waiting for a token are served in order
+            self._tokens -= 1
+
+            waited = -self._tokens / self.rate if self._tokens < 0 else 0.
+
+        if waited > 0:
+            time.sleep(waited)
+
+        return waited
+
+
+class Transport(object):
+    """
+    This class is used to send every HTTP request of investpy to Investing.com through a single
+    :obj:`requests.Session`, so that the TCP connections (and their TLS handshakes) are kept alive and reused
+    between requests instead of opening a new connection per request.
+
+    Args:
+        session (:obj:`requests.Session`, optional):
+            session to send the requests through, if None a new session is created. If a session is introduced,
+            it is used as is, so its adapters, proxies, etc. are kept.
+        pool_size (:obj:`int`, optional):
+            maximum number of connections kept alive per host, which should be at least the number of threads
+            sending requests concurrently, and also the maximum number of requests sent through the transport at the
+            same time, so that no request has to wait for a free connection. The connections are just sized by it if
+            no session is introduced.
+        timeout (:obj:`float` or :obj:`tuple`, optional):
+            default timeout in seconds of every request, either as a single value or as a (connect, read) tuple,
+            which can be overwritten per request.
+        rate_limit (:obj:`float`, optional):
+            maximum number of requests per second sent through the transport, if None the requests are not limited.
+        burst (:obj:`int`, optional): maximum number of requests that can be sent at once, by default `rate_limit`.
+        max_retries (:obj:`int`, optional):
+            retry budget of every request, which is the maximum number of times that a request is retried if
+            Investing.com responds with a retryable status code (429, 500, 502, 503 or 504).
+        backoff_factor (:obj:`float`, optional):
+            base delay in seconds between retries, which is doubled on every retry and randomly jittered, so that
+            the n-th retry waits a random time between 0 and `backoff_factor * 2 ** n` seconds.
+        max_backoff (:obj:`float`, optional): maximum delay in seconds between retries.
+        base_url (:obj:`str`, optional):
+            URL to send the requests to Investing.com to instead, e.g. `http://localhost:8000` to send them to a local
+            stand-in server, if None the requests are sent to Investing.com.
+        cache (:obj:`investpy.utils.cache.ResponseCache`, optional):
+            cache to serve the responses from while they are fresh, if None the responses are not cached.
+
+    Attributes:
+        session (:obj:`requests.Session`): session every request is sent through.
+        pool_size (:obj:`int`): maximum number of connections kept alive per host and of requests sent at once.
+        timeout (:obj:`float` or :obj:`tuple`): default timeout in seconds of every request.
+        rate_limiter (:obj:`investpy.utils.transport.RateLimiter`): rate limiter of the requests, if any.
+        max_retries (:obj:`int`): retry budget of every request.
+        backoff_factor (:obj:`float`): base delay in seconds between retries.
+        max_backoff (:obj:`float`): maximum delay in seconds between retries.
+        base_url (:obj:`str`): URL to send the requests to Investing.com to instead, if any.
+        cache (:obj:`investpy.utils.cache.ResponseCache`): cache to serve the responses from, if any.
+        stats (:obj:`dict`):
+            counters of the `requests` sent, the ones `throttled` by the rate limiter, the ones `retried`, and
+            the ones which `failed` after exhausting their retry budget.
+
+    """
+
+    def __init__(self, session=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, rate_limit=None,
+                 burst=None, max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 max_backoff=DEFAULT_MAX_BACKOFF, base_url=None, cache=None):
+        if session is None:
+            session = requests.Session()
+
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+        self.session = session
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self.rate_limiter = RateLimiter(rate_limit, burst=burst) if rate_limit is not None else None
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self.base_url = base_url.rstrip('/') if base_url is not None else None
+
+        self.cache = cache
+
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'retried': 0,
+            'failed': 0,
+        }
+
+        self._stats_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _backoff(self, retry, response):
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** retry))
+
+        retry_after = response.headers.get('Retry-After')
+
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, min(self.max_backoff, float(retry_after)))
+
+        return delay
+
+    def request(self, method, url, **kwargs):
+        """
+        This method sends the introduced request through the session of the current class instance, using its default
+        timeout unless a `timeout` is introduced. Every keyword argument is passed to :obj:`requests.Session.request`.
+        The request is served from the response cache while its cached response is fresh, if any; otherwise it waits
+        for the rate limiter, if any, and it is retried with a jittered exponential backoff while Investing.com
+        responds with a retryable status code, until the retry budget is exhausted. At most `pool_size` requests are
+        sent through the transport at the same time, whichever the thread they are sent from.
+
+        Args:
+            method (:obj:`str`): HTTP method of the request, i.e. `GET` or `POST`.
+            url (:obj:`str`): URL of the request.
+            limiter (:obj:`threading.Semaphore`, optional):
+                semaphore shared by a group of requests to cap how many of them are sent at the same time, which is
+                held while the request is sent (but not while it waits to be retried), if any.
+
+        Returns:
+            :obj:`requests.Response` - response:
+                The response of the request sent to the introduced URL, which is the last one if the request was
+                retried, so its status code needs to be checked as usual.
+
+        """
+
+        limiter = kwargs.pop('limiter', None)
+
+        kwargs.setdefault('timeout', self.timeout)
+
+        if self.cache is not None:
+            response = self.cache.get(method, url, params=kwargs.get('params'), data=kwargs.get('data'))
+
+            if response is not None:
+                return response
+
+        retry = 0
+
+        while True:
+            if self.rate_limiter is not None and self.rate_limiter.acquire() > 0:
+                self._count('throttled')
+
+            self._count('requests')
+
+            if limiter is not None:
+                with limiter, self._slots:
+                    response = self.send(method, url, **kwargs)
+            else:
+                with self._slots:
+                    response = self.send(method, url, **kwargs)
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                if self.cache is not None and response.status_code == 200:
+                    self.cache.set(method, url, response, params=kwargs.get('params'), data=kwargs.get('data'))
+
+                return response
+
+            if retry >= self.max_retries:
+                self._count('failed')
+                return response
+
+            self._count('retried')
+
+            time.sleep(self._backoff(retry, response))
+
+            retry += 1
+
+    def send(self, method, url, **kwargs):
+        """
+        This method sends the introduced request through the session of the current class instance just once, with
+        no rate limiting nor retries, so it is the method to override to change how requests are actually sent.
+
+        Args:
+            method (:obj:`str`): HTTP method of the request, i.e. `GET` or `POST`.
+            url (:obj:`str`): URL of the request.
+
+        Returns:
+            :obj:`requests.Response` - response:
+                The response of the request sent to the introduced URL.
+
+        """
+
+        if self.base_url is not None and url.startswith(INVESTING_URL):
+            url = self.base_url + url[len(INVESTING_URL):]
+
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def request_key(method, url, params=None, data=None):
+    """
+    This function computes the key which identifies the introduced request, which is a hash of its method, URL, query
+    parameters and form data, where the random parameters sent to Investing.com (i.e. `smlID`) are not included, so
+    that the same request always has the same key.
+
+    Args:
+        method (:obj:`str`): HTTP method of the request, i.e. `GET` or `POST`.
+        url (:obj:`str`): URL of the request.
+        params (:obj:`dict`, optional): query parameters of the request.
+        data (:obj:`dict` or :obj:`str`, optional): form data of the request.
+
+    Returns:
+        :obj:`str` - key:
+            The hexadecimal SHA-1 hash which identifies the introduced request.
+
+    """
+
+    def normalize(values):
+        if values is None:
+            return None
+
+        if isinstance(values, (str, bytes)):
+            return values.decode('utf-8') if isinstance(values, bytes) else values
+
+        items = values.items() if isinstance(values, dict) else values
+
+        return sorted([str(key), str(value)] for key, value in items if key not in IGNORED_PARAMETERS)
+
+    identity = [method.upper(), url, normalize(params), normalize(data)]
+
+    return hashlib.sha1(json.dumps(identity).encode('utf-8')).hexdigest()
+
+
+def response_headers(response):
+    """
+    This function returns the headers of the introduced response that need to be stored along with its content so
+    that it can be rebuilt later via :func:`build_response`, which are all but the ones describing how the content
+    was transferred, since the stored content is already decoded.
+
+    Args:
+        response (:obj:`requests.Response`): response whose headers are returned.
+
+    Returns:
+        :obj:`dict` - headers:
+            The headers of the introduced response to store.
+
+    """
+
+    return {key: value for key, value in response.headers.items()
+            if key.lower() not in ['content-encoding', 'content-length', 'transfer-encoding']}
+
+
+def build_response(status_code, headers, encoding, content, url):
+    """
+    This function builds a :obj:`requests.Response` from its stored values, as if it was just received.
+
+    Args:
+        status_code (:obj:`int`): status code of the response.
+        headers (:obj:`dict`): headers of the response.
+        encoding (:obj:`str`): encoding of the content of the response.
+        content (:obj:`bytes`): content of the response.
+        url (:obj:`str`): URL of the request of the response.
+
+    Returns:
+        :obj:`requests.Response` - response:
+            The rebuilt response.
+
+    """
+
+    response = requests.Response()
+
+    response.status_code = status_code
+    response.headers.update(headers)
+    response.encoding = encoding
+    response._content = content
+    response.url = url
+
+    return response
+
+
+class RecordingTransport(Transport):
+    """
+    This class is used to record the responses of the requests sent to Investing.com into the introduced directory,
+    so that they can be later replayed with :class:`ReplayTransport` without accessing Investing.com, e.g. to test or
+    to benchmark investpy offline and deterministically. Every response is stored as a JSON file named after the key
+    of its request (see :func:`request_key`), so recording the same request again overwrites its response.
+
+    Args:
+        directory (:obj:`str`): path to the directory where the responses are stored, created if it does not exist.
+        endpoints (:obj:`list` of :obj:`str`, optional):
+            names of the endpoints whose responses are recorded, i.e. the last part of their URL path such as
+            `HistoricalDataAjax`, `StocksFilter`, `GetTechincalData`, `getCalendarFilteredData`, `SearchInnerPage`
+            or `SearchStocks`; if None the responses of every request are recorded.
+
+    Any other argument is passed to :class:`Transport`.
+
+    """
+
+    def __init__(self, directory, endpoints=None, **kwargs):
+        super(RecordingTransport, self).__init__(**kwargs)
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.endpoints = endpoints
+
+    def send(self, method, url, **kwargs):
+        response = super(RecordingTransport, self).send(method, url, **kwargs)
+
+        if self.endpoints is None or url.split('?')[0].rstrip('/').split('/')[-1] in self.endpoints:
+            record = {
+                'method': method.upper(),
+                'url': url,
+                'params': kwargs.get('params'),
+                'data': kwargs.get('data'),
+                'status_code': response.status_code,
+                'headers': response_headers(response),
+                'encoding': response.encoding,
+                'content': base64.b64encode(response.content).decode('ascii'),
+            }
+
+            path = os.path.join(self.directory, request_key(method, url, kwargs.get('params'), kwargs.get('data')) + '.json')
+
+            with open(path + '.tmp', 'w') as f:
+                json.dump(record, f, default=str)
+
+            os.replace(path + '.tmp', path)
+
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    This class is used to replay the responses previously recorded with :class:`RecordingTransport`, so that no
+    request is actually sent to Investing.com. Note that the responses are matched by the key of their request (see
+    :func:`request_key`), so the requests need to be exactly the same ones that were recorded, but for `smlID`.
+
+    Args:
+        directory (:obj:`str`): path to the directory where the responses were recorded.
+
+    Any other argument is passed to :class:`Transport`.
+
+    Raises:
+        ConnectionError: raised when a request whose response was not recorded is sent.
+
+    """
+
+    def __init__(self, directory, **kwargs):
+        super(ReplayTransport, self).__init__(**kwargs)
+
+        self.directory = directory
+
+    def send(self, method, url, **kwargs):
+        path = os.path.join(self.directory, request_key(method, url, kwargs.get('params'), kwargs.get('data')) + '.json')
+
+        if not os.path.exists(path):
+            raise ConnectionError("ERR#0151: no recorded response found for the request to " + url + ".")
+
+        with open(path, 'r') as f:
+            record = json.load(f)
+
+        return build_response(status_code=record['status_code'], headers=record['headers'],
+                              encoding=record['encoding'], content=base64.b64decode(record['content']), url=url)
+
+
+def get_transport():
+    """
+    This function returns the transport shared by every function of investpy, which is created the first time it is
+    needed with the default configuration, unless it has been previously configured via :func:`configure_transport`.
+
+    Returns:
+        :obj:`investpy.utils.transport.Transport` - transport:
+            The transport every request to Investing.com is sent through.
+
+    """
+
+    global _TRANSPORT
+
+    with _LOCK:
+        if _TRANSPORT is None:
+            _TRANSPORT = Transport()
+
+    return _TRANSPORT
+
+
+def configure_transport(session=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, rate_limit=None, burst=None,
+                        max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                        max_backoff=DEFAULT_MAX_BACKOFF, base_url=None, cache=None):
+    """
+    This function configures the transport shared by every function of investpy, replacing the current one. It can
+    be used either to tune the connection pool size and the default timeout, to limit the rate at which requests
+    are sent, to tune how requests are retried, or to inject a custom :obj:`requests.Session` (e.g. with proxies)
+    to send every request through.
+
+    Args:
+        session (:obj:`requests.Session`, optional):
+            session to send the requests through, if None a new session is created.
+        pool_size (:obj:`int`, optional):
+            maximum number of connections kept alive per host. Just used if no session is introduced.
+        timeout (:obj:`float` or :obj:`tuple`, optional):
+            default timeout in seconds of every request, either as a single value or as a (connect, read) tuple.
+        rate_limit (:obj:`float`, optional):
+            maximum number of requests per second, if None the requests are not limited.
+        burst (:obj:`int`, optional): maximum number of requests that can be sent at once, by default `rate_limit`.
+        max_retries (:obj:`int`, optional): maximum number of times a request is retried.
+        backoff_factor (:obj:`float`, optional): base delay in seconds between retries.
+        max_backoff (:obj:`float`, optional): maximum delay in seconds between retries.
+        base_url (:obj:`str`, optional):
+            URL to send the requests to Investing.com to instead, e.g. a local stand-in server.
+        cache (:obj:`investpy.utils.cache.ResponseCache`, optional):
+            cache to serve the responses from while they are fresh, if None the responses are not cached.
+
+    Returns:
+        :obj:`investpy.utils.transport.Transport` - transport:
+            The new transport every request to Investing.com is sent through.
+
+    Raises:
+        ValueError: raised if any of the introduced parameters is not valid or errored.
+
+    Examples:
+        >>> investpy.utils.transport.configure_transport(pool_size=20, timeout=(5, 30), rate_limit=5, burst=10)
+
+    """
+
+    if session is not None and not isinstance(session, requests.Session):
+        raise ValueError("ERR#0141: session argument needs to be a requests.Session.")
+
+    if not isinstance(pool_size, int) or isinstance(pool_size, bool) or pool_size < 1:
+        raise ValueError("ERR#0142: pool_size argument needs to be an integer greater than 0.")
+
+    if timeout is not None and not isinstance(timeout, (int, float, tuple)):
+        raise ValueError("ERR#0143: timeout argument needs to be a number of seconds, a (connect, read) tuple or None.")
+
+    if rate_limit is not None and (not isinstance(rate_limit, (int, float)) or isinstance(rate_limit, bool) or rate_limit <= 0):
+        raise ValueError("ERR#0147: rate_limit argument needs to be a number of requests per second greater than 0 or None.")
+
+    if burst is not None and (not isinstance(burst, int) or isinstance(burst, bool) or burst < 1):
+        raise ValueError("ERR#0148: burst argument needs to be an integer greater than 0 or None.")
+
+    if not isinstance(max_retries, int) or isinstance(max_retries, bool) or max_retries < 0:
+        raise ValueError("ERR#0149: max_retries argument needs to be an integer greater or equal than 0.")
+
+    for value in [backoff_factor, max_backoff]:
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            raise ValueError("ERR#0150: backoff_factor and max_backoff arguments need to be numbers of seconds greater or equal than 0.")
+
+    if base_url is not None and not isinstance(base_url, str):
+        raise ValueError("ERR#0152: base_url argument needs to be a str or None.")
+
+    if cache is not None and not (hasattr(cache, 'get') and hasattr(cache, 'set')):
+        raise ValueError("ERR#0153: cache argument needs to be an investpy.utils.cache.ResponseCache or None.")
+
+    return set_transport(Transport(session=session, pool_size=pool_size, timeout=timeout, rate_limit=rate_limit,
+                                   burst=burst, max_retries=max_retries, backoff_factor=backoff_factor,
+                                   max_backoff=max_backoff, base_url=base_url, cache=cache))
+
+
+def set_transport(transport):
+    """
+    This function sets the introduced transport as the one shared by every function of investpy. Any object with
+    `get` and `post` methods which behave as the ones of :obj:`requests.Session` can be used.
+
+    Args:
+        transport (:obj:`investpy.utils.transport.Transport`): transport every request is sent through.
+
+    Returns:
+        :obj:`investpy.utils.transport.Transport` - transport:
+            The introduced transport.
+
+    """
+
+    global _TRANSPORT
+
+    with _LOCK:
+        _TRANSPORT = transport
+
+    return transport
+
+
+def post_concurrently(url, headers, data, max_workers=DEFAULT_MAX_WORKERS, return_exceptions=False, limiter=None):
+    """
+    This function sends a POST request to the introduced URL per each element of the introduced data, through the
+    shared transport, on a bounded pool of threads, so that e.g. every date interval of a historical data request is
+    retrieved at the same time instead of one after another. The amount of threads is bounded both by `max_workers`
+    and by the connection pool size of the transport, so that no thread has to wait for a free connection.
+
+    Args:
+        url (:obj:`str`): URL every request is sent to.
+        headers (:obj:`dict`): headers of every request.
+        data (:obj:`list` of :obj:`dict`): form data of each request.
+        max_workers (:obj:`int`, optional): maximum number of requests being sent at the same time.
+        return_exceptions (:obj:`bool`, optional):
+            whether the exception raised by a failing request should be returned in place of its response, instead
+            of being raised.
+        limiter (:obj:`threading.Semaphore`, optional):
+            semaphore shared with other requests, e.g. the ones of other financial products being retrieved at the
+            same time, to cap how many of them are sent at once, if any.
+
+    Returns:
+        :obj:`list` of :obj:`requests.Response` - responses:
+            The responses of the sent requests, in the same order as the introduced data.
+
+    Raises:
+        Exception: the exception raised by the first failing request (in the order of the introduced data), if any
+            and if `return_exceptions` is False.
+
+    """
+
+    transport = get_transport()
+
+    def post(value):
+        try:
+            if limiter is not None:
+                return transport.post(url, headers=headers, data=value, limiter=limiter)
+
+            return transport.post(url, headers=headers, data=value)
+        except Exception as e:
+            if return_exceptions is True:
+                return e
+            raise
+
+    max_workers = min(len(data), max_workers, getattr(transport, 'pool_size', DEFAULT_POOL_SIZE))
+
+    if max_workers <= 1:
+        return [post(value) for value in data]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(post, value) for value in data]
+
+    return [future.result() for future in futures]
+
+
+def iter_post(url, headers, data, prefetch=1):
+    """
+    This function sends a POST request to the introduced URL per each element of the introduced data, through the
+    shared transport, yielding each response as soon as it is received, so that e.g. each date interval of a long
+    historical data request is processed while the next ones are being retrieved. Unlike
+    :func:`investpy.utils.transport.post_concurrently`, at most `prefetch` responses are retrieved ahead of the one
+    being processed, so that the memory usage does not depend on the amount of requests.
+
+    Args:
+        url (:obj:`str`): URL every request is sent to.
+        headers (:obj:`dict`): headers of every request.
+        data (:obj:`list` of :obj:`dict`): form data of each request.
+        prefetch (:obj:`int`, optional): number of requests sent ahead of the response being processed.
+
+    Yields:
+        :obj:`requests.Response` - response:
+            The responses of the sent requests, in the same order as the introduced data.
+
+    """
+
+    transport = get_transport()
+
+    if prefetch < 1:
+        for value in data:
+            yield transport.post(url, headers=headers, data=value)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        futures = deque()
+
+        for value in data:
+            futures.append(executor.submit(transport.post, url, headers=headers, data=value))
+
+            if len(futures) > prefetch:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
@@ -1,9 +1,98 @@
 # Copyright 2018-2020 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
+import os
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
 import pytest
+import requests
 
 import investpy
+from investpy.utils.transport import Transport, set_transport, configure_transport
+
+
+PRICES = ['1.5', '1.0', '2.0', '0.5', '100']
+
+
+def historical_response(rows, status_code=200):
+    """
+    This function builds a response of the Investing.com historical data endpoint from the introduced rows, as lists of
+    the timestamp and the open, high, low, close and volume values.
+    """
+
+    table = ''.join('<tr>' + ''.join('<td data-real-value="%s"></td>' % value for value in row) + '</tr>' for row in rows)
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = 'utf-8'
+    response._content = ('<div><table id="curr_table"><tbody>' + table + '</tbody></table></div>').encode('utf-8')
+
+    return response
+
+
+def daily_rows(start, end, values=PRICES):
+    """
+    This function builds a row per day from the end date back to the start date, as Investing.com sorts them.
+    """
+
+    rows = list()
+
+    while end >= start:
+        rows.append([int(end.replace(tzinfo=timezone.utc).timestamp())] + list(values))
+        end -= timedelta(days=1)
+
+    return rows
+
+
+def request_dates(data):
+    """
+    This function returns the start and end dates of the introduced historical data request form data.
+    """
+
+    return datetime.strptime(data['st_date'], '%m/%d/%Y'), datetime.strptime(data['end_date'], '%m/%d/%Y')
+
+
+class HistoricalTransport(Transport):
+    """
+    This class answers every request with the historical data rows built by `rows` from the form data of the request,
+    keeping the method, URL and timeout, and the form data of every request, and the threads they were sent from.
+    """
+
+    def __init__(self, rows, status_code=None, **kwargs):
+        super(HistoricalTransport, self).__init__(**kwargs)
+
+        self.rows = rows
+        self.status_code = status_code
+        self.requests = list()
+        self.data = list()
+        self.threads = set()
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs.get('timeout', self.timeout)))
+        self.data.append(kwargs['data'])
+        self.threads.add(threading.get_ident())
+
+        status_code = self.status_code(kwargs['data']) if self.status_code is not None else 200
+
+        return historical_response(self.rows(kwargs['data']), status_code=status_code)
+
+
+@contextmanager
+def using_transport(transport):
+    """
+    This function sets the introduced transport as the shared one while the context is active, restoring the default
+    transport afterwards even if the context fails.
+    """
+
+    set_transport(transport)
+
+    try:
+        yield transport
+    finally:
+        configure_transport()
 
 
 def test_investpy():
@@ -1356,6 +1445,1226 @@ def test_investpy_technical():
                               interval=param['interval'])
 
 
+def test_investpy_catalog():
+    """
+    This function checks that the static data files are loaded once and served from the shared catalog cache.
+    """
+
+    from investpy.utils.catalog import load_catalog, invalidate_catalogs, reload_catalogs
+
+    stocks = load_catalog('resources/stocks.csv', keep_default_na=False)
+    stocks.drop(columns=['tag', 'id'], inplace=True)
+
+    assert 'id' in load_catalog('resources/stocks.csv', keep_default_na=False).columns
+
+    reload_catalogs(resource_path='resources/stocks.csv')
+    invalidate_catalogs()
+
+    assert len(load_catalog('resources/stocks.csv', keep_default_na=False)) == len(investpy.get_stocks())
+
+    try:
+        load_catalog('resources/error.csv')
+    except FileNotFoundError:
+        pass
+
+
+def test_investpy_resolve():
+    """
+    This function checks that financial products are properly resolved from the static data files without any request.
+    """
+
+    params = [
+        {
+            'product_type': 'stock',
+            'name': 'bbva',
+            'country': 'spain',
+        },
+        {
+            'product_type': 'etf',
+            'name': 'bbva accion dj eurostoxx 50',
+            'country': 'spain',
+        },
+        {
+            'product_type': 'index',
+            'name': 'ibex 35',
+            'country': 'spain',
+        },
+        {
+            'product_type': 'currency_cross',
+            'name': 'eur/usd',
+            'country': None,
+        },
+        {
+            'product_type': 'crypto',
+            'name': 'bitcoin',
+            'country': None,
+        },
+        {
+            'product_type': 'commodity',
+            'name': 'copper',
+            'country': None,
+        },
+    ]
+
+    for param in params:
+        instrument = investpy.resolve(product_type=param['product_type'],
+                                      name=param['name'],
+                                      country=param['country'])
+
+        assert instrument['id'] is not None
+
+    assert investpy.resolve('stock', ' BBVA ', 'Spain') == investpy.resolve('stock', 'bbva', 'spain')
+
+
+def test_investpy_catalog_binary():
+    """
+    This function checks that the compiled binary catalogs hold the same data as the static data files.
+    """
+
+    import tempfile
+
+    import pandas as pd
+    import pkg_resources
+
+    from investpy.utils.catalog_binary import compile_catalog, read_compiled_catalog
+
+    params = [
+        {
+            'resource_path': 'resources/stocks.csv',
+            'keep_default_na': False,
+        },
+        {
+            'resource_path': 'resources/etfs.csv',
+            'keep_default_na': True,
+        },
+        {
+            'resource_path': 'resources/currency_crosses.csv',
+            'keep_default_na': True,
+        },
+    ]
+
+    for param in params:
+        data = read_compiled_catalog(resource_path=param['resource_path'], keep_default_na=param['keep_default_na'])
+
+        assert data is not None
+
+        pd.testing.assert_frame_equal(data, pd.read_csv(pkg_resources.resource_filename('investpy', param['resource_path']),
+                                                        keep_default_na=param['keep_default_na']))
+
+    assert read_compiled_catalog(resource_path='resources/error.csv') is None
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, 'resources'))
+
+        with open(os.path.join(directory, 'resources', 'test.csv'), 'w') as f:
+            f.write('name,symbol\nbbva,BBVA\n')
+
+        compile_catalog('resources/test.csv', directory=directory)
+
+        assert read_compiled_catalog('resources/test.csv', directory=directory)['symbol'].tolist() == ['BBVA']
+
+        # same size but different contents, so the compiled catalog is outdated
+        with open(os.path.join(directory, 'resources', 'test.csv'), 'w') as f:
+            f.write('name,symbol\nbbva,BBVX\n')
+
+        assert read_compiled_catalog('resources/test.csv', directory=directory) is None
+
+
+def test_investpy_import():
+    """
+    This function checks that importing investpy is lazy, so that just the used submodules are imported.
+    """
+
+    import sys
+    import subprocess
+
+    code = "import sys; import investpy; print(' '.join(sys.modules.keys())); " \
+           "investpy.get_stock_historical_data; print(' '.join(sys.modules.keys()))"
+
+    output = subprocess.check_output([sys.executable, '-c', code]).decode('utf-8').split('\n')
+
+    imported, used = output[0].split(' '), output[1].split(' ')
+
+    if sys.version_info >= (3, 7):
+        for module in ['pandas', 'numpy', 'lxml', 'requests', 'investpy.stocks', 'investpy.utils.historical']:
+            assert module not in imported
+
+        assert 'investpy.stocks' in used
+
+        for module in ['investpy.screener', 'investpy.technical', 'investpy.news', 'investpy.utils.screen_obj']:
+            assert module not in used
+
+    assert investpy.screener.__name__ == 'screener'
+    assert 'get_stock_historical_data' in dir(investpy)
+
+    try:
+        investpy.get_stock_error
+    except AttributeError:
+        pass
+
+
+def test_investpy_transport():
+    """
+    This function checks that every request is sent through the configurable transport shared by investpy.
+    """
+
+    from investpy.utils.transport import get_transport
+
+    session = requests.Session()
+
+    try:
+        transport = configure_transport(session=session, timeout=(5, 30))
+
+        assert get_transport() is transport
+        assert transport.session is session
+        assert transport.timeout == (5, 30)
+
+        transport = configure_transport(pool_size=4)
+
+        assert transport.session.get_adapter('https://www.investing.com')._pool_maxsize == 4
+    finally:
+        configure_transport()
+
+    with using_transport(HistoricalTransport(lambda data: [], status_code=lambda data: 503, timeout=10)) as transport:
+        try:
+            investpy.get_stock_recent_data(stock='bbva', country='spain')
+        except ConnectionError:
+            pass
+
+    assert transport.requests == [('POST', 'https://www.investing.com/instruments/HistoricalDataAjax', 10)]
+
+
+def test_investpy_historical_intervals():
+    """
+    This function checks that the date intervals of long historical data requests are retrieved concurrently and reassembled in order.
+    """
+
+    def rows(data):
+        start, end = request_dates(data)
+
+        return daily_rows(start - timedelta(days=1), end)
+
+    with using_transport(HistoricalTransport(rows, pool_size=4)) as transport:
+        data = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/1980', to_date='01/01/2019')
+
+        assert data.index.is_monotonic_increasing and data.index.is_unique
+        assert len(data) == (datetime(2019, 1, 1) - datetime(1979, 12, 31)).days + 1
+
+        data = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/1980', to_date='01/01/2019', order='descending')
+
+        assert data.index.is_monotonic_decreasing and data.index.is_unique
+
+        data = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/1980', to_date='01/01/2019', as_json=True)
+
+        assert len(json.loads(data)['historical']) == (datetime(2019, 1, 1) - datetime(1979, 12, 31)).days + 1
+
+    assert len(transport.threads) > 1
+
+
+def test_investpy_bulk():
+    """
+    This function checks that the historical data of several financial products is retrieved at once, collecting the errors.
+    """
+
+    def rows(data):
+        _, end = request_dates(data)
+
+        return daily_rows(end - timedelta(days=4), end)
+
+    instruments = [
+        ('stock', 'bbva', 'spain'),
+        ('stock', 'aapl', 'united states'),
+        ('index', 'ibex 35', 'spain'),
+        ('currency_cross', 'eur/usd'),
+        ('stock', 'error', 'spain'),
+    ]
+
+    with using_transport(HistoricalTransport(rows, status_code=lambda data: 200 if data['curr_id'] != 446 else 503)):
+        data, errors = investpy.get_historical_data_bulk(instruments, from_date='01/01/2019', to_date='01/01/2020')
+
+        assert sorted(data.keys()) == sorted(instruments[1:4])
+        assert sorted(errors.keys()) == [instruments[0], instruments[4]]
+        assert isinstance(errors[instruments[0]], ConnectionError)
+
+        data, errors = investpy.get_historical_data_bulk(instruments, from_date='01/01/2019', to_date='01/01/2020', as_long=True)
+
+    assert len(data) == 15
+    assert sorted(data['Name'].unique().tolist()) == ['aapl', 'eur/usd', 'ibex 35']
+
+
+def test_investpy_bulk_concurrency():
+    """
+    This function checks that the requests sent at the same time are capped by the bulk retrieval and the transport.
+    """
+
+    import time
+
+    class ConcurrentTransport(Transport):
+        def __init__(self, **kwargs):
+            super(ConcurrentTransport, self).__init__(**kwargs)
+
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def send(self, method, url, **kwargs):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+
+            time.sleep(0.01)
+
+            _, end = request_dates(kwargs['data'])
+
+            with self.lock:
+                self.active -= 1
+
+            return historical_response(daily_rows(end, end))
+
+    instruments = [
+        ('stock', 'bbva', 'spain'),
+        ('stock', 'aapl', 'united states'),
+        ('index', 'ibex 35', 'spain'),
+        ('currency_cross', 'eur/usd'),
+    ]
+
+    with using_transport(ConcurrentTransport()) as transport:
+        data, errors = investpy.get_historical_data_bulk(instruments, from_date='01/01/1960', to_date='01/01/2020',
+                                                         max_workers=2)
+
+    assert not errors and len(data) == 4
+    assert transport.stats['requests'] > 8 and transport.peak <= 2
+
+    with using_transport(ConcurrentTransport(pool_size=3)) as transport:
+        data, errors = investpy.get_historical_data_bulk(instruments, from_date='01/01/1960', to_date='01/01/2020')
+
+    assert not errors and len(data) == 4
+    assert transport.peak <= 3
+
+
+def test_investpy_rate_limit():
+    """
+    This function checks that the requests are rate limited and retried with backoff on retryable status codes.
+    """
+
+    import time
+
+    from investpy.utils.transport import RateLimiter
+
+    rate_limiter = RateLimiter(rate=50, burst=2)
+
+    start = time.monotonic()
+
+    waited = [rate_limiter.acquire() for _ in range(6)]
+
+    assert waited[:2] == [0., 0.] and all(value > 0 for value in waited[2:])
+    assert time.monotonic() - start >= 0.07
+
+    class FlakyTransport(Transport):
+        def send(self, method, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 503 if self.stats['requests'] < 3 else 200
+
+            return response
+
+    transport = FlakyTransport(rate_limit=100, burst=1, max_retries=3, backoff_factor=0.01)
+
+    assert transport.get('https://www.investing.com').status_code == 200
+    assert transport.stats['requests'] == 3 and transport.stats['retried'] == 2 and transport.stats['failed'] == 0
+    assert transport.stats['throttled'] >= 1
+
+    transport = FlakyTransport(max_retries=1, backoff_factor=0)
+
+    assert transport.get('https://www.investing.com').status_code == 503
+    assert transport.stats['retried'] == 1 and transport.stats['failed'] == 1
+
+
+def test_investpy_record_replay():
+    """
+    This function checks that the responses from Investing.com are recorded and replayed without sending any request.
+    """
+
+    import tempfile
+
+    from investpy.utils.transport import RecordingTransport, ReplayTransport
+
+    class HistoricalSession(requests.Session):
+        def request(self, method, url, **kwargs):
+            return historical_response(daily_rows(datetime(2019, 12, 27), datetime(2019, 12, 31)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        with using_transport(RecordingTransport(directory, endpoints=['HistoricalDataAjax'], session=HistoricalSession())):
+            recorded = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2019', to_date='01/01/2020')
+
+        assert len(os.listdir(directory)) == 1
+
+        with using_transport(ReplayTransport(directory)):
+            replayed = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2019', to_date='01/01/2020')
+
+            assert recorded.equals(replayed)
+
+            try:
+                investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2018', to_date='01/01/2020')
+            except ConnectionError:
+                pass
+
+
+def test_investpy_cache():
+    """
+    This function checks that the responses from Investing.com are cached on disk per endpoint, ignoring the random smlID.
+    """
+
+    import tempfile
+
+    import re
+
+    from investpy.utils.cache import CACHE_ENDPOINTS, ResponseCache
+    from investpy.utils.transport import request_key
+
+    class CountingTransport(Transport):
+        def send(self, method, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.encoding = 'utf-8'
+            response._content = b'<div>cached</div>'
+
+            return response
+
+    assert request_key('POST', 'url', data={'curr_id': 1, 'smlID': 1}) == request_key('POST', 'url', data={'curr_id': 1, 'smlID': 2})
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(os.path.join(directory, 'cache.sqlite'), ttls={'technical': 0})
+
+        endpoints = {
+            'https://www.investing.com/equities/bbva-company-profile': 'company_profile',
+            'https://www.investing.com/equities/bbva-dividends': 'dividends',
+            'https://www.investing.com/equities/MoreDividendsHistory': 'dividends',
+            'https://www.investing.com/instruments/Financials/changesummaryreporttypeajax': 'financial_summary',
+            'https://www.investing.com/funds/spain-funds': 'overview',
+            'https://www.investing.com/etfs/spain-etfs': 'overview',
+            'https://www.investing.com/indices/spain-indices': 'overview',
+            'https://www.investing.com/rates-bonds/spain-government-bonds': 'overview',
+            'https://www.investing.com/certificates/france-certificates': 'overview',
+            'https://www.investing.com/equities/StocksFilter?index_id=all': 'overview',
+            'https://www.investing.com/crypto/currencies': 'overview',
+            'https://www.investing.com/equities/bbva': 'information',
+            'https://www.investing.com/funds/bbva-bolsa-plus-fi': 'information',
+            'https://www.investing.com/crypto/bitcoin': 'information',
+        }
+
+        for url, endpoint in endpoints.items():
+            assert cache.endpoint(url) == endpoint
+
+            # the endpoints do not overlap, so the endpoint of a URL does not depend on the order they are tried in
+            assert [name for name, (pattern, _) in CACHE_ENDPOINTS.items()
+                    if re.search(pattern, url.split('?')[0])] == [endpoint]
+
+        assert cache.endpoint('https://www.investing.com/instruments/Service/GetTechincalData') is None
+        assert cache.endpoint('https://www.investing.com/instruments/HistoricalDataAjax') is None
+
+        transport = CountingTransport(cache=cache)
+
+        for _ in range(3):
+            assert transport.get('https://www.investing.com/equities/bbva-company-profile').text == '<div>cached</div>'
+
+        assert transport.stats['requests'] == 1
+        assert cache.stats['hits'] == 2 and cache.stats['misses'] == 1
+        assert cache.stats['endpoints']['company_profile']['hits'] == 2
+
+        transport = CountingTransport(cache=ResponseCache(cache.path))
+
+        transport.get('https://www.investing.com/equities/bbva-company-profile')
+
+        assert transport.stats['requests'] == 0
+
+        cache.clear()
+        cache.purge()
+
+    configure_transport()
+
+
+def test_investpy_parser():
+    """
+    This function checks that the historical data tables are parsed into NumPy columns, also when they are not regular.
+    """
+
+    from investpy.utils.parser import parse_historical_data
+
+    rows = [[1577836800, '1,234.5', '1,230.25', '1,240.75', '1,229.0', '1000'],
+            [1577750400, '1,200.5', '1,190.25', '1,210.75', '1,180.0', '2000']]
+
+    def response(rows, cell='<td data-real-value="%s">%s</td>'):
+        return '<div><table id="curr_table"><tbody>' + \
+               ''.join('<tr>' + ''.join(cell % (value, value) for value in row) + '</tr>' for row in rows) + \
+               '</tbody></table></div>'
+
+    table = parse_historical_data(response(rows), volume=True)
+
+    assert table['date'].tolist() == [1577836800, 1577750400]
+    assert table['close'].tolist() == [1234.5, 1200.5]
+    assert table['open'].tolist() == [1230.25, 1190.25]
+    assert table['volume'].tolist() == [1000, 2000]
+
+    assert 'volume' not in parse_historical_data(response(rows), volume=False)
+
+    irregular = parse_historical_data(response(rows, cell="<td data-real-value='%s' class='%s'></td>").replace(
+        "data-real-value='1000'", ""), volume=True)
+
+    assert irregular['date'].tolist() == table['date'].tolist()
+    assert irregular['volume'].tolist() == [0, 2000]
+
+    empty = parse_historical_data('<div><table id="curr_table"><tbody><tr><td colspan="6">No results found</td></tr>'
+                                  '</tbody></table></div>', volume=True)
+
+    assert all(len(column) == 0 for column in empty.values())
+
+    assert parse_historical_data('<div></div>') is None
+
+
+def test_investpy_historical_data():
+    """
+    This function checks that the historical data is built from typed columns both as a pandas.DataFrame and as a json.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    from investpy.utils.data import HistoricalData
+
+    def table(dates):
+        return {
+            'date': np.array([int(datetime(2020, 1, day, tzinfo=timezone.utc).timestamp()) for day in dates]),
+            'open': np.array([float(day) for day in dates]),
+            'high': np.array([day + 1.0 for day in dates]),
+            'low': np.array([day - 1.0 for day in dates]),
+            'close': np.array([day + 0.5 for day in dates]),
+            'volume': np.array([day * 100 for day in dates]),
+        }
+
+    data = HistoricalData(volume=True, currency='EUR', exchange='Madrid')
+    data.append(table([5, 4, 3]))
+    data.append(table([3, 2, 1]))
+
+    assert len(data) == 6
+
+    df = data.to_frame()
+
+    assert df.index.name == 'Date' and df.index.is_monotonic_increasing and df.index.is_unique
+    assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume', 'Currency', 'Exchange']
+    assert df['Volume'].dtype == np.int64 and df['Close'].dtype == np.float64
+    assert isinstance(df['Currency'].dtype, pd.CategoricalDtype) and (df['Currency'] == 'EUR').all()
+    assert df.index[0] == datetime(2020, 1, 1) and df['Open'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    assert data.to_frame(order='descending').index.is_monotonic_decreasing
+
+    json_ = json.loads(data.to_json('bbva', key='recent', order='descending'))
+
+    assert json_['name'] == 'bbva' and len(json_['recent']) == 5
+    assert json_['recent'][0] == {'date': '05/01/2020', 'open': 5.0, 'high': 6.0, 'low': 4.0, 'close': 5.5,
+                                  'volume': 500, 'currency': 'EUR', 'exchange': 'Madrid'}
+
+    data = HistoricalData(currency='EUR', json_keys={'currency': 'Currency'})
+    data.append(table([2, 1]))
+
+    assert 'Volume' not in data.to_frame().columns
+    assert json.loads(data.to_json('eur/usd'))['historical'][0]['Currency'] == 'EUR'
+
+    assert HistoricalData().to_frame().empty
+
+
+def test_investpy_dates():
+    """
+    This function checks that the epoch values are converted at once into either timezone-naive or timezone-aware dates.
+    """
+
+    from investpy.utils.data import epoch_to_dates, HistoricalData
+
+    epoch = [int(datetime(2020, 3, day, tzinfo=timezone.utc).timestamp()) + 3600 for day in range(1, 31)]
+
+    dates = epoch_to_dates(epoch)
+
+    assert dates.name == 'Date' and dates.tz is None
+    assert dates.tolist() == [datetime(2020, 3, day) for day in range(1, 31)]
+
+    dates = epoch_to_dates(epoch, tz='Europe/Madrid')
+
+    assert str(dates.tz) == 'Europe/Madrid'
+    assert all(date.hour == 0 for date in dates) and dates[-1].day == 30
+
+    assert epoch_to_dates([value // 86400 for value in epoch], unit='D').equals(epoch_to_dates(epoch))
+
+    data = HistoricalData()
+    data.append({'date': epoch, 'open': [1.0] * 30, 'high': [1.0] * 30, 'low': [1.0] * 30, 'close': [1.0] * 30})
+
+    assert data.to_frame().index.equals(epoch_to_dates(epoch))
+
+
+def test_investpy_historical_engine():
+    """
+    This function checks that the recent and historical data of every financial product type is retrieved by the same engine.
+    """
+
+    products = [
+        ('stock', {'stock': 'bbva', 'country': 'spain'}, 'BBVA Historical Data', ['Volume', 'Currency']),
+        ('etf', {'etf': 'australian high interest cash', 'country': 'australia'}, 'AAA Historical Data', ['Volume', 'Currency', 'Exchange']),
+        ('index', {'index': 's&p merval', 'country': 'argentina'}, 'S&P Merval Historical Data', ['Volume', 'Currency']),
+        ('currency_cross', {'currency_cross': 'usd/aed'}, 'USD/AED Historical Data', ['Currency']),
+        ('bond', {'bond': 'argentina 1y'}, 'Argentina 1-Year Bond Yield Historical Data', []),
+        ('commodity', {'commodity': 'gold'}, 'Gold Futures Historical Data', ['Volume', 'Currency']),
+        ('crypto', {'crypto': 'bitcoin'}, 'Bitcoin Historical Data', ['Volume', 'Currency']),
+        ('certificate', {'certificate': 'bnp gold 31dec99', 'country': 'france'}, 'NL0006454928 Historical Data', []),
+    ]
+
+    for product, params, header, columns in products:
+        with using_transport(HistoricalTransport(lambda data: daily_rows(datetime(2020, 1, 1), datetime(2020, 1, 5)))) as transport:
+            recent = getattr(investpy, 'get_' + product + '_recent_data')(**params)
+            historical = getattr(investpy, 'get_' + product + '_historical_data')(from_date='01/01/2020', to_date='05/01/2020', **params)
+
+        assert list(recent.columns) == ['Open', 'High', 'Low', 'Close'] + columns
+        assert recent.equals(historical) and len(recent) == 5
+
+        assert [data['header'] for data in transport.data] == [header, header]
+
+
+def test_investpy_historical_iterator():
+    """
+    This function checks that long historical data requests are yielded by parts, either per date interval or per batch of rows.
+    """
+
+    import pandas as pd
+
+    params = {'stock': 'bbva', 'country': 'spain', 'from_date': '01/01/1980', 'to_date': '01/01/2019'}
+
+    with using_transport(HistoricalTransport(lambda data: daily_rows(*request_dates(data)))):
+        data = investpy.get_stock_historical_data(**params)
+
+        parts = list(investpy.iter_stock_historical_data(**params))
+
+        assert len(parts) == 3
+        assert pd.concat(parts).equals(data)
+
+        parts = list(investpy.iter_stock_historical_data(order='descending', batch_size=1000, **params))
+
+        assert all(len(part) == 1000 for part in parts[:-1]) and 0 < len(parts[-1]) <= 1000
+        assert pd.concat(parts).equals(data.iloc[::-1])
+
+        parts = list(investpy.iter_stock_historical_data(as_json=True, batch_size=5000, **params))
+
+        assert sum(len(json.loads(part)['historical']) for part in parts) == len(data)
+
+
+def test_investpy_serializer():
+    """
+    This function checks that the json documents are written from columns with every serializer and as raw bytes.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    from investpy.utils.data import HistoricalData
+    from investpy.utils.serializer import configure_json, get_json_backend, set_json_backend, frame_to_records, orjson
+
+    data = HistoricalData(volume=True, currency='EUR')
+    data.append({
+        'date': np.array([1577836800, 1577923200]),
+        'open': np.array([1.1, 2.2]),
+        'high': np.array([1.3, 2.4]),
+        'low': np.array([1.0, 2.0]),
+        'close': np.array([1.2, 2.3]),
+        'volume': np.array([100, 200]),
+    })
+
+    rows = [{'date': '01/01/2020', 'open': 1.1, 'high': 1.3, 'low': 1.0, 'close': 1.2, 'volume': 100, 'currency': 'EUR'},
+            {'date': '02/01/2020', 'open': 2.2, 'high': 2.4, 'low': 2.0, 'close': 2.3, 'volume': 200, 'currency': 'EUR'}]
+
+    backend = get_json_backend()[0]
+
+    try:
+        # the standard json module is the default one even if orjson is installed
+        assert configure_json() == 'json' and get_json_backend() == ('json', False)
+
+        document = data.to_json('bbva')
+
+        assert document == json.dumps({'name': 'bbva', 'historical': rows})
+
+        if orjson is not None:
+            configure_json(raw=True)
+
+            assert set_json_backend('orjson') == 'orjson' and get_json_backend() == ('orjson', True)
+            assert json.loads(data.to_json('bbva')) == {'name': 'bbva', 'historical': rows}
+
+        for backend_ in ['json', 'orjson']:
+            try:
+                configure_json(backend=backend_, raw=True)
+            except ValueError:
+                continue
+
+            document = data.to_json('bbva', order='descending')
+
+            assert isinstance(document, bytes)
+            assert json.loads(document) == {'name': 'bbva', 'historical': rows[::-1]}
+    finally:
+        configure_json(backend=backend)
+
+    df = pd.DataFrame({'name': ['a', 'b'], 'last': [1.5, np.nan], 'turnover': [10, 20]})
+
+    assert frame_to_records(df) == [{'name': 'a', 'last': 1.5, 'turnover': 10},
+                                    {'name': 'b', 'last': None, 'turnover': 20}]
+
+
+def test_investpy_historical_store():
+    """
+    This function checks that the stored historical data is served locally and just the missing dates are retrieved.
+    """
+
+    import tempfile
+
+    from investpy.utils.store import HistoricalStore, set_store
+
+    def rows(data):
+        start, end = request_dates(data)
+
+        days = [end - timedelta(days=days) for days in range((end - start).days + 1)]
+
+        return [[int(day.replace(tzinfo=timezone.utc).timestamp()), day.day, day.day, day.day, day.day, 100]
+                for day in days if day.weekday() < 5]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = set_store(HistoricalStore(os.path.join(directory, 'historical.sqlite')))
+
+        try:
+            with using_transport(HistoricalTransport(rows)) as transport:
+                first = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2020', to_date='31/01/2020')
+
+                assert [request_dates(data) for data in transport.data] == [(datetime(2020, 1, 1), datetime(2020, 1, 31))]
+                assert len(first) == 23 and len(store.coverage('stock', 446)) == 1
+
+                transport.data = list()
+
+                second = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='06/01/2020', to_date='10/01/2020')
+
+                assert transport.data == [] and second.equals(first.loc['2020-01-06':'2020-01-10'])
+
+                third = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='15/01/2020', to_date='14/02/2020')
+
+                assert [request_dates(data) for data in transport.data] == [(datetime(2020, 2, 1), datetime(2020, 2, 14))]
+                assert len(third) == 23 and third.index.is_unique and third['Currency'].iloc[0] == 'EUR'
+
+                transport.data = list()
+
+                fourth = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/12/2019', to_date='28/02/2020')
+
+                assert [request_dates(data) for data in transport.data] == [(datetime(2019, 12, 1), datetime(2020, 2, 28))]
+                assert len(fourth) == 65 and len(store.coverage('stock', 446)) == 1
+
+                transport.data = list()
+
+                weekly = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='06/01/2020', to_date='10/01/2020', interval='Weekly')
+
+                assert [request_dates(data) for data in transport.data] == [(datetime(2020, 1, 6), datetime(2020, 1, 10))]
+                assert len(weekly) == 5
+        finally:
+            set_store(None)
+
+
+def test_investpy_date_ranges():
+    """
+    This function checks that the covered date ranges are merged and split, and that their gaps are coalesced into as few requests as possible.
+    """
+
+    import tempfile
+
+    import numpy as np
+
+    from investpy.utils.store import DateRanges, HistoricalStore, date_to_days
+    from investpy.utils.historical import coalesce_date_ranges
+
+    ranges = DateRanges([(20, 29), (0, 9)])
+    ranges.add(10, 14)
+    ranges.add(12, 13)
+
+    assert list(ranges) == [(0, 14), (20, 29)]
+    assert ranges.gaps(5, 39) == [(15, 19), (30, 39)] and ranges.gaps(0, 14) == [] and ranges.covers(20, 25)
+
+    ranges.remove(5, 7)
+    ranges.add(15, 19)
+
+    assert ranges == DateRanges([(0, 4), (8, 29)])
+
+    gaps = [(datetime(2000, 1, 1), datetime(2000, 1, 31)), (datetime(2010, 1, 1), datetime(2010, 1, 31)),
+            (datetime(2019, 6, 1), datetime(2019, 6, 30)), (datetime(2020, 1, 1), datetime(2041, 12, 31))]
+
+    assert coalesce_date_ranges(gaps) == [(datetime(2000, 1, 1), datetime(2019, 6, 30)),
+                                          (datetime(2020, 1, 1), datetime(2039, 1, 1)),
+                                          (datetime(2039, 1, 2), datetime(2041, 12, 31))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = HistoricalStore(os.path.join(directory, 'historical.sqlite'))
+
+        table = {'date': np.array([1578009600]), 'open': np.array([1.0]), 'high': np.array([1.0]),
+                 'low': np.array([1.0]), 'close': np.array([1.0]), 'volume': np.array([1])}
+
+        store.update('stock', 446, [table], datetime(2020, 1, 1), datetime(2020, 1, 10))
+        store.update('stock', 446, [], datetime(2020, 1, 20), datetime(2020, 1, 31))
+        store.update('stock', 446, [], datetime(2020, 1, 11), datetime(2020, 1, 15), interval='Weekly')
+
+        assert list(store.coverage('stock', 446)) == [(date_to_days(datetime(2020, 1, 1)), date_to_days(datetime(2020, 1, 10))),
+                                                      (date_to_days(datetime(2020, 1, 20)), date_to_days(datetime(2020, 1, 31)))]
+
+        assert store.missing('stock', 446, datetime(2019, 12, 25), datetime(2020, 2, 5)) == [
+            (datetime(2019, 12, 25), datetime(2019, 12, 31)), (datetime(2020, 1, 11), datetime(2020, 1, 19)),
+            (datetime(2020, 2, 1), datetime(2020, 2, 5))]
+
+        assert len(store.read('stock', 446, datetime(2020, 1, 1), datetime(2020, 1, 31))['date']) == 1
+        assert len(store.read('stock', 446, datetime(2020, 1, 1), datetime(2020, 1, 31), interval='Weekly')['date']) == 0
+
+
+def test_investpy_resample():
+    """
+    This function checks that the weekly and monthly historical data is resampled locally from the daily one.
+    """
+
+    import numpy as np
+
+    from investpy.utils.resample import resample_ohlcv
+
+    # 2020-01-03 (Friday) to 2020-02-03 (Monday), and the same dates of another financial product
+    days = np.concatenate([np.arange(18264, 18296), np.arange(18264, 18296)])
+    groups = np.repeat([1, 0], 32)
+    values = np.arange(64, dtype=np.float64)
+
+    columns = {'date': days, 'open': values, 'high': values + 1, 'low': values - 1, 'close': values + 0.5,
+               'volume': np.ones(64, dtype=np.int64)}
+
+    weekly = resample_ohlcv(columns, 'Weekly', groups=groups)
+
+    assert weekly['group'].tolist() == [0] * 6 + [1] * 6
+    assert weekly['date'][:6].tolist() == [18259, 18266, 18273, 18280, 18287, 18294]
+    assert weekly['open'][:2].tolist() == [32.0, 34.0] and weekly['close'][:2].tolist() == [33.5, 40.5]
+    assert weekly['high'][1] == 41.0 and weekly['low'][1] == 33.0 and weekly['volume'][:2].tolist() == [2, 7]
+
+    monthly = resample_ohlcv(columns, 'Monthly', groups=groups)
+
+    assert monthly['date'].tolist() == [18262, 18293] * 2 and monthly['volume'].tolist() == [29, 3] * 2
+
+    rows = [[day * 86400, day, day + 1, day - 1, day, 1] for day in range(18295, 18263, -1)]
+
+    with using_transport(HistoricalTransport(lambda data: rows)) as transport:
+        df = investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='03/01/2020', to_date='04/02/2020',
+                                                order='descending', interval='Weekly', interval_source='local')
+
+    assert [data['interval_sec'] for data in transport.data] == ['Daily']
+    assert df.index[0] == datetime(2020, 2, 2) and df.index[-1] == datetime(2019, 12, 29)
+    assert df['Volume'].tolist() == [2, 7, 7, 7, 7, 2] and df['Currency'].iloc[0] == 'EUR'
+
+
+def test_investpy_panel():
+    """
+    This function checks that the daily historical data of several financial products is kept in a memory-mapped panel.
+    """
+
+    import tempfile
+
+    import numpy as np
+
+    from investpy.utils.panel import PricePanel, update_panel
+
+    def columns(days, value):
+        return {'date': np.array(days), 'open': np.full(len(days), value), 'high': np.full(len(days), value),
+                'low': np.full(len(days), value), 'close': np.full(len(days), value)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'closes.panel')
+
+        panel = PricePanel(path, ids=[446, 474])
+
+        assert len(panel) == 0 and panel.ids == ['446', '474']
+
+        panel.update({446: columns([18263, 18264], 1.0), '474': columns([18264], 2.0)})
+        panel.update({474: columns([18267], 3.0)})
+
+        assert panel.days.tolist() == [18263, 18264, 18267]
+        assert isinstance(panel.array('close'), np.memmap)
+        assert np.isnan(panel.array('volume')).all()
+
+        panel.update({446: columns([18262], 4.0)})
+
+        closes = panel.frame('close')
+
+        assert closes.index[0] == datetime(2020, 1, 1) and list(closes.columns) == ['446', '474']
+        assert np.shares_memory(closes.to_numpy(copy=False), panel.array('close'))
+        assert closes.fillna(0).to_numpy().tolist() == [[4.0, 0.0], [1.0, 0.0], [1.0, 2.0], [0.0, 3.0]]
+
+        assert PricePanel(path).frame('close', ids=[474]).equals(closes[['474']])
+
+        rows = [[day * 86400, 5, 5, 5, 5, 10] for day in [18268, 18267]]
+
+        with using_transport(HistoricalTransport(lambda data: rows)):
+            errors = update_panel(panel, [('stock', 'bbva', 'spain'), ('stock', 'tef', 'spain')],
+                                  from_date='06/01/2020', to_date='07/01/2020')
+
+        assert list(errors.keys()) == [('stock', 'tef', 'spain')]
+        assert panel.days.tolist()[-1] == 18268 and panel.frame('volume')['446'].iloc[-2:].tolist() == [10.0, 10.0]
+
+
+def test_investpy_indicators():
+    """
+    This function checks that the technical indicators calculated locally match a reference calculation made with pandas.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    from investpy.utils.indicators import TECHNICAL_INDICATORS, technical_indicators_matrix
+
+    random = np.random.RandomState(7)
+
+    frames = dict()
+
+    for key, length in [('long', 300), ('short', 120), ('tiny', 10)]:
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.01, length)))
+        frames[key] = pd.DataFrame({
+            'Open': close,
+            'High': close * (1 + random.uniform(0, 0.01, length)),
+            'Low': close * (1 - random.uniform(0, 0.01, length)),
+            'Close': close,
+            'Volume': 1000,
+            'Currency': 'EUR'
+        }, index=pd.date_range('2019-01-01', periods=length, name='Date'))
+
+    tables = investpy.compute_technical_indicators(frames)
+
+    assert list(tables.keys()) == ['long', 'short', 'tiny']
+
+    for key in ['long', 'short']:
+        frame, table = frames[key], tables[key].set_index('technical_indicator')
+
+        assert table.index.tolist() == TECHNICAL_INDICATORS
+
+        high, low, close = frame['High'], frame['Low'], frame['Close']
+
+        def wilder(series, window):
+            series = series.dropna()
+            values = [series.iloc[:window].mean()]
+            for value in series.iloc[window:]:
+                values.append(values[-1] + (value - values[-1]) / window)
+            return values[-1]
+
+        def ema(series, window):
+            values = [series.iloc[:window].mean()]
+            for value in series.iloc[window:]:
+                values.append(values[-1] + (value - values[-1]) * 2 / (window + 1))
+            return values[-1]
+
+        changes = close.diff()
+        rsi = 100 - 100 / (1 + wilder(changes.clip(lower=0), 14) / wilder(-changes.clip(upper=0), 14))
+
+        typical = (high + low + close) / 3
+        deviation = typical.rolling(14).apply(lambda window: np.abs(window - window.mean()).mean(), raw=True)
+        cci = ((typical - typical.rolling(14).mean()) / (0.015 * deviation)).iloc[-1]
+
+        true_range = pd.concat([high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1)
+        true_range = true_range.max(axis=1).iloc[1:]
+
+        fast_k = 100 * (close - low.rolling(9).min()) / (high.rolling(9).max() - low.rolling(9).min())
+
+        expected = {
+            'RSI(14)': rsi,
+            'STOCH(9,6)': fast_k.rolling(6).mean().iloc[-1],
+            'MACD(12,26)': ema(close, 12) - ema(close, 26),
+            'Williams %R': -100 * (high.iloc[-14:].max() - close.iloc[-1]) /
+                           (high.iloc[-14:].max() - low.iloc[-14:].min()),
+            'CCI(14)': cci,
+            'ATR(14)': wilder(true_range, 14),
+            'ROC': 100 * (close.iloc[-1] / close.iloc[-13] - 1),
+            'Bull/Bear Power(13)': high.iloc[-1] + low.iloc[-1] - 2 * ema(close, 13),
+        }
+
+        for indicator, value in expected.items():
+            assert abs(table.loc[indicator, 'value'] - value) < 1e-8 * max(1, abs(value))
+
+        for indicator in ['RSI(14)', 'STOCH(9,6)', 'Williams %R', 'CCI(14)', 'ROC']:
+            assert table.loc[indicator, 'signal'] in ['buy', 'sell', 'neutral', 'overbought', 'oversold']
+
+        assert table.loc['ATR(14)', 'signal'] in ['high_volatility', 'less_volatility']
+
+        # calculating the indicators of every financial product on its own leads to the same values
+        single = investpy.compute_technical_indicators(frame.iloc[::-1])
+
+        assert np.allclose(single['value'].to_numpy(), table['value'].to_numpy())
+
+    assert tables['tiny']['value'].isna().all()
+
+    values, signals = technical_indicators_matrix(np.ones((2, 50)), np.ones((2, 50)), np.ones((2, 50)))
+
+    assert values.shape == signals.shape == (2, len(TECHNICAL_INDICATORS))
+
+
+def test_investpy_moving_averages():
+    """
+    This function checks that the moving averages calculated locally match a reference calculation made with pandas.
+    """
+
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+
+    from investpy.utils.panel import PricePanel
+
+    random = np.random.RandomState(11)
+
+    frames = dict()
+
+    for key, length in [('446', 250), ('474', 60)]:
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.01, length)))
+        frames[key] = pd.DataFrame({
+            'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1000, 'Currency': 'EUR'
+        }, index=pd.date_range('2019-01-01', periods=length, name='Date'))
+
+    tables = investpy.compute_moving_averages(frames)
+
+    for key, frame in frames.items():
+        table, close = tables[key], frame['Close']
+
+        assert table['period'].tolist() == ['5', '10', '20', '50', '100', '200']
+
+        for row, period in enumerate([5, 10, 20, 50, 100, 200]):
+            if period > len(close):
+                assert np.isnan(table['sma_value'][row]) and np.isnan(table['ema_value'][row])
+                continue
+
+            ema = close.iloc[:period].mean()
+            for value in close.iloc[period:]:
+                ema = ema + (value - ema) * 2 / (period + 1)
+
+            assert abs(table['sma_value'][row] - close.iloc[-period:].mean()) < 1e-8
+            assert abs(table['ema_value'][row] - ema) < 1e-8
+            assert table['sma_signal'][row] == ('buy' if close.iloc[-1] > close.iloc[-period:].mean() else 'sell')
+
+    matrix = investpy.compute_moving_averages(frames, as_matrix=True)
+
+    assert matrix.index.tolist() == ['446', '474']
+    assert matrix['sma_value'].loc['446'].tolist() == tables['446']['sma_value'].tolist()
+    assert matrix['ema_signal'].loc['446'].tolist() == tables['446']['ema_signal'].tolist()
+
+    with tempfile.TemporaryDirectory() as directory:
+        panel = PricePanel(os.path.join(directory, 'closes.panel'), ids=list(frames.keys()))
+
+        panel.update({key: {'date': frame.index.to_numpy().astype('datetime64[D]').astype(np.int64),
+                            'open': frame['Open'].to_numpy(), 'high': frame['High'].to_numpy(),
+                            'low': frame['Low'].to_numpy(), 'close': frame['Close'].to_numpy()}
+                      for key, frame in frames.items()})
+
+        from_panel = investpy.compute_moving_averages(panel, as_matrix=True)
+
+        assert np.allclose(from_panel['sma_value'].to_numpy(), matrix['sma_value'].to_numpy(), equal_nan=True)
+        assert np.allclose(from_panel['ema_value'].to_numpy(), matrix['ema_value'].to_numpy(), equal_nan=True)
+
+        del from_panel, panel
+
+
+def test_investpy_pivot_points():
+    """
+    This function checks that the pivot points calculated locally match the ones of the previous period.
+    """
+
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+
+    from investpy.utils.panel import PricePanel
+
+    random = np.random.RandomState(13)
+
+    frames = dict()
+
+    for key, length in [('446', 90), ('474', 40)]:
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.01, length)))
+        frames[key] = pd.DataFrame({
+            'Open': close * (1 + random.normal(0, 0.002, length)),
+            'High': close * (1 + random.uniform(0, 0.01, length)),
+            'Low': close * (1 - random.uniform(0, 0.01, length)),
+            'Close': close,
+            'Volume': 1000,
+            'Currency': 'EUR'
+        }, index=pd.date_range('2020-01-01', periods=length, name='Date'))
+
+    # previous bar of the pivot points retrieved from Investing.com in the example of investpy.pivot_points
+    bar = pd.DataFrame({'Open': [4.6], 'High': [4.692], 'Low': [4.609], 'Close': [4.667]},
+                       index=pd.DatetimeIndex([datetime(2020, 1, 2)], name='Date'))
+
+    table = investpy.compute_pivot_points(bar).set_index('name')
+
+    assert table.index.tolist() == ['Classic', 'Fibonacci', 'Camarilla', "Woodie's", "DeMark's"]
+
+    expected = {
+        'Classic': [4.537, 4.573, 4.620, 4.656, 4.703, 4.739, 4.786],
+        'Fibonacci': [4.573, 4.605, 4.624, 4.656, 4.688, 4.707, 4.739],
+        'Camarilla': [4.645, 4.653, 4.660, 4.656, 4.676, 4.683, 4.691],
+        "Woodie's": [4.543, 4.576, 4.626, 4.659, 4.709, 4.742, 4.792],
+        "DeMark's": [np.nan, np.nan, 4.639, 4.665, 4.721, np.nan, np.nan],
+    }
+
+    for name, levels in expected.items():
+        assert np.allclose(table.loc[name].to_numpy(dtype=float), levels, atol=2e-3, equal_nan=True)
+
+    tables = investpy.compute_pivot_points(frames, interval='monthly')
+
+    for key, frame in frames.items():
+        month = frame[frame.index.to_period('M') == frame.index[-1].to_period('M')]
+        high, low, close = month['High'].max(), month['Low'].min(), month['Close'].iloc[-1]
+
+        classic = tables[key].set_index('name').loc['Classic']
+
+        assert abs(classic['pivot_points'] - (high + low + close) / 3) < 1e-10
+        assert abs(classic['r1'] - (2 * (high + low + close) / 3 - low)) < 1e-10
+
+    daily = investpy.compute_pivot_points(frames['474'].iloc[::-1])
+    expected = investpy.compute_pivot_points(frames['474'].iloc[-1:])
+
+    assert daily.equals(expected)
+
+    with tempfile.TemporaryDirectory() as directory:
+        panel = PricePanel(os.path.join(directory, 'prices.panel'), ids=list(frames.keys()))
+
+        panel.update({key: {'date': frame.index.to_numpy().astype('datetime64[D]').astype(np.int64),
+                            'open': frame['Open'].to_numpy(), 'high': frame['High'].to_numpy(),
+                            'low': frame['Low'].to_numpy(), 'close': frame['Close'].to_numpy()}
+                      for key, frame in frames.items()})
+
+        from_panel = investpy.compute_pivot_points(panel, interval='monthly')
+
+        for key in frames.keys():
+            assert from_panel[key].equals(tables[key])
+
+        del panel
+
+
+def test_investpy_streaming():
+    """
+    This function checks that the incremental indicators match the ones calculated over the whole history.
+    """
+
+    import numpy as np
+
+    from investpy.utils.indicators import TECHNICAL_INDICATORS, technical_indicators_matrix
+    from investpy.utils.streaming import IndicatorState, RSIState, MACDState, ATRState, ADXState, StochasticState, \
+        RollingState, EMAState, load_state
+
+    random = np.random.RandomState(17)
+
+    close = 100 * np.exp(np.cumsum(random.normal(0, 0.01, (4, 120)), axis=1))
+    high = close * (1 + random.uniform(0, 0.01, close.shape))
+    low = close * (1 - random.uniform(0, 0.01, close.shape))
+
+    # the second financial product has a shorter history
+    for values in (high, low, close):
+        values[1, :40] = np.nan
+
+    expected, _ = technical_indicators_matrix(high, low, close)
+
+    states = {
+        'RSI(14)': (RSIState(4), [close]),
+        'MACD(12,26)': (MACDState(4), [close]),
+        'ATR(14)': (ATRState(4), [high, low, close]),
+        'ADX(14)': (ADXState(4), [high, low, close]),
+        'STOCH(9,6)': (StochasticState(4), [high, low, close]),
+    }
+
+    for indicator, (state, arrays) in states.items():
+        state.run(*[array[:, :100] for array in arrays])
+
+        restored = load_state(json.loads(json.dumps(state.to_dict())))
+
+        assert repr(restored) == repr(state)
+
+        values = restored.run(*[array[:, 100:] for array in arrays])
+
+        assert np.allclose(values, expected[:, TECHNICAL_INDICATORS.index(indicator)])
+
+    highs = RollingState(4, 14, reducer='max')
+
+    assert np.array_equal(highs.run(high), np.max(high[:, -14:], axis=1))
+
+    ema = EMAState(2, 3)
+
+    assert np.isnan(ema.update([1., 1.])).all()
+
+    ema.update([2., 2.])
+
+    values = ema.update([3., np.nan])
+
+    assert values[0] == 2. and np.isnan(values[1])
+    assert ema.update([np.nan, 4.]).tolist() == [2., 7. / 3.]
+    assert ema.count.tolist() == [3, 3]
+
+    class IncompleteState(IndicatorState):
+        pass
+
+    try:
+        IncompleteState()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("an indicator state without update should not be instantiable")
+
+
+def test_investpy_aligned_panel():
+    """
+    This function checks that the historical data of several financial products is aligned on a common calendar.
+    """
+
+    import numpy as np
+
+    from investpy.utils.panel import AlignedPanel, align_columns
+
+    bars = {446: [(18267, 1.0), (18268, 2.0)], 474: [(18268, 3.0), (18269, 4.0)]}
+
+    def rows(data):
+        return [[day * 86400, close, close, close, close, 10] for day, close in bars[int(data['curr_id'])][::-1]]
+
+    instruments = [('stock', 'bbva', 'spain'), ('stock', 'error', 'spain'), ('stock', 'san', 'spain')]
+
+    with using_transport(HistoricalTransport(rows)):
+        union, errors = investpy.build_aligned_panel(instruments, from_date='06/01/2020', to_date='09/01/2020')
+        intersection, _ = investpy.build_aligned_panel(instruments, from_date='06/01/2020', to_date='09/01/2020',
+                                                       calendar='intersection', dtype='float32')
+        filled, _ = investpy.build_aligned_panel(instruments, from_date='06/01/2020', to_date='09/01/2020',
+                                                 fill='close')
+
+    assert list(errors.keys()) == [('stock', 'error', 'spain')]
+
+    assert isinstance(union, AlignedPanel) and len(union) == 3
+    assert union.instruments == [('stock', 'bbva', 'spain'), ('stock', 'san', 'spain')]
+    assert union.values.shape == (5, 3, 2) and union.values.dtype == np.float64
+    assert union.currencies == {('stock', 'bbva', 'spain'): 'EUR', ('stock', 'san', 'spain'): 'EUR'}
+    assert union.metadata['id'].tolist() == [446, 474]
+    assert union.dates[0] == datetime(2020, 1, 6)
+    assert np.allclose(union.array('close'), [[1.0, np.nan], [2.0, 3.0], [np.nan, 4.0]], equal_nan=True)
+
+    closes = union.frame('close')
+
+    assert list(closes.columns) == union.instruments
+    assert np.shares_memory(closes.to_numpy(copy=False), union.values)
+
+    assert intersection.days.tolist() == [18268] and intersection.values.dtype == np.float32
+    assert intersection.array('close').tolist() == [[2.0, 3.0]]
+
+    assert np.allclose(filled.array('close'), [[1.0, np.nan], [2.0, 3.0], [2.0, 4.0]], equal_nan=True)
+    assert filled.array('volume')[2, 0] == 0
+
+    days, values = align_columns([{'date': np.array([1, 3]), 'open': np.array([1., 3.]), 'high': np.array([2., 4.]),
+                                   'low': np.array([1., 3.]), 'close': np.array([2., 4.])},
+                                  {'date': np.array([2]), 'open': np.array([5.]), 'high': np.array([5.]),
+                                   'low': np.array([5.]), 'close': np.array([5.])}], fill='ffill')
+
+    assert days.tolist() == [1, 2, 3]
+    assert values[1, :, 0].tolist() == [2., 2., 4.]
+    assert np.isnan(values[3, 0, 1]) and values[3, 2, 1] == 5.
+
+
 if __name__ == '__main__':
     test_investpy()
     test_investpy_stocks()
@@ -1370,3 +2679,29 @@ if __name__ == '__main__':
     test_investpy_search()
     test_investpy_news()
     test_investpy_technical()
+    test_investpy_catalog()
+    test_investpy_resolve()
+    test_investpy_catalog_binary()
+    test_investpy_import()
+    test_investpy_transport()
+    test_investpy_historical_intervals()
+    test_investpy_bulk()
+    test_investpy_bulk_concurrency()
+    test_investpy_rate_limit()
+    test_investpy_record_replay()
+    test_investpy_cache()
+    test_investpy_parser()
+    test_investpy_historical_data()
+    test_investpy_dates()
+    test_investpy_historical_engine()
+    test_investpy_historical_iterator()
+    test_investpy_serializer()
+    test_investpy_historical_store()
+    test_investpy_date_ranges()
+    test_investpy_resample()
+    test_investpy_panel()
+    test_investpy_indicators()
+    test_investpy_moving_averages()
+    test_investpy_pivot_points()
+    test_investpy_streaming()
+    test_investpy_aligned_panel()
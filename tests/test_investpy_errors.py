@@ -4177,6 +4177,773 @@ def test_technical_errors():
             pass
 
 
+def test_resolve_errors():
+    """
+    This function raises errors on the financial product resolution function.
+    """
+
+    params = [
+        {
+            'product_type': None,
+            'name': 'bbva',
+            'country': 'spain',
+        },
+        {
+            'product_type': 'error',
+            'name': 'bbva',
+            'country': 'spain',
+        },
+        {
+            'product_type': 'stock',
+            'name': ['error'],
+            'country': 'spain',
+        },
+        {
+            'product_type': 'stock',
+            'name': 'bbva',
+            'country': ['error'],
+        },
+        {
+            'product_type': 'stock',
+            'name': 'error',
+            'country': 'spain',
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.resolve(product_type=param['product_type'],
+                             name=param['name'],
+                             country=param['country'])
+        except:
+            pass
+
+
+def test_transport_errors():
+    """
+    This function raises errors on the transport configuration function.
+    """
+
+    from investpy.utils.transport import configure_transport
+
+    params = [
+        {
+            'session': 'error',
+            'pool_size': 10,
+            'timeout': 30,
+        },
+        {
+            'session': None,
+            'pool_size': 0,
+            'timeout': 30,
+        },
+        {
+            'session': None,
+            'pool_size': True,
+            'timeout': 30,
+        },
+        {
+            'session': None,
+            'pool_size': 10,
+            'timeout': 'error',
+        },
+    ]
+
+    for param in params:
+        try:
+            configure_transport(session=param['session'],
+                                pool_size=param['pool_size'],
+                                timeout=param['timeout'])
+        except:
+            pass
+
+    params = [
+        {
+            'rate_limit': 0,
+            'burst': None,
+            'max_retries': 3,
+            'backoff_factor': 0.5,
+        },
+        {
+            'rate_limit': 5,
+            'burst': 'error',
+            'max_retries': 3,
+            'backoff_factor': 0.5,
+        },
+        {
+            'rate_limit': 5,
+            'burst': 10,
+            'max_retries': -1,
+            'backoff_factor': 0.5,
+        },
+        {
+            'rate_limit': 5,
+            'burst': 10,
+            'max_retries': 3,
+            'backoff_factor': 'error',
+        },
+    ]
+
+    for param in params:
+        try:
+            configure_transport(rate_limit=param['rate_limit'],
+                                burst=param['burst'],
+                                max_retries=param['max_retries'],
+                                backoff_factor=param['backoff_factor'])
+        except:
+            pass
+
+    configure_transport()
+
+
+def test_bulk_errors():
+    """
+    This function raises errors on the bulk historical data retrieval function.
+    """
+
+    params = [
+        {
+            'instruments': None,
+            'from_date': '01/01/2018',
+            'to_date': '01/01/2019',
+            'as_long': False,
+            'max_workers': 8,
+        },
+        {
+            'instruments': [],
+            'from_date': '01/01/2018',
+            'to_date': '01/01/2019',
+            'as_long': False,
+            'max_workers': 8,
+        },
+        {
+            'instruments': ['error'],
+            'from_date': '01/01/2018',
+            'to_date': '01/01/2019',
+            'as_long': False,
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2018',
+            'to_date': '01/01/2019',
+            'as_long': 'error',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2018',
+            'to_date': '01/01/2019',
+            'as_long': False,
+            'max_workers': 0,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': 'error',
+            'to_date': '01/01/2019',
+            'as_long': False,
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2018',
+            'to_date': 'error',
+            'as_long': False,
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2018',
+            'as_long': False,
+            'max_workers': 8,
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.get_historical_data_bulk(instruments=param['instruments'],
+                                              from_date=param['from_date'],
+                                              to_date=param['to_date'],
+                                              as_long=param['as_long'],
+                                              max_workers=param['max_workers'])
+        except:
+            pass
+
+
+def test_cache_errors():
+    """
+    This function raises errors on the response cache.
+    """
+
+    from investpy.utils.cache import ResponseCache
+
+    params = [
+        {
+            'path': None,
+            'ttls': None,
+        },
+        {
+            'path': 'cache.sqlite',
+            'ttls': 'error',
+        },
+        {
+            'path': 'cache.sqlite',
+            'ttls': {'error': 60},
+        },
+        {
+            'path': 'cache.sqlite',
+            'ttls': {'technical': -1},
+        },
+    ]
+
+    for param in params:
+        try:
+            ResponseCache(path=param['path'],
+                          ttls=param['ttls'])
+        except:
+            pass
+
+
+def test_dates_errors():
+    """
+    This function raises errors on the conversion of epoch values into dates.
+    """
+
+    from investpy.utils.data import epoch_to_dates
+
+    params = [
+        {
+            'unit': 'ms',
+            'tz': None,
+        },
+        {
+            'unit': 's',
+            'tz': 'error',
+        },
+    ]
+
+    for param in params:
+        try:
+            epoch_to_dates([1577836800],
+                           unit=param['unit'],
+                           tz=param['tz'])
+        except:
+            pass
+
+
+def test_iter_errors():
+    """
+    This function raises errors on the historical data iterators.
+    """
+
+    params = [
+        {
+            'batch_size': 0,
+        },
+        {
+            'batch_size': 'error',
+        },
+        {
+            'batch_size': True,
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.iter_stock_historical_data(stock='bbva',
+                                                country='spain',
+                                                from_date='01/01/2018',
+                                                to_date='01/01/2019',
+                                                batch_size=param['batch_size'])
+        except:
+            pass
+
+
+def test_serializer_errors():
+    """
+    This function raises errors on the json serializer configuration.
+    """
+
+    from investpy.utils.serializer import configure_json, get_json_backend
+
+    backend = get_json_backend()[0]
+
+    params = [
+        {
+            'backend': 'simplejson',
+            'raw': False,
+        },
+        {
+            'backend': None,
+            'raw': 'yes',
+        },
+    ]
+
+    for param in params:
+        try:
+            configure_json(backend=param['backend'], raw=param['raw'])
+        except:
+            pass
+
+    configure_json(backend=backend)
+
+
+def test_store_errors():
+    """
+    This function raises errors on the historical data store.
+    """
+
+    from investpy.utils.store import HistoricalStore
+
+    params = [
+        {
+            'path': None,
+        },
+        {
+            'path': 0,
+        },
+    ]
+
+    for param in params:
+        try:
+            HistoricalStore(path=param['path'])
+        except:
+            pass
+
+
+def test_interval_source_errors():
+    """
+    This function raises errors on the local resampling of the historical data.
+    """
+
+    from investpy.utils.resample import resample_ohlcv
+
+    params = [
+        {
+            'interval': 'Weekly',
+            'interval_source': 'error',
+        },
+        {
+            'interval': 'Yearly',
+            'interval_source': 'local',
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.get_stock_historical_data(stock='bbva', country='spain', from_date='01/01/2019',
+                                               to_date='01/01/2020', interval=param['interval'],
+                                               interval_source=param['interval_source'])
+        except:
+            pass
+
+        try:
+            resample_ohlcv({'date': [18262]}, param['interval'])
+        except:
+            pass
+
+
+def test_panel_errors():
+    """
+    This function raises errors on the memory-mapped price panel.
+    """
+
+    import os
+    import tempfile
+
+    from investpy.utils.panel import PricePanel, update_panel
+
+    with tempfile.TemporaryDirectory() as directory:
+        params = [
+            {
+                'path': None,
+                'ids': [446],
+            },
+            {
+                'path': os.path.join(directory, 'error.panel'),
+                'ids': None,
+            },
+            {
+                'path': os.path.join(directory, 'error.panel'),
+                'ids': [446, 446],
+            },
+            {
+                'path': __file__,
+                'ids': None,
+            },
+        ]
+
+        for param in params:
+            try:
+                PricePanel(path=param['path'], ids=param['ids'])
+            except:
+                pass
+
+        panel = PricePanel(os.path.join(directory, 'closes.panel'), ids=[446])
+
+        for method, args in [(panel.array, ('error',)), (panel.frame, ('close', [474])), (panel.update, ({474: {}},))]:
+            try:
+                method(*args)
+            except:
+                pass
+
+        params = [
+            {
+                'instruments': None,
+                'from_date': '01/01/2019',
+                'to_date': '01/01/2020',
+                'max_workers': 8,
+            },
+            {
+                'instruments': [['stock', 'bbva', 'spain']],
+                'from_date': '01/01/2019',
+                'to_date': '01/01/2020',
+                'max_workers': 8,
+            },
+            {
+                'instruments': [('stock', 'bbva', 'spain')],
+                'from_date': '01/01/2019',
+                'to_date': '01/01/2020',
+                'max_workers': 0,
+            },
+            {
+                'instruments': [('stock', 'bbva', 'spain')],
+                'from_date': 'error',
+                'to_date': '01/01/2020',
+                'max_workers': 8,
+            },
+            {
+                'instruments': [('stock', 'bbva', 'spain')],
+                'from_date': '01/01/2019',
+                'to_date': 'error',
+                'max_workers': 8,
+            },
+            {
+                'instruments': [('stock', 'bbva', 'spain')],
+                'from_date': '01/01/2020',
+                'to_date': '01/01/2019',
+                'max_workers': 8,
+            },
+        ]
+
+        for param in params:
+            try:
+                update_panel(panel,
+                             instruments=param['instruments'],
+                             from_date=param['from_date'],
+                             to_date=param['to_date'],
+                             max_workers=param['max_workers'])
+            except:
+                pass
+
+
+def test_indicators_errors():
+    """
+    This function raises errors on technical indicators calculation functions.
+    """
+
+    import numpy as np
+
+    from investpy.utils.indicators import technical_indicators_matrix
+
+    params = [
+        {
+            'data': None,
+        },
+        {
+            'data': {'bbva': [1, 2, 3]},
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.compute_technical_indicators(data=param['data'])
+        except:
+            pass
+
+    params = [
+        {
+            'high': np.ones(10),
+            'low': np.ones(10),
+            'close': np.ones(10),
+        },
+        {
+            'high': np.ones((2, 10)),
+            'low': np.ones((2, 9)),
+            'close': np.ones((2, 10)),
+        },
+    ]
+
+    for param in params:
+        try:
+            technical_indicators_matrix(high=param['high'], low=param['low'], close=param['close'])
+        except:
+            pass
+
+
+def test_moving_averages_errors():
+    """
+    This function raises errors on moving averages calculation functions.
+    """
+
+    import numpy as np
+
+    from investpy.utils.indicators import moving_averages_matrix
+
+    params = [
+        {
+            'data': None,
+            'as_matrix': False,
+        },
+        {
+            'data': {'bbva': None},
+            'as_matrix': False,
+        },
+        {
+            'data': None,
+            'as_matrix': 'error',
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.compute_moving_averages(data=param['data'], as_matrix=param['as_matrix'])
+        except:
+            pass
+
+    params = [
+        {
+            'close': np.ones(10),
+            'periods': None,
+        },
+        {
+            'close': np.ones((2, 10)),
+            'periods': [],
+        },
+        {
+            'close': np.ones((2, 10)),
+            'periods': [5, 0],
+        },
+    ]
+
+    for param in params:
+        try:
+            moving_averages_matrix(close=param['close'], periods=param['periods'])
+        except:
+            pass
+
+
+def test_pivot_points_errors():
+    """
+    This function raises errors on pivot points calculation functions.
+    """
+
+    import numpy as np
+
+    from investpy.utils.indicators import pivot_points_matrix
+
+    params = [
+        {
+            'data': None,
+            'interval': 'daily',
+        },
+        {
+            'data': {'bbva': None},
+            'interval': 'weekly',
+        },
+        {
+            'data': None,
+            'interval': '5mins',
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.compute_pivot_points(data=param['data'], interval=param['interval'])
+        except:
+            pass
+
+    try:
+        pivot_points_matrix(np.ones((2, 2)), np.ones((2, 2)), np.ones((2, 2)), np.ones((2, 2)))
+    except:
+        pass
+
+    try:
+        pivot_points_matrix(np.ones(2), np.ones(2), np.ones(3), np.ones(2))
+    except:
+        pass
+
+
+def test_streaming_errors():
+    """
+    This function raises errors on incremental indicators functions.
+    """
+
+    from investpy.utils.streaming import EMAState, RollingState, RSIState, load_state
+
+    params = [
+        {
+            'size': -1,
+            'window': 14,
+        },
+        {
+            'size': 2,
+            'window': 0,
+        },
+        {
+            'size': 'error',
+            'window': 14,
+        },
+    ]
+
+    for param in params:
+        try:
+            EMAState(size=param['size'], window=param['window'])
+        except:
+            pass
+
+    try:
+        RollingState(size=2, window=14, reducer='error')
+    except:
+        pass
+
+    try:
+        RSIState(size=2).update([1., 2., 3.])
+    except:
+        pass
+
+    params = [
+        {
+            'state': None,
+        },
+        {
+            'state': {'indicator': 'error'},
+        },
+        {
+            'state': {'indicator': 'RSIState', 'params': {'size': 2}, 'arrays': {}, 'states': {}},
+        },
+    ]
+
+    for param in params:
+        try:
+            load_state(state=param['state'])
+        except:
+            pass
+
+
+def test_aligned_panel_errors():
+    """
+    This function raises errors on aligned panel functions.
+    """
+
+    from investpy.utils.panel import align_columns
+
+    params = [
+        {
+            'instruments': [],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': ['bbva'],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'error',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': 'error',
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'int64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 0,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '2019/01/01',
+            'to_date': '01/01/2020',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2019',
+            'to_date': '2020/01/01',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+        {
+            'instruments': [('stock', 'bbva', 'spain')],
+            'from_date': '01/01/2020',
+            'to_date': '01/01/2019',
+            'calendar': 'union',
+            'fill': None,
+            'dtype': 'float64',
+            'max_workers': 8,
+        },
+    ]
+
+    for param in params:
+        try:
+            investpy.build_aligned_panel(instruments=param['instruments'],
+                                         from_date=param['from_date'],
+                                         to_date=param['to_date'],
+                                         calendar=param['calendar'],
+                                         fill=param['fill'],
+                                         dtype=param['dtype'],
+                                         max_workers=param['max_workers'])
+        except:
+            pass
+
+    for param in [{'calendar': 'error', 'fill': None, 'dtype': 'float64'},
+                  {'calendar': 'union', 'fill': 'error', 'dtype': 'float64'},
+                  {'calendar': 'union', 'fill': None, 'dtype': 'int64'}]:
+        try:
+            align_columns([], calendar=param['calendar'], fill=param['fill'], dtype=param['dtype'])
+        except:
+            pass
+
+
 if __name__ == '__main__':
     test_stocks_errors()
     test_funds_errors()
@@ -4190,3 +4957,18 @@ if __name__ == '__main__':
     test_search_errors()
     test_technical_errors()
     test_news_errors()
+    test_resolve_errors()
+    test_transport_errors()
+    test_bulk_errors()
+    test_cache_errors()
+    test_dates_errors()
+    test_iter_errors()
+    test_serializer_errors()
+    test_store_errors()
+    test_interval_source_errors()
+    test_panel_errors()
+    test_indicators_errors()
+    test_moving_averages_errors()
+    test_pivot_points_errors()
+    test_streaming_errors()
+    test_aligned_panel_errors()